@@ -0,0 +1,82 @@
+"""
+회로 차단기 시험 호출 검사
+
+- half_open 상태의 시험 호출이 취소되었을 때(투표 제한 시간, 선행 생성 폐기, SSE 연결 끊김 등)
+  회로가 half_open + 시험 호출 진행 중 상태로 굳어 이후 호출이 모두 거부되지 않는지
+- 시험 호출이 재시도할 수 없는 오류(400 등)로 끝났을 때 회로가 제공자 회복 근거 없이 closed로 바뀌지 않고
+  시험 자리만 반납되는지
+문제가 있으면 종료 코드 1을 반환합니다.
+
+실행 예시:
+    python -m benchmarks.circuit_check
+"""
+import asyncio
+import sys
+import time
+from typing import List
+
+import openai
+
+from llm_backend import CircuitBreaker, LLMUnavailableError, MockChatClient, ResilientChatClient
+
+MESSAGES = [{"role": "user", "content": "ping"}]
+
+
+def half_open_client(mock: MockChatClient) -> ResilientChatClient:
+    """reset_timeout이 지난 open 상태의 회로를 쓰는 클라이언트 (다음 호출이 시험 호출)"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    breaker.state = "open"
+    breaker.opened_at = time.monotonic() - 1.0
+    return ResilientChatClient(mock, max_retries=0, breaker=breaker)
+
+
+async def check_cancelled_trial() -> List[str]:
+    client = half_open_client(MockChatClient(latency=0.2, latency_jitter=0.0))
+    breaker = client.breaker
+
+    trial = asyncio.create_task(client.chat.completions.create(model="mock", messages=MESSAGES))
+    await asyncio.sleep(0.05)
+    trial.cancel()
+    await asyncio.gather(trial, return_exceptions=True)
+
+    errors = []
+    if breaker._trial_in_flight:
+        errors.append(f"cancelled trial still holds the trial slot (state={breaker.state})")
+    try:
+        await client.chat.completions.create(model="mock", messages=MESSAGES)
+    except LLMUnavailableError as e:
+        errors.append(f"call after cancelled trial rejected: {e}")
+    if breaker.state != "closed":
+        errors.append(f"breaker did not close after a successful trial (state={breaker.state})")
+    return errors
+
+
+async def check_non_retryable_trial() -> List[str]:
+    client = half_open_client(MockChatClient(latency=0.0, latency_jitter=0.0, error_rate=1.0, error_status=400))
+    breaker = client.breaker
+
+    errors = []
+    try:
+        await client.chat.completions.create(model="mock", messages=MESSAGES)
+        errors.append("mock did not raise the 400 error")
+    except openai.APIStatusError:
+        pass
+    if breaker.state == "closed":
+        errors.append("non-retryable error on the trial closed the circuit")
+    if breaker._trial_in_flight:
+        errors.append(f"non-retryable trial still holds the trial slot (state={breaker.state})")
+    return errors
+
+
+async def main() -> int:
+    errors = [*await check_cancelled_trial(), *await check_non_retryable_trial()]
+    if errors:
+        for error in errors:
+            print(f"FAIL: {error}")
+        return 1
+    print("OK: cancelled and non-retryable half-open trials released the slot without closing the circuit")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,185 @@
+"""
+전체 게임 흐름 부하 벤치마크
+
+여러 세션이 동시에 /start → /talk ×N → /vote → /liar-guess 전체 게임을 진행하고,
+엔드포인트별 처리량과 p50/p95/p99 지연 시간을 보고합니다.
+
+기본값은 목 LLM 백엔드(LLM_BACKEND=mock)로 앱을 같은 프로세스에서 직접 구동하므로
+API 키나 별도 서버가 필요 없습니다. --url을 주면 실행 중인 서버를 대상으로 측정합니다.
+
+실행 예시:
+    python -m benchmarks.game_bench --games 200 --concurrency 50 --rounds 2
+    python -m benchmarks.game_bench --save baseline.json
+    python -m benchmarks.game_bench --compare baseline.json --tolerance 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List
+
+import httpx
+
+ENDPOINTS = ["/start", "/talk", "/vote", "/liar-guess"]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """백분위수 계산 (values는 정렬된 상태)"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+class Recorder:
+    """엔드포인트별 지연 시간 및 오류 기록"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def call(self, client: httpx.AsyncClient, endpoint: str, body: dict) -> dict:
+        start = time.perf_counter()
+        response = await client.post(endpoint, json=body)
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        if response.status_code != 200:
+            self.errors[endpoint] += 1
+            raise RuntimeError(f"{endpoint} -> {response.status_code}")
+        return response.json()
+
+
+async def play_game(client: httpx.AsyncClient, recorder: Recorder, rounds: int):
+    """한 게임 전체 진행"""
+    session_id = f"bench_{uuid.uuid4().hex[:12]}"
+
+    started = await recorder.call(client, "/start", {"session_id": session_id})
+    turn_order = started["turn_order"]
+
+    cursor = 0
+    for turn in range(rounds * len(turn_order)):
+        speaker = turn_order[turn % len(turn_order)]
+        message = "힌트를 하나 드릴게요" if speaker == "user" else ""
+        talked = await recorder.call(
+            client, "/talk", {"session_id": session_id, "user_message": message, "cursor": cursor}
+        )
+        cursor = talked["cursor"]
+
+    voted = await recorder.call(
+        client, "/vote", {"session_id": session_id, "user_vote": random.choice(["ai_1", "ai_2", "ai_3"])}
+    )
+    if voted["liar_caught"]:
+        await recorder.call(client, "/liar-guess", {"session_id": session_id, "guess": ""})
+
+
+def _build_client(args) -> httpx.AsyncClient:
+    """대상 서버에 맞는 HTTP 클라이언트 생성 (--url이 없으면 앱을 같은 프로세스에서 구동)"""
+    if args.url:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        return httpx.AsyncClient(base_url=args.url, limits=limits, timeout=300)
+
+    os.environ.setdefault("LLM_BACKEND", "mock")
+    os.environ.setdefault("MOCK_LATENCY", str(args.mock_latency))
+    from main import app
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=300)
+
+
+def _report(recorder: Recorder, games: int, failed: int, elapsed: float) -> dict:
+    """결과 요약 출력 및 반환"""
+    total_requests = sum(len(values) for values in recorder.latencies.values())
+    summary = {
+        "games": games,
+        "failed_games": failed,
+        "elapsed": elapsed,
+        "games_per_sec": games / elapsed,
+        "requests_per_sec": total_requests / elapsed,
+        "endpoints": {},
+    }
+
+    print(f"games={games} failed={failed} elapsed={elapsed:.2f}s")
+    print(f"games/s={summary['games_per_sec']:.2f} requests/s={summary['requests_per_sec']:.2f}")
+    print(f"{'endpoint':<12} {'count':>6} {'errors':>6} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for endpoint in ENDPOINTS:
+        values = sorted(recorder.latencies.get(endpoint, []))
+        stats = {
+            "count": len(values),
+            "errors": recorder.errors.get(endpoint, 0),
+            "p50": _percentile(values, 50),
+            "p95": _percentile(values, 95),
+            "p99": _percentile(values, 99),
+        }
+        summary["endpoints"][endpoint] = stats
+        print(
+            f"{endpoint:<12} {stats['count']:>6} {stats['errors']:>6} "
+            f"{stats['p50'] * 1000:>6.0f}ms {stats['p95'] * 1000:>6.0f}ms {stats['p99'] * 1000:>6.0f}ms"
+        )
+    return summary
+
+
+def _compare(summary: dict, baseline_path: str, tolerance: float) -> List[str]:
+    """기준 결과 대비 p95 지연/처리량 회귀 검사"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = []
+    if summary["games_per_sec"] < baseline["games_per_sec"] * (1 - tolerance):
+        regressions.append(f"games/s {baseline['games_per_sec']:.2f} -> {summary['games_per_sec']:.2f}")
+    for endpoint, stats in summary["endpoints"].items():
+        before = baseline["endpoints"].get(endpoint)
+        if before and before["p95"] > 0 and stats["p95"] > before["p95"] * (1 + tolerance):
+            regressions.append(f"{endpoint} p95 {before['p95'] * 1000:.0f}ms -> {stats['p95'] * 1000:.0f}ms")
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="라이어 게임 전체 흐름 부하 벤치마크")
+    parser.add_argument("--url", default=None, help="대상 서버 URL (없으면 목 백엔드로 앱을 직접 구동)")
+    parser.add_argument("--games", type=int, default=200, help="진행할 게임 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시에 진행할 게임 수")
+    parser.add_argument("--rounds", type=int, default=2, help="게임당 발언 라운드 수")
+    parser.add_argument("--mock-latency", type=float, default=0.05, help="목 백엔드 평균 지연 (초)")
+    parser.add_argument("--save", default=None, help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--compare", default=None, help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 회귀 비율 (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    recorder = Recorder()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    failed = 0
+
+    async def run_one(client: httpx.AsyncClient):
+        nonlocal failed
+        async with semaphore:
+            try:
+                await play_game(client, recorder, args.rounds)
+            except RuntimeError:
+                failed += 1
+
+    async with _build_client(args) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(run_one(client) for _ in range(args.games)))
+        elapsed = time.perf_counter() - started
+
+    summary = _report(recorder, args.games, failed, elapsed)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+    if args.compare:
+        regressions = _compare(summary, args.compare, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,70 @@
+"""
+동시 세션 부하 테스트
+
+여러 세션이 동시에 /start → /talk ×N 을 수행하고 처리량과 지연 시간을 측정합니다.
+
+실행 예시:
+    # 1) 목 서버
+    MOCK_LATENCY=0.5 uvicorn benchmarks.mock_openai_server:app --port 9000
+    # 2) 게임 서버 (워커 1개)
+    OPENAI_API_KEY=dummy OPENAI_BASE_URL=http://127.0.0.1:9000/v1 uvicorn main:app --port 8000
+    # 3) 부하 테스트
+    python -m benchmarks.load_test --sessions 50 --turns 4
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+async def run_session(client: httpx.AsyncClient, turns: int, latencies: list):
+    """한 세션의 게임 진행"""
+    session_id = f"bench_{uuid.uuid4().hex[:12]}"
+
+    start = time.perf_counter()
+    response = await client.post("/start", json={"session_id": session_id})
+    response.raise_for_status()
+    latencies.append(time.perf_counter() - start)
+
+    for _ in range(turns):
+        start = time.perf_counter()
+        response = await client.post("/talk", json={"session_id": session_id, "user_message": "힌트입니다"})
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+
+
+def _percentile(values: list, pct: float) -> float:
+    """백분위수 계산 (values는 정렬된 상태)"""
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="라이어 게임 서버 동시 세션 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--sessions", type=int, default=50, help="동시 세션 수")
+    parser.add_argument("--turns", type=int, default=4, help="세션당 /talk 호출 수")
+    args = parser.parse_args()
+
+    latencies = []
+    limits = httpx.Limits(max_connections=args.sessions)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=300) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(run_session(client, args.turns, latencies) for _ in range(args.sessions)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"sessions={args.sessions} turns={args.turns} elapsed={elapsed:.2f}s")
+    print(f"sessions/s={args.sessions / elapsed:.2f} requests/s={len(latencies) / elapsed:.2f}")
+    print(
+        f"p50={_percentile(latencies, 50) * 1000:.0f}ms "
+        f"p99={_percentile(latencies, 99) * 1000:.0f}ms "
+        f"mean={statistics.mean(latencies) * 1000:.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
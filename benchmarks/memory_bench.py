@@ -0,0 +1,101 @@
+"""
+세션 상태 메모리 벤치마크
+
+대화 기록 길이(기본 10/50/200 메시지)별로 세션을 여러 개 만들어 tracemalloc으로 잰
+세션당 바이트 수를 이전 Pydantic 표현(GameState/Message 모델)과 현재 __slots__ 표현으로 비교합니다.
+발언 내용 문자열은 두 표현에서 똑같이 세션마다 새로 만들어 포함합니다.
+
+실행 예시:
+    python -m benchmarks.memory_bench
+    python -m benchmarks.memory_bench --sessions 5000 --messages 10 50 200
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import Callable, List, Literal
+
+from pydantic import BaseModel, Field
+
+from game_state import GameState
+from models import Message, PlayerRole
+
+AI_PLAYERS = ["ai_1", "ai_2", "ai_3"]
+PLAYERS = ["user", "ai_1", "ai_2", "ai_3"]
+
+
+class LegacyGameState(BaseModel):
+    """이전 게임 상태 표현 (Pydantic 모델 + Message 모델 목록, 비교용)"""
+
+    session_id: str
+    keyword: str
+    category: str
+    liar: str
+    ai_roles: dict = Field(...)
+    history: List[Message] = Field(default_factory=list)
+    turn_order: List[str] = Field(...)
+    current_turn: int = 0
+    started: bool = True
+    agent_mode: Literal["independent", "batched"] = "independent"
+
+
+def _content(index: int, turn: int) -> str:
+    # 세션마다 새 문자열 객체 (실제 발언처럼 내용이 매번 다름)
+    return f"세션 {index}의 {turn}번째 발언입니다. 주제어에 대한 힌트를 조심스럽게 말해 볼게요."
+
+
+def build_legacy(index: int, messages: int) -> LegacyGameState:
+    liar = random.choice(AI_PLAYERS)
+    return LegacyGameState(
+        session_id=f"session_{index}",
+        keyword="사과",
+        category="과일",
+        liar=liar,
+        ai_roles={ai: PlayerRole.LIAR if ai == liar else PlayerRole.CIVILIAN for ai in AI_PLAYERS},
+        history=[Message(speaker=PLAYERS[turn % 4], content=_content(index, turn)) for turn in range(messages)],
+        turn_order=random.sample(PLAYERS, 4),
+        current_turn=messages,
+    )
+
+
+def build_compact(index: int, messages: int) -> GameState:
+    game = GameState(
+        session_id=f"session_{index}",
+        keyword="사과",
+        category="과일",
+        liar=random.choice(AI_PLAYERS),
+        turn_order=random.sample(PLAYERS, 4),
+        current_turn=messages,
+    )
+    for turn in range(messages):
+        game.history.append(PLAYERS[turn % 4], _content(index, turn))
+    return game
+
+
+def bytes_per_session(build: Callable[[int, int], object], sessions: int, messages: int) -> float:
+    """세션 sessions개를 만드는 동안 늘어난 메모리를 세션 수로 나눈 값"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(index, messages) for index in range(sessions)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 상태 메모리 벤치마크")
+    parser.add_argument("--sessions", type=int, default=2000, help="길이별로 만들 세션 수")
+    parser.add_argument("--messages", type=int, nargs="+", default=[10, 50, 200], help="세션당 메시지 수 목록")
+    args = parser.parse_args()
+
+    print(f"{'messages':>8} {'pydantic':>12} {'slots':>12} {'saved':>7}")
+    for messages in args.messages:
+        legacy = bytes_per_session(build_legacy, args.sessions, messages)
+        compact = bytes_per_session(build_compact, args.sessions, messages)
+        print(f"{messages:>8} {legacy:>10.0f} B {compact:>10.0f} B {1 - compact / legacy:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+로컬 OpenAI 호환 목(mock) 서버 (부하 테스트용)
+
+/v1/chat/completions 요청에 고정 지연 후 짧은 응답을 돌려줍니다.
+stream=True 요청은 첫 토큰까지 MOCK_LATENCY, 이후 토큰마다 MOCK_TOKEN_INTERVAL 간격으로 SSE 청크를 보냅니다.
+
+실행:
+    MOCK_LATENCY=0.5 uvicorn benchmarks.mock_openai_server:app --port 9000
+"""
+import asyncio
+import json
+import os
+import time
+import uuid
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+# 응답 지연 (초) - 실제 LLM 왕복 시간을 흉내냄
+MOCK_LATENCY = float(os.getenv("MOCK_LATENCY", "0.5"))
+# 스트리밍 시 토큰 간 간격 (초)
+MOCK_TOKEN_INTERVAL = float(os.getenv("MOCK_TOKEN_INTERVAL", "0.05"))
+
+# 스트리밍 응답으로 보낼 토큰
+STREAM_TOKENS = ["음, ", "저는 ", "이게 ", "꽤 ", "익숙한 ", "느낌이에요."]
+
+app = FastAPI(title="Mock OpenAI Server")
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(body: dict):
+    """OpenAI Chat Completions 형식의 목 응답"""
+    if body.get("stream"):
+        return StreamingResponse(_stream_chunks(body), media_type="text/event-stream")
+
+    await asyncio.sleep(MOCK_LATENCY)
+    message = {"role": "assistant", "content": "ai_1"}
+    if body.get("tools"):
+        message = {"role": "assistant", "content": None, "tool_calls": [_tool_call(body["tools"][0]["function"])]}
+
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "mock"),
+        "choices": [
+            {
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if body.get("tools") else "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 5, "total_tokens": 105},
+    }
+
+
+def _tool_call(function: dict) -> dict:
+    """함수 스키마의 enum 속성은 첫 번째 허용 값으로 채운 tool_call"""
+    properties = function.get("parameters", {}).get("properties", {})
+    arguments = {name: schema["enum"][0] for name, schema in properties.items() if "enum" in schema}
+    return {
+        "id": f"call_{uuid.uuid4().hex[:12]}",
+        "type": "function",
+        "function": {"name": function["name"], "arguments": json.dumps(arguments)},
+    }
+
+
+async def _stream_chunks(body: dict):
+    """chat.completion.chunk 형식의 SSE 스트림"""
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    created = int(time.time())
+
+    def chunk(delta: dict, finish_reason=None) -> str:
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": body.get("model", "mock"),
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+    await asyncio.sleep(MOCK_LATENCY)
+    yield chunk({"role": "assistant", "content": ""})
+    for token in STREAM_TOKENS:
+        yield chunk({"content": token})
+        await asyncio.sleep(MOCK_TOKEN_INTERVAL)
+    yield chunk({}, finish_reason="stop")
+    yield "data: [DONE]\n\n"
@@ -0,0 +1,93 @@
+"""
+이벤트 로그 복구 벤치마크
+
+세션 N개(메시지 M개씩)를 이벤트 로그에 기록한 뒤 새 저장소로 복구하는 시간을 측정합니다.
+스냅샷 + 스냅샷 이후 로그 재생(기본)과 로그만 재생(--no-snapshot) 두 경우를 비교할 수 있으며,
+요청 경로에서 드는 이벤트 기록(append) 비용도 함께 보고합니다.
+
+실행 예시:
+    python -m benchmarks.recovery_bench --sessions 100000 --messages 8
+    python -m benchmarks.recovery_bench --sessions 100000 --messages 8 --no-snapshot
+"""
+import argparse
+import asyncio
+import random
+import shutil
+import tempfile
+import time
+
+from event_log import EventLog
+from game_state import GameState
+from session_store import InMemorySessionStore
+
+PLAYERS = ["user", "ai_1", "ai_2", "ai_3"]
+
+
+async def write_log(directory: str, sessions: int, messages: int, snapshot: bool) -> float:
+    """세션을 만들며 이벤트를 기록하고 이벤트 1건당 기록 시간(초) 반환"""
+    store = InMemorySessionStore(max_sessions=sessions, ttl=0)
+    log = EventLog(directory)
+    log.recover(store)
+
+    elapsed = 0.0
+    events = 0
+    for index in range(sessions):
+        game = GameState(
+            f"session_{index}", "사과", "과일", random.choice(PLAYERS[1:]), random.sample(PLAYERS, 4)
+        )
+        store.put(game)
+        started = time.perf_counter()
+        log.record_create(game)
+        elapsed += time.perf_counter() - started
+        events += 1
+
+        for turn in range(messages):
+            game.history.append(PLAYERS[turn % 4], f"세션 {index}의 {turn}번째 발언입니다. 힌트를 하나 드릴게요.")
+            game.current_turn += 1
+            started = time.perf_counter()
+            log.record_message(game)
+            log.record_turn(game)
+            elapsed += time.perf_counter() - started
+            events += 2
+
+        if index % 1000 == 999:
+            await log.flush()
+
+    if snapshot:
+        await log.snapshot(store)
+        # 스냅샷 이후 변경 (복구 시 로그 재생 구간)
+        for game in store.games()[: sessions // 10]:
+            game.history.append("user", "스냅샷 이후 발언")
+            log.record_message(game)
+    log.close()
+    return elapsed / events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이벤트 로그 복구 벤치마크")
+    parser.add_argument("--sessions", type=int, default=100000, help="세션 수")
+    parser.add_argument("--messages", type=int, default=8, help="세션당 메시지 수")
+    parser.add_argument("--no-snapshot", action="store_true", help="스냅샷 없이 로그만 재생")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="liargame_event_log_")
+    try:
+        per_event = asyncio.run(write_log(directory, args.sessions, args.messages, not args.no_snapshot))
+
+        store = InMemorySessionStore(max_sessions=args.sessions, ttl=0)
+        log = EventLog(directory)
+        started = time.perf_counter()
+        recovered = log.recover(store)
+        elapsed = time.perf_counter() - started
+        log.close()
+
+        mode = "log only" if args.no_snapshot else "snapshot + log"
+        print(f"sessions={args.sessions} messages={args.messages} mode={mode}")
+        print(f"append: {per_event * 1e6:.2f}us/event")
+        print(f"recovered={recovered} in {elapsed:.3f}s ({elapsed / max(recovered, 1) * 1e6:.1f}us/session)")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+API 응답 직렬화 벤치마크
+
+대화 기록 길이(기본 10/100/1000 메시지)별로 FastAPI 기본 경로와 빠른 경로(fast_json)의 응답 1건 직렬화 시간을 비교합니다.
+- default: 이전 구현과 같은 경로 (TalkResponse는 response_model 검증 + dict 변환 + JSONResponse,
+  /status는 dict를 jsonable_encoder로 변환 + JSONResponse)
+- fast cold: 빠른 경로, 세션 캐시 없이 대화 기록 전체를 직렬화 (첫 요청)
+- fast warm: 빠른 경로, 세션 캐시에 이미 직렬화된 기록을 이어 붙임 (이후 요청)
+- history / cache: 세션 하나의 대화 기록 메모리(발언 내용 문자열 + 리스트)와 직렬화 캐시 메모리
+시작 전에 두 경로의 결과 JSON이 같은 값인지 확인합니다.
+
+실행 예시:
+    python -m benchmarks.response_bench
+    python -m benchmarks.response_bench --messages 10 100 1000 --repeat 2000
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Awaitable, Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from fast_json import HistoryJsonCache, model_json
+from game_state import GameState
+from models import StatusResponse, TalkResponse
+
+PLAYERS = ["user", "ai_1", "ai_2", "ai_3"]
+TALK_FIELD = create_response_field(name="Response_talk", type_=TalkResponse)
+
+
+def build_game(messages: int) -> GameState:
+    game = GameState("bench", "사과", "과일", "ai_2", random.sample(PLAYERS, 4), current_turn=messages)
+    for turn in range(messages):
+        game.history.append(PLAYERS[turn % 4], f'{turn}번째 발언: 빨갛고 "달콤한" 느낌이에요.\n가을이 떠올라요 🍎')
+    return game
+
+
+def talk_response(game: GameState, cursor, history) -> TalkResponse:
+    return TalkResponse(
+        session_id=game.session_id,
+        history=history,
+        cursor=len(game.history),
+        delta=cursor is not None,
+        ai_responses={"ai_1": "...", "ai_2": "..."},
+        next_turn="user",
+        host_comment="사용자 차례입니다!",
+    )
+
+
+def status_dict(game: GameState, cursor) -> dict:
+    """이전 /status 응답 (response_model 없는 dict)"""
+    return {
+        "session_id": game.session_id,
+        "keyword": game.keyword,
+        "category": game.category,
+        "liar": game.liar,
+        "ai_roles": game.ai_roles,
+        "history": game.history.to_messages(cursor or 0),
+        "cursor": len(game.history),
+        "delta": cursor is not None,
+        "total_messages": len(game.history),
+        "turn_order": game.turn_order,
+        "current_turn": game.current_turn,
+    }
+
+
+def status_response(game: GameState, cursor) -> StatusResponse:
+    return StatusResponse(
+        session_id=game.session_id,
+        keyword=game.keyword,
+        category=game.category,
+        liar=game.liar,
+        ai_roles=game.ai_roles,
+        history=[],
+        cursor=len(game.history),
+        delta=cursor is not None,
+        total_messages=len(game.history),
+        turn_order=game.turn_order,
+        current_turn=game.current_turn,
+    )
+
+
+def history_bytes(game: GameState) -> int:
+    """대화 기록이 차지하는 메모리 (발언 내용 문자열 + 리스트, 발언자 배열은 메시지당 1바이트라 제외)"""
+    contents = [content for _, content, _ in game.history.entries()]
+    return sys.getsizeof(contents) + sum(sys.getsizeof(content) for content in contents)
+
+
+async def default_talk(game: GameState, cursor) -> bytes:
+    response = talk_response(game, cursor, game.history.to_messages(cursor or 0))
+    content = await serialize_response(field=TALK_FIELD, response_content=response)
+    return JSONResponse(content).body
+
+
+async def default_status(game: GameState, cursor) -> bytes:
+    return JSONResponse(jsonable_encoder(status_dict(game, cursor))).body
+
+
+async def fast_talk(cache: HistoryJsonCache, game: GameState, cursor) -> bytes:
+    return model_json(talk_response(game, cursor, []), cache.encode(game, cursor or 0))
+
+
+async def fast_status(cache: HistoryJsonCache, game: GameState, cursor) -> bytes:
+    return model_json(status_response(game, cursor), cache.encode(game, cursor or 0))
+
+
+async def per_call(function: Callable[[], Awaitable[bytes]], repeat: int) -> float:
+    """호출 1건당 시간 (초, 엔드포인트처럼 이벤트 루프 안에서 실행)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await function()
+    return (time.perf_counter() - started) / repeat
+
+
+async def run(message_counts: List[int], base_repeat: int):
+    print(
+        f"{'response':<16} {'messages':>8} {'bytes':>8} {'default':>10} {'fast cold':>10} {'fast warm':>10} "
+        f"{'speedup':>8} {'history':>9} {'cache':>9}"
+    )
+    for messages in message_counts:
+        game = build_game(messages)
+        repeat = max(base_repeat * 10 // max(messages, 10), 20)
+        cases = [
+            ("talk (full)", default_talk, fast_talk, None),
+            ("talk (delta 4)", default_talk, fast_talk, max(messages - 4, 0)),
+            ("status (full)", default_status, fast_status, None),
+        ]
+        for name, default, fast, cursor in cases:
+            expected = await default(game, cursor)
+            warm_cache = HistoryJsonCache()
+            actual = await fast(warm_cache, game, cursor)
+            assert json.loads(expected) == json.loads(actual), f"{name}: 결과가 다릅니다"
+
+            default_time = await per_call(lambda: default(game, cursor), repeat)
+            cold_time = await per_call(lambda: fast(HistoryJsonCache(), game, cursor), repeat)
+            warm_time = await per_call(lambda: fast(warm_cache, game, cursor), repeat)
+            cache_bytes = warm_cache.stats()["bytes"]
+            print(
+                f"{name:<16} {messages:>8} {len(actual):>8} {default_time * 1e6:>8.1f}us {cold_time * 1e6:>8.1f}us "
+                f"{warm_time * 1e6:>8.1f}us {default_time / warm_time:>7.1f}x "
+                f"{history_bytes(game) / 1024:>7.1f}KB {cache_bytes / 1024:>7.1f}KB"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 응답 직렬화 벤치마크")
+    parser.add_argument("--messages", type=int, nargs="+", default=[10, 100, 1000], help="대화 기록 길이 목록")
+    parser.add_argument("--repeat", type=int, default=1000, help="10 메시지 기준 반복 횟수 (길이에 반비례하여 줄임)")
+    args = parser.parse_args()
+    asyncio.run(run(args.messages, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+단일 세션 동시 /talk 스트레스 테스트
+
+한 세션에 /talk 요청을 동시에 보내고, 대화 기록이 턴 순서와 정확히 일치하는지 검사합니다.
+(같은 턴 중복 발언, 턴 건너뛰기, current_turn 불일치를 찾아냄)
+
+실행 예시:
+    python -m benchmarks.stress_talk --requests 40
+"""
+import argparse
+import asyncio
+import sys
+import uuid
+
+import httpx
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="단일 세션 동시 /talk 스트레스 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=40, help="동시에 보낼 /talk 요청 수")
+    args = parser.parse_args()
+
+    session_id = f"stress_{uuid.uuid4().hex[:12]}"
+    limits = httpx.Limits(max_connections=args.requests)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=300) as client:
+        response = await client.post("/start", json={"session_id": session_id})
+        response.raise_for_status()
+        turn_order = response.json()["turn_order"]
+
+        responses = await asyncio.gather(
+            *(
+                client.post("/talk", json={"session_id": session_id, "user_message": f"msg {i}"})
+                for i in range(args.requests)
+            )
+        )
+        failed = [r.status_code for r in responses if r.status_code != 200]
+
+        status = (await client.get(f"/status/{session_id}")).json()
+
+    history = status["history"]
+    speakers = [msg["speaker"] for msg in history]
+    expected = [turn_order[i % len(turn_order)] for i in range(len(speakers))]
+
+    errors = []
+    if failed:
+        errors.append(f"{len(failed)} requests failed: {sorted(set(failed))}")
+    if len(history) != args.requests:
+        errors.append(f"history has {len(history)} messages, expected {args.requests}")
+    if status["current_turn"] != len(history):
+        errors.append(f"current_turn={status['current_turn']} but history has {len(history)} messages")
+    if speakers != expected:
+        mismatch = next(i for i, (a, b) in enumerate(zip(speakers, expected)) if a != b) if speakers else 0
+        errors.append(f"speaker order diverges from turn_order at index {mismatch}")
+
+    print(f"session={session_id} requests={args.requests} messages={len(history)}")
+    if errors:
+        for error in errors:
+            print(f"FAIL: {error}")
+        return 1
+
+    print("OK: history consistent with turn order")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
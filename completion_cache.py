@@ -0,0 +1,91 @@
+"""
+LLM 응답 캐시
+
+모델, 메시지, 파라미터로 만든 키(content-addressed)로 응답 텍스트를 보관합니다.
+사회자 오프닝처럼 입력이 몇 가지 값으로 정해지는 호출에만 호출부에서 명시적으로 사용합니다.
+투표처럼 게임 결과에 영향을 주는 호출은 캐시하지 않습니다.
+"""
+import hashlib
+import json
+import random
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+def make_cache_key(model: str, messages: List[dict], params: dict) -> str:
+    """모델, 메시지, 생성 파라미터로 캐시 키 생성"""
+    payload = json.dumps([model, messages, params], ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """
+    LRU + TTL 응답 캐시 (키마다 최대 N개의 변형 응답 풀)
+
+    variants가 1보다 크면 키마다 variants번의 호출 결과를 모읍니다.
+    풀이 다 차기 전까지는 캐시 미스로 처리하여 새 응답을 받아 풀에 추가하고,
+    다 찬 뒤에는 풀에서 무작위로 골라 돌려주므로 새 호출 없이도 멘트가 반복되지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 3600.0, variants: int = 1):
+        """
+        Args:
+            max_entries: 최대 키 수 (초과 시 가장 오래 쓰이지 않은 키 제거)
+            ttl: 키 생성 후 만료 시간 (초, 0 이하이면 만료 없음)
+            variants: 키마다 모을 변형 응답 수
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.variants = max(1, variants)
+        self._entries: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 응답 조회
+
+        Returns:
+            Optional[str]: 응답 텍스트 (없거나 만료되었거나 변형 풀이 덜 찼으면 None)
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl > 0 and time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            entry = None
+
+        if entry is None or len(entry[1]) < self.variants:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return random.choice(entry[1])
+
+    def add(self, key: str, content: str):
+        """응답을 키의 변형 풀에 추가"""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = (time.monotonic(), [])
+            self._entries[key] = entry
+
+        pool = entry[1]
+        if len(pool) < self.variants:
+            pool.append(content)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 지표 (크기, 적중/미스 횟수, 적중률)"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
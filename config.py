@@ -3,21 +3,90 @@
 """
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
     """애플리케이션 설정"""
 
-    # OpenAI API 설정
-    openai_api_key: str
+    # LLM 백엔드 설정
+    # openai: 실제 OpenAI API, mock: 오프라인 목 백엔드 (API 키 불필요, 부하 테스트용)
+    llm_backend: Literal["openai", "mock"] = "openai"
+
+    # OpenAI API 설정 (llm_backend가 openai일 때 필요, 없으면 OPENAI_API_KEY 환경 변수 사용)
+    openai_api_key: Optional[str] = None
     openai_model: str = "gpt-4o-2024-11-20"
+    openai_base_url: Optional[str] = None  # None이면 기본 OpenAI 엔드포인트
+
+    # LLM HTTP 커넥션 풀 설정
+    llm_timeout: float = 30.0
+    llm_call_timeout: float = 20.0  # LLM 호출 1건의 제한 시간 (초, 스트리밍은 스트림 시작까지)
+    llm_max_retries: int = 2  # 429/5xx/연결 오류/시간 초과 시 재시도 횟수
+    llm_backoff_base: float = 0.25  # 재시도 지수 백오프 기본 간격 (초, full jitter)
+    llm_backoff_max: float = 4.0  # 재시도 대기 최대 간격 (초)
+    llm_circuit_failure_threshold: int = 5  # 연속 실패가 이 횟수에 이르면 회로 차단
+    llm_circuit_reset_timeout: float = 30.0  # 회로 차단 후 시험 호출까지 대기 시간 (초)
+    llm_hedge_delay: float = 0.0  # 0보다 크면 이 시간 안에 응답이 없을 때 같은 요청을 하나 더 보냄 (초)
+    llm_max_in_flight: int = 64  # 프로세스 전체에서 동시에 실행할 최대 LLM 호출 수
+    llm_tokens_per_minute: int = 0  # 분당 토큰 예산 (0이면 제한 없음, response.usage로 정산)
+    # /metrics 비용 추정용 1K 토큰당 단가 (USD, 기본값은 gpt-4o 기준)
+    llm_prompt_cost_per_1k: float = 0.0025
+    llm_completion_cost_per_1k: float = 0.01
+    llm_max_connections: int = 100
+    llm_max_keepalive_connections: int = 20
+
+    # 목 백엔드 설정 (llm_backend == "mock")
+    mock_latency: float = 0.3  # 평균 응답 지연 (초)
+    mock_latency_jitter: float = 0.1  # 지연 시간 표준편차 (초)
+    mock_error_rate: float = 0.0  # 요청 실패 확률 (0~1)
+    mock_error_status: int = 500  # 실패 시 HTTP 상태 코드 (429, 500 등)
+    mock_seed: int = 0  # 응답/지연/오류를 결정하는 시드
 
     # 서버 설정
     host: str = "0.0.0.0"
     port: int = 8000
 
+    # 세션 저장소 설정
+    # memory: 프로세스 내부 (워커 1개), sqlite: 워커/프로세스 간 공유 (uvicorn --workers N)
+    session_backend: Literal["memory", "sqlite"] = "memory"
+    session_db_path: str = "sessions.db"
+    # SQLite 잠금 대기 최대 시간 (초) - 저장소 호출은 이벤트 루프에서 동기로 실행되므로 길면 워커 전체가 멈춤
+    session_db_busy_timeout: float = 0.1
+    max_sessions: int = 10000  # 최대 보관 세션 수 (초과 시 LRU 제거)
+    session_ttl: float = 3600.0  # 유휴 세션 만료 시간 (초)
+    session_sweep_interval: float = 60.0  # 만료 세션 정리 주기 (초)
+
+    # 이벤트 로그 설정 (memory 백엔드 재시작 복구)
+    event_log_enabled: bool = False  # 상태 변경을 이벤트 로그에 기록하고 시작 시 스냅샷 + 로그 재생으로 복구
+    event_log_dir: str = "event_log"
+    event_log_flush_interval: float = 0.05  # 이벤트를 모아서 쓰고 fsync하는 주기 (초)
+    event_log_snapshot_interval: float = 300.0  # 전체 세션 스냅샷 주기 (초, 이전 로그는 삭제)
+
+    # WebSocket 게임 채널 설정 (/ws/{session_id})
+    ws_event_buffer: int = 256  # 재연결 이어받기용으로 세션마다 보관할 최근 이벤트 수
+    history_json_cache_size: int = 1000  # 직렬화된 대화 기록을 캐시할 최근 응답 세션 수 (0이면 캐시 안 함)
+
     # 게임 설정
     max_history_length: int = 20
+    history_token_budget: int = 1500  # AI 발언/투표/추측 요청에 넣을 대화 기록의 추정 토큰 예산
+    history_summary_enabled: bool = False  # 예산 밖으로 밀려난 대화를 라운드마다 요약하여 포함
+    vote_timeout: float = 8.0  # AI 투표 1건당 제한 시간 (초), 초과 시 랜덤 투표
+    # independent: AI마다 따로 호출, batched: 시민 AI의 투표/연속 발언을 한 번에 호출 (라이어는 항상 따로)
+    agent_mode: Literal["independent", "batched"] = "independent"
+    vote_structured_output: bool = True  # 함수 호출(tools)로 투표 대상을 받음 (미지원 호환 서버는 false)
+    speculative_turns: bool = False  # 다음 차례가 AI이면 턴이 끝나자마자 그 발언을 미리 생성
+
+    # 사회자 멘트 설정
+    # sync: /talk 응답에 포함, background: 백그라운드 생성 후 /host-comment/{session_id}로 조회
+    host_comment_mode: Literal["sync", "background"] = "sync"
+    # llm: LLM으로 차례 안내 생성, template: 고정 문구 사용 (LLM 호출 없음)
+    turn_announce_mode: Literal["llm", "template"] = "llm"
+
+    # LLM 응답 캐시 설정 (게임 시작/차례 안내 사회자 멘트에만 사용, 투표에는 사용하지 않음)
+    completion_cache_enabled: bool = True
+    completion_cache_size: int = 1000  # 최대 캐시 키 수
+    completion_cache_ttl: float = 3600.0  # 캐시 키 만료 시간 (초)
+    completion_cache_variants: int = 3  # 키마다 모아 두고 번갈아 쓸 응답 수
 
     class Config:
         env_file = ".env"
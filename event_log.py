@@ -0,0 +1,355 @@
+"""
+게임 상태 이벤트 로그 (write-ahead log) 및 스냅샷
+
+memory 세션 저장소는 프로세스가 재시작되면 진행 중인 게임을 모두 잃으므로,
+상태 변경마다 짧은 이벤트를 추가 전용 로그에 기록하고 재시작 시 최신 스냅샷부터 재생하여 복구합니다.
+
+- 기록은 메모리 버퍼에 쌓기만 하고, 백그라운드 작업이 flush_interval마다 모아서 쓰고 fsync (요청 경로에 fsync 없음)
+- snapshot_interval마다 전체 세션을 스냅샷으로 저장하고 그 이전 로그 세그먼트는 삭제
+- 이벤트는 멱등적이므로(메시지는 위치, 턴은 값으로 기록) 스냅샷과 겹쳐 재생되어도 결과가 같음
+
+디렉터리 구성:
+    events-{세대}.log      이벤트 로그 세그먼트 (JSON 배열 한 줄에 이벤트 하나)
+    snapshot-{세대}.jsonl  해당 세대 세그먼트 시작 시점 이후의 전체 세션 (한 줄에 세션 하나, 대화 기록은 열 단위,
+                           마지막 필드는 마지막 접근 시각)
+
+이벤트 형식:
+    ["c", session_id, keyword, category, liar, turn_order, agent_mode]  게임 생성
+    ["m", session_id, index, speaker, content]                          대화 기록 index번째 메시지 추가
+    ["t", session_id, current_turn]                                     턴 진행
+    ["d", session_id]                                                   세션 삭제/제거
+"""
+import asyncio
+import gc
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Union
+
+from game_state import GameState, History
+from session_store import EncodedGame, InMemorySessionStore
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_PATTERN = re.compile(r"^(events|snapshot)-(\d+)\.(log|jsonl)$")
+
+# 스냅샷을 나눠 인코딩할 세션 수 (묶음 사이에 이벤트 루프에 양보)
+_SNAPSHOT_CHUNK = 1000
+
+# 스냅샷 줄 맨 앞의 세션 ID만 해석하는 디코더
+_decoder = json.JSONDecoder()
+
+
+def encode_snapshot_entry(game: Union[GameState, EncodedGame], last_access: Optional[float] = None) -> bytes:
+    """
+    스냅샷 한 줄 (대화 기록은 발언자 ID 16진 문자열 + 발언 내용 목록으로 저장하여 복구 시 메시지별 처리 없음)
+
+    last_access(Unix 시간)를 주면 마지막 필드로 저장하여 복구 후에도 유휴 TTL이 이어지게 합니다.
+    """
+    if type(game) is EncodedGame:
+        # 복구 후 아직 조회되지 않은 세션은 읽었던 줄을 그대로 기록 (마지막 접근 시각도 그대로)
+        return game.data.encode("utf-8")
+    speakers, contents = game.history.to_columns()
+    entry = [
+        game.session_id,
+        game.keyword,
+        game.category,
+        game.liar,
+        game.turn_order,
+        game.current_turn,
+        game.agent_mode,
+        speakers,
+        contents,
+    ]
+    if last_access is not None:
+        entry.append(round(last_access, 3))
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_snapshot_entry(line: str) -> GameState:
+    """encode_snapshot_entry로 저장한 한 줄을 GameState로 복원"""
+    session_id, keyword, category, liar, turn_order, current_turn, agent_mode, speakers, contents, *_ = json.loads(line)
+    history = History.from_columns(speakers, contents)
+    return GameState(session_id, keyword, category, liar, turn_order, current_turn, agent_mode, history)
+
+
+def snapshot_last_access(line: str) -> Optional[float]:
+    """스냅샷 줄의 마지막 접근 시각 (줄 전체를 해석하지 않고 마지막 필드만 읽음, 이전 형식이면 None)"""
+    tail = line.rstrip()
+    if tail.endswith("]]"):
+        # 마지막 필드가 발언 내용 목록 (마지막 접근 시각 없이 저장된 줄)
+        return None
+    return float(tail[tail.rindex(",") + 1 : -1])
+
+
+class EventLog:
+    """
+    세션 상태 변경 이벤트 로그
+
+    append()는 이벤트를 버퍼에 넣기만 하며, run()이 주기적으로 세그먼트 파일에 쓰고 fsync합니다.
+    """
+
+    def __init__(self, directory: str, flush_interval: float = 0.05, snapshot_interval: float = 300.0):
+        """
+        Args:
+            directory: 로그/스냅샷 파일 디렉터리 (없으면 생성)
+            flush_interval: 버퍼를 파일에 쓰고 fsync하는 주기 (초)
+            snapshot_interval: 스냅샷 주기 (초, 0 이하이면 스냅샷을 만들지 않음)
+        """
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.snapshot_interval = snapshot_interval
+        self.generation = 0
+        self._file = None
+        self._io_lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._replaying = False
+        self._events_since_snapshot = 0
+        self.stats_counters = {
+            "events": 0,
+            "flushes": 0,
+            "bytes_written": 0,
+            "snapshots": 0,
+            "errors": 0,
+            "recovered_sessions": 0,
+            "recovery_seconds": 0.0,
+        }
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, kind: str, generation: int) -> str:
+        extension = "log" if kind == "events" else "jsonl"
+        return os.path.join(self.directory, f"{kind}-{generation:08d}.{extension}")
+
+    def _generations(self, kind: str) -> List[int]:
+        generations = []
+        for name in os.listdir(self.directory):
+            match = _SEGMENT_PATTERN.match(name)
+            if match and match.group(1) == kind:
+                generations.append(int(match.group(2)))
+        return sorted(generations)
+
+    def _open_segment(self, generation: int):
+        """새 로그 세그먼트로 전환 (이후 flush는 이 파일에 기록, 새 파일을 열지 못하면 기존 세그먼트를 계속 사용)"""
+        new_file = open(self._path("events", generation), "ab")
+        if self._file is not None:
+            with self._io_lock:
+                self._file.close()
+        self.generation = generation
+        self._file = new_file
+
+    # 기록
+
+    def append(self, *event):
+        """이벤트를 버퍼에 추가 (파일 쓰기/fsync는 run()이 모아서 처리)"""
+        if self._replaying:
+            return
+        self._buffer.append(json.dumps(event, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._events_since_snapshot += 1
+        self.stats_counters["events"] += 1
+
+    def record_create(self, game: GameState):
+        self.append("c", game.session_id, game.keyword, game.category, game.liar, game.turn_order, game.agent_mode)
+
+    def record_message(self, game: GameState):
+        index = len(game.history) - 1
+        self.append("m", game.session_id, index, game.history.speaker_at(index), game.history.content_at(index))
+
+    def record_turn(self, game: GameState):
+        self.append("t", game.session_id, game.current_turn)
+
+    def record_delete(self, session_id: str):
+        self.append("d", session_id)
+
+    def _write(self, file, data: bytes):
+        with self._io_lock:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+
+    async def flush(self):
+        """버퍼에 쌓인 이벤트를 현재 세그먼트에 쓰고 fsync (파일 I/O는 스레드에서)"""
+        if not self._buffer or self._file is None:
+            return
+        data = b"".join(self._buffer)
+        self._buffer = []
+        try:
+            await asyncio.to_thread(self._write, self._file, data)
+        except BaseException:
+            # 다음 flush에서 다시 쓰도록 버퍼 앞에 되돌림 (일부가 이미 쓰였어도 이벤트는 멱등적으로 재생됨)
+            self._buffer.insert(0, data)
+            raise
+        self.stats_counters["flushes"] += 1
+        self.stats_counters["bytes_written"] += len(data)
+
+    async def snapshot(self, store: InMemorySessionStore):
+        """
+        전체 세션 스냅샷 저장 후 이전 세그먼트/스냅샷 삭제
+
+        새 세그먼트로 전환한 뒤 세션을 묶음 단위로 인코딩하므로 그 사이 변경은 새 세그먼트에도 기록되며,
+        재생 시 멱등적으로 다시 적용됩니다. 스냅샷 파일은 다 쓴 뒤 이름을 바꿔 완성된 것만 보이게 합니다.
+        인코딩만 이벤트 루프에서 하고 파일 열기/쓰기/fsync/이름 변경/이전 파일 삭제는 모두 스레드에서 처리합니다.
+        """
+        await self.flush()
+        generation = self.generation + 1
+        await asyncio.to_thread(self._open_segment, generation)
+        self._events_since_snapshot = 0
+
+        entries = store.games_with_access()
+        path = self._path("snapshot", generation)
+        temp_path = path + ".tmp"
+        f = await asyncio.to_thread(open, temp_path, "wb")
+        try:
+            for start in range(0, len(entries), _SNAPSHOT_CHUNK):
+                chunk = b"".join(
+                    encode_snapshot_entry(game, last_access)
+                    for game, last_access in entries[start : start + _SNAPSHOT_CHUNK]
+                )
+                await asyncio.to_thread(f.write, chunk)
+            await asyncio.to_thread(self._write, f, b"")
+        finally:
+            await asyncio.to_thread(f.close)
+        await asyncio.to_thread(self._replace_snapshot, temp_path, path, generation)
+        self.stats_counters["snapshots"] += 1
+
+    def _replace_snapshot(self, temp_path: str, path: str, generation: int):
+        """완성된 스냅샷을 제 이름으로 바꾸고 이전 세그먼트/스냅샷 삭제 (스레드에서 실행)"""
+        os.replace(temp_path, path)
+        # 새 스냅샷 이전의 세그먼트와 스냅샷은 더 이상 필요 없음
+        for kind in ("events", "snapshot"):
+            for old in self._generations(kind):
+                if old < generation:
+                    os.remove(self._path(kind, old))
+
+    async def run(self, store: InMemorySessionStore):
+        """
+        flush_interval마다 버퍼를 기록하고 snapshot_interval마다 스냅샷을 만드는 백그라운드 루프
+
+        디스크 오류 등으로 기록/스냅샷이 실패해도 루프를 멈추지 않고 로그를 남기고 errors를 올린 뒤
+        다음 주기에 다시 시도합니다 (실패한 스냅샷은 다음 스냅샷 주기에 다시 만듦).
+        """
+        next_snapshot = time.monotonic() + self.snapshot_interval
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+                if 0 < self.snapshot_interval and time.monotonic() >= next_snapshot:
+                    next_snapshot = time.monotonic() + self.snapshot_interval
+                    if self._events_since_snapshot:
+                        await self.snapshot(store)
+            except Exception:
+                self.stats_counters["errors"] += 1
+                logger.exception("Event log write failed, retrying on the next flush")
+
+    def close(self):
+        """남은 버퍼를 동기적으로 기록하고 파일 닫기 (서버 종료 시)"""
+        if self._file is None:
+            return
+        if self._buffer:
+            self._write(self._file, b"".join(self._buffer))
+            self._buffer = []
+        with self._io_lock:
+            self._file.close()
+        self._file = None
+
+    # 복구
+
+    @staticmethod
+    def _apply(store: InMemorySessionStore, event: list):
+        kind, session_id = event[0], event[1]
+        if kind == "c":
+            _, _, keyword, category, liar, turn_order, agent_mode = event
+            store.put(GameState(session_id, keyword, category, liar, turn_order, agent_mode=agent_mode))
+            return
+        if kind == "d":
+            store.delete(session_id)
+            return
+
+        game = store.get(session_id, touch=False)
+        if game is None:
+            return
+        if kind == "m":
+            # 스냅샷에 이미 들어 있는 메시지는 건너뜀
+            if event[2] != len(game.history):
+                return
+            game.history.append(event[3], event[4])
+        elif kind == "t":
+            game.current_turn = event[2]
+        store.put(game)
+
+    def recover(self, store: InMemorySessionStore) -> int:
+        """
+        최신 스냅샷을 읽고 그 이후 세그먼트를 재생하여 세션 복구 (서버 시작 시 1회)
+
+        쓰는 도중 종료되어 잘린 마지막 줄이나 실패한 쓰기가 남긴 깨진 줄은 건너뜁니다. 복구 후에는 새 세그먼트에 기록합니다.
+        스냅샷의 세션은 저장된 마지막 접근 시각을 이어받고(이전 형식의 줄은 복구 시각), 스냅샷 이후 로그에
+        이벤트가 있는 세션은 복구 시각을 마지막 접근으로 봅니다.
+
+        Returns:
+            int: 복구된 세션 수
+        """
+        started = time.perf_counter()
+        # 쓰는 도중 종료된 스냅샷 임시 파일 정리
+        for name in os.listdir(self.directory):
+            if name.endswith(".tmp"):
+                os.remove(os.path.join(self.directory, name))
+
+        snapshots = self._generations("snapshot")
+        base = snapshots[-1] if snapshots else 0
+
+        # 복구 중 만들어지는 수백만 개의 컨테이너가 순환 GC를 반복 실행시키지 않도록 잠시 중지
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        self._replaying = True
+        # 스냅샷 시점에 오래 쉬던 세션도 이후 로그에 이벤트가 있으면 다시 쓰인 것이므로 재생 중에는 만료시키지 않음
+        # (재생 후에도 만료된 세션은 sweep이나 첫 조회 때 제거)
+        ttl, store.ttl = store.ttl, 0
+        try:
+            if snapshots:
+                # 세션 ID와 마지막 접근 시각만 읽고 나머지는 처음 조회할 때 복원 (재시작 직후 전체 해석 비용 없음)
+                with open(self._path("snapshot", base), "r", encoding="utf-8") as f:
+                    for line in f:
+                        session_id = _decoder.raw_decode(line, 1)[0]
+                        store.put_encoded(
+                            session_id, EncodedGame(line, decode_snapshot_entry), snapshot_last_access(line)
+                        )
+
+            segments = [generation for generation in self._generations("events") if generation >= base]
+            for generation in segments:
+                # 잘린 줄의 깨진 UTF-8은 대체 문자로 읽고 JSON 해석 실패로 건너뜀 (쓰기 실패 후 다시 쓴 이벤트는
+                # 깨진 줄 뒤에 이어지므로 세그먼트 끝까지 계속 재생)
+                with open(self._path("events", generation), "r", encoding="utf-8", errors="replace") as f:
+                    for line in f:
+                        try:
+                            event = json.loads(line)
+                        except ValueError:
+                            continue
+                        self._apply(store, event)
+        finally:
+            store.ttl = ttl
+            self._replaying = False
+            if gc_enabled:
+                gc.enable()
+
+        last = max([base, *segments]) if snapshots or segments else 0
+        self._open_segment(last + 1)
+
+        recovered = store.size()
+        self.stats_counters["recovered_sessions"] = recovered
+        self.stats_counters["recovery_seconds"] = time.perf_counter() - started
+        return recovered
+
+    def stats(self) -> Dict[str, float]:
+        """이벤트 로그 지표 (기록 이벤트 수, fsync 횟수, 기록 바이트, 스냅샷 수, 최근 복구 결과)"""
+        return {**self.stats_counters, "pending": len(self._buffer), "generation": self.generation}
+
+
+def create_event_log(
+    enabled: bool, backend: str, directory: str, flush_interval: float, snapshot_interval: float
+) -> Optional[EventLog]:
+    """설정에 맞는 이벤트 로그 생성 (memory 백엔드에서만 사용, sqlite는 저장소 자체가 영속적)"""
+    if not enabled or backend != "memory":
+        return None
+    return EventLog(directory, flush_interval=flush_interval, snapshot_interval=snapshot_interval)
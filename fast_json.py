@@ -0,0 +1,140 @@
+"""
+API 응답 JSON 직렬화 (빠른 경로)
+
+FastAPI 기본 경로는 응답 모델을 한 번 더 검증하고 dict로 바꾼 뒤(response_model이 없으면 jsonable_encoder로
+하나씩 변환) json.dumps로 다시 직렬화합니다. 여기서는
+- 응답 모델을 pydantic-core 직렬화기로 중간 dict 없이 바로 bytes로 만들고
+- 대화 기록은 세션별로 이미 직렬화한 메시지 bytes를 캐시해 두었다가 새 메시지만 이어 붙여
+  바뀌지 않은 메시지를 다시 인코딩하지 않습니다. 캐시한 세션은 대화 기록을 한 벌 더 들고 있는 셈이므로
+  (메시지 내용 UTF-8 + 메시지당 약 50바이트) 최근에 응답한 세션 몇 개로만 제한합니다.
+결과 JSON은 기본 경로와 같은 필드/값이며, 필드 순서만 history가 맨 앞으로 옵니다.
+"""
+import sys
+from array import array
+from collections import OrderedDict
+from json.encoder import encode_basestring
+from typing import Dict, Optional
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from game_state import SPEAKERS, GameState
+
+# 발언자별 메시지 JSON 앞/뒤 조각 (models.Message 필드 순서와 같음)
+# 발언 내용은 json.dumps(ensure_ascii=False)와 같은 C 문자열 인코더로 직접 변환
+_MESSAGE_PREFIX = {speaker: f'{{"speaker":"{speaker}","content":'.encode() for speaker in SPEAKERS}
+_MESSAGE_SUFFIX = {False: b',"is_host":false},', True: b',"is_host":true},'}
+
+
+def model_json(model: BaseModel, history: Optional[bytes] = None) -> bytes:
+    """
+    응답 모델을 JSON bytes로 직렬화
+
+    Args:
+        model: 응답 모델
+        history: 미리 직렬화한 대화 기록 JSON 배열 (주면 모델의 history 필드 대신 사용)
+    """
+    if history is None:
+        return model.__pydantic_serializer__.to_json(model)
+    body = model.__pydantic_serializer__.to_json(model, exclude={"history"})
+    if body == b"{}":
+        return b'{"history":' + history + b"}"
+    return b'{"history":' + history + b"," + body[1:]
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    """직렬화된 JSON bytes를 그대로 보내는 응답"""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+class HistoryJson:
+    """한 세션의 직렬화된 대화 기록 (메시지마다 끝에 쉼표를 붙여 이어 붙인 bytes + 메시지별 시작 위치)"""
+
+    __slots__ = ("signature", "data", "offsets", "last_content")
+
+    def __init__(self, game: GameState):
+        self.signature = (game.keyword, game.category, game.liar)
+        self.data = bytearray()
+        self.offsets = array("q")
+        self.last_content: Optional[str] = None
+
+    @property
+    def nbytes(self) -> int:
+        """이 캐시가 차지하는 메모리 (바이트, 마지막 메시지 문자열은 대화 기록과 공유하므로 제외)"""
+        return sys.getsizeof(self.data) + sys.getsizeof(self.offsets)
+
+    def matches(self, game: GameState) -> bool:
+        """캐시가 이 게임 상태의 앞부분인지 여부 (같은 게임이고 기록이 줄지 않았으며 마지막 메시지가 같음)"""
+        count = len(self.offsets)
+        return (
+            self.signature == (game.keyword, game.category, game.liar)
+            and count <= len(game.history)
+            and (count == 0 or game.history.content_at(count - 1) == self.last_content)
+        )
+
+    def sync(self, game: GameState):
+        """새로 추가된 메시지만 직렬화하여 이어 붙임"""
+        data = self.data
+        offsets = self.offsets
+        content = self.last_content
+        for speaker, content, is_host in game.history.entries(len(offsets)):
+            offsets.append(len(data))
+            data += _MESSAGE_PREFIX[speaker]
+            data += encode_basestring(content).encode("utf-8")
+            data += _MESSAGE_SUFFIX[is_host]
+        self.last_content = content
+
+    def slice(self, start: int) -> bytes:
+        """start번째 메시지부터의 JSON 배열"""
+        if start >= len(self.offsets):
+            return b"[]"
+        with memoryview(self.data) as view:
+            # 마지막 메시지 뒤의 쉼표는 제외
+            return b"".join((b"[", view[self.offsets[start] : -1], b"]"))
+
+
+class HistoryJsonCache:
+    """세션별 직렬화된 대화 기록 LRU 캐시 (max_sessions가 0 이하이면 캐시 없이 매번 전체 직렬화)"""
+
+    def __init__(self, max_sessions: int = 1000):
+        self.max_sessions = max_sessions
+        self._entries: "OrderedDict[str, HistoryJson]" = OrderedDict()
+        self.stats_counters = {"hits": 0, "misses": 0, "encoded_messages": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def encode(self, game: GameState, start: int = 0) -> bytes:
+        """
+        start번째 메시지부터의 대화 기록 JSON 배열
+
+        캐시가 없거나 다른 게임의 것이면(같은 세션 ID로 새 게임 시작, 다른 워커에서 변경 등) 새로 구성합니다.
+        """
+        entry: Optional[HistoryJson] = self._entries.get(game.session_id)
+        if entry is None or not entry.matches(game):
+            entry = HistoryJson(game)
+            if self.max_sessions > 0:
+                self._entries[game.session_id] = entry
+                while len(self._entries) > self.max_sessions:
+                    self._entries.popitem(last=False)
+            self.stats_counters["misses"] += 1
+        else:
+            self.stats_counters["hits"] += 1
+            self._entries.move_to_end(game.session_id)
+
+        cached = len(entry.offsets)
+        entry.sync(game)
+        self.stats_counters["encoded_messages"] += len(entry.offsets) - cached
+        return entry.slice(start)
+
+    def discard(self, session_id: str):
+        """세션 캐시 제거"""
+        self._entries.pop(session_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 지표 (세션 수, 사용 메모리 바이트, 적중/미스 횟수, 새로 직렬화한 메시지 수)"""
+        return {
+            "sessions": len(self._entries),
+            "bytes": sum(entry.nbytes for entry in self._entries.values()),
+            **self.stats_counters,
+        }
@@ -14,15 +14,17 @@ const GamePage = ({ sessionId, keyword, category, onRestart }) => {
   const [turnOrder, setTurnOrder] = useState([])
   const [nextTurn, setNextTurn] = useState('')
   const [hostComment, setHostComment] = useState('')
+  const [streamingMessage, setStreamingMessage] = useState(null)
   const [roundComplete, setRoundComplete] = useState(false)
   const [actualLiar, setActualLiar] = useState('')
   const [userRole, setUserRole] = useState('')
   const chatEndRef = useRef(null)
+  const historyCursorRef = useRef(0)
   const aiTurnTimeoutRef = useRef(null)
 
   useEffect(() => {
     chatEndRef.current?.scrollIntoView({ behavior: 'smooth' })
-  }, [history])
+  }, [history, streamingMessage])
 
   // 게임 시작 시 초기 데이터 로드
   useEffect(() => {
@@ -61,20 +63,53 @@ const GamePage = ({ sessionId, keyword, category, onRestart }) => {
     }
   }, [nextTurn, gamePhase, loading, roundComplete])
 
+  // 대화 기록 반영 (delta 응답이면 새 메시지만 이어 붙임)
+  const applyHistory = (response) => {
+    if (response.delta) {
+      setHistory((prev) => [...prev.slice(0, historyCursorRef.current), ...response.history])
+    } else {
+      setHistory(response.history)
+    }
+    historyCursorRef.current = response.cursor
+
+    if (response.cursor >= turnOrder.length && response.cursor % turnOrder.length === 0) {
+      setRoundComplete(true)
+    }
+  }
+
+  // 사회자 멘트 반영 (백그라운드 생성 중이면 완료 후 표시)
+  const applyHostComment = (response) => {
+    setHostComment(response.host_comment || '')
+
+    if (response.host_comment_pending) {
+      gameAPI.getHostComment(sessionId)
+        .then((comment) => {
+          if (comment.ready) {
+            setHostComment(comment.host_comment || '')
+          }
+        })
+        .catch((err) => console.error('사회자 멘트 조회 실패:', err))
+    }
+  }
+
   const handleAITurn = async () => {
     setLoading(true)
     setError('')
 
     try {
-      const response = await gameAPI.sendMessage(sessionId, '')
-      setHistory(response.history)
+      // AI 발언은 스트리밍으로 받아 생성되는 즉시 표시
+      const response = await gameAPI.sendMessageStream(sessionId, '', historyCursorRef.current, (delta, speaker) => {
+        setStreamingMessage((prev) => ({
+          speaker,
+          content: (prev?.content || '') + delta,
+        }))
+      })
+      setStreamingMessage(null)
+      applyHistory(response)
       setNextTurn(response.next_turn)
-      setHostComment(response.host_comment || '')
-
-      if (response.history.length >= turnOrder.length && response.history.length % turnOrder.length === 0) {
-        setRoundComplete(true)
-      }
+      applyHostComment(response)
     } catch (err) {
+      setStreamingMessage(null)
       setError(err.response?.data?.detail || 'AI 발언 실패')
     } finally {
       setLoading(false)
@@ -89,15 +124,11 @@ const GamePage = ({ sessionId, keyword, category, onRestart }) => {
     setError('')
 
     try {
-      const response = await gameAPI.sendMessage(sessionId, userMessage.trim())
-      setHistory(response.history)
+      const response = await gameAPI.sendMessage(sessionId, userMessage.trim(), historyCursorRef.current)
+      applyHistory(response)
       setNextTurn(response.next_turn)
-      setHostComment(response.host_comment || '')
+      applyHostComment(response)
       setUserMessage('')
-
-      if (response.history.length >= turnOrder.length && response.history.length % turnOrder.length === 0) {
-        setRoundComplete(true)
-      }
     } catch (err) {
       setError(err.response?.data?.detail || '메시지 전송 실패')
     } finally {
@@ -414,6 +445,15 @@ const GamePage = ({ sessionId, keyword, category, onRestart }) => {
             </div>
           ))}
 
+          {streamingMessage && (
+            <div className="message ai-message">
+              <div className="message-header">
+                <span className="speaker-name">{getSpeakerName(streamingMessage.speaker)}</span>
+              </div>
+              <div className="message-content">{streamingMessage.content}</div>
+            </div>
+          )}
+
           <div ref={chatEndRef} />
         </div>
 
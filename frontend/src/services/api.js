@@ -19,11 +19,75 @@ export const gameAPI = {
     return response.data;
   },
 
-  // 대화 진행
-  sendMessage: async (sessionId, userMessage) => {
+  // 대화 진행 (cursor를 주면 이미 가진 메시지 이후의 새 메시지만 받음)
+  sendMessage: async (sessionId, userMessage, cursor = null) => {
     const response = await api.post('/talk', {
       session_id: sessionId,
       user_message: userMessage,
+      cursor: cursor,
+    });
+    return response.data;
+  },
+
+  // 대화 진행 (SSE 스트리밍) - AI 응답 조각마다 onToken(delta, speaker) 호출, 완료 시 TalkResponse 반환
+  sendMessageStream: async (sessionId, userMessage, cursor, onToken) => {
+    const response = await fetch(`${API_BASE_URL}/talk/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({
+        session_id: sessionId,
+        user_message: userMessage,
+        cursor: cursor,
+      }),
+    });
+
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({}));
+      throw { response: { data: error } };
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      // 이벤트는 빈 줄로 구분
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const rawEvent = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+
+        let event = 'message';
+        let data = '';
+        for (const line of rawEvent.split('\n')) {
+          if (line.startsWith('event: ')) event = line.slice(7);
+          else if (line.startsWith('data: ')) data += line.slice(6);
+        }
+
+        const payload = JSON.parse(data);
+        if (event === 'token') {
+          onToken?.(payload.delta, payload.speaker);
+        } else if (event === 'done') {
+          return payload;
+        } else if (event === 'error') {
+          throw { response: { data: payload } };
+        }
+      }
+    }
+
+    throw { response: { data: { detail: '스트림이 예기치 않게 종료되었습니다' } } };
+  },
+
+  // 다음 사용자 차례(또는 라운드 끝)까지 AI 차례를 한 번에 진행
+  advanceTurns: async (sessionId, cursor = null, stopAtRoundEnd = true) => {
+    const response = await api.post('/talk/advance', {
+      session_id: sessionId,
+      cursor: cursor,
+      stop_at_round_end: stopAtRoundEnd,
     });
     return response.data;
   },
@@ -46,11 +110,77 @@ export const gameAPI = {
     return response.data;
   },
 
-  // 게임 상태 조회
-  getStatus: async (sessionId) => {
-    const response = await api.get(`/status/${sessionId}`);
+  // 백그라운드 사회자 멘트 조회 (wait초까지 생성 완료 대기)
+  getHostComment: async (sessionId, wait = 5) => {
+    const response = await api.get(`/host-comment/${sessionId}`, {
+      params: { wait },
+    });
     return response.data;
   },
+
+  // 게임 상태 조회 (cursor를 주면 이후 메시지만)
+  getStatus: async (sessionId, cursor = null) => {
+    const response = await api.get(`/status/${sessionId}`, {
+      params: cursor === null ? {} : { cursor },
+    });
+    return response.data;
+  },
+
+  // 게임 이벤트 채널 (WebSocket) - 이벤트마다 onEvent({ id, type, data }) 호출
+  // 연결이 끊기면 마지막으로 받은 이벤트 ID부터 이어받도록 자동 재연결 (close()로 종료)
+  connectGameChannel: (sessionId, onEvent, { reconnectDelay = 1000 } = {}) => {
+    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+    let socket = null;
+    let lastEventId = null;
+    let closed = false;
+    const pending = [];
+
+    const connect = () => {
+      const params = lastEventId === null ? '' : `?last_event_id=${lastEventId}`;
+      socket = new WebSocket(`${protocol}//${window.location.host}${API_BASE_URL}/ws/${sessionId}${params}`);
+
+      socket.onopen = () => {
+        // 끊겨 있는 동안 보낸 입력 전송
+        while (pending.length > 0) socket.send(pending.shift());
+      };
+
+      socket.onmessage = (message) => {
+        const event = JSON.parse(message.data);
+        if (event.id !== null) lastEventId = event.id;
+        onEvent(event);
+      };
+
+      socket.onclose = (event) => {
+        // 4404: 세션이 없거나 만료됨 (재연결하지 않음)
+        if (closed || event.code === 4404) {
+          if (!closed) onEvent({ id: null, type: 'closed', data: { code: event.code, reason: event.reason } });
+          return;
+        }
+        setTimeout(connect, reconnectDelay);
+      };
+    };
+
+    const send = (move) => {
+      const text = JSON.stringify(move);
+      if (socket?.readyState === WebSocket.OPEN) socket.send(text);
+      else pending.push(text);
+    };
+
+    connect();
+
+    return {
+      // 사용자 발언 (이어지는 AI 차례는 서버가 바로 진행하여 이벤트로 전달)
+      talk: (userMessage) => send({ type: 'talk', user_message: userMessage }),
+      // 다음 사용자 차례 또는 라운드 끝까지 AI 차례 진행
+      advance: () => send({ type: 'advance' }),
+      vote: (userVote) => send({ type: 'vote', user_vote: userVote }),
+      liarGuess: (guess = '') => send({ type: 'liar_guess', guess }),
+      close: () => {
+        closed = true;
+        socket?.close();
+      },
+    };
+  },
 };
 
 export default api;
@@ -9,6 +9,7 @@ export default defineConfig({
       '/api': {
         target: 'http://localhost:8000',
         changeOrigin: true,
+        ws: true,  // /api/ws/{session_id} 게임 이벤트 채널
         rewrite: (path) => path.replace(/^\/api/, ''),
       },
     },
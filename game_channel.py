@@ -0,0 +1,129 @@
+"""
+세션별 게임 이벤트 채널 (WebSocket 푸시)
+
+세션에 WebSocket이 처음 연결될 때 채널을 만들고, 이후 상태 변경(발언, 턴 진행, 사회자 멘트,
+투표/역전 승부 결과)을 이벤트로 발행하여 연결된 모든 구독자에게 바로 전달합니다.
+
+- 이벤트 ID는 채널마다 1부터 증가하며, 최근 buffer_size개를 보관하여 재연결 시
+  마지막으로 받은 ID 이후 이벤트만 다시 보냅니다 (보관 범위를 벗어나면 전체 상태로 재동기화)
+- 이벤트는 발행할 때 한 번만 JSON으로 직렬화하고 구독자에게는 같은 문자열을 보냄
+- 채널이 없는(WebSocket을 쓰지 않는) 세션의 발행은 아무 비용 없이 무시
+
+이벤트 형식:
+    {"id": 12, "type": "message", "data": {...}}
+"""
+import asyncio
+import json
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# 구독자에게 채널 종료(세션 삭제/만료)를 알리는 값
+CHANNEL_CLOSED = None
+
+
+class SessionChannel:
+    """세션 하나의 이벤트 버퍼와 구독자 큐"""
+
+    __slots__ = ("events", "last_id", "subscribers")
+
+    def __init__(self, buffer_size: int):
+        self.events: deque = deque(maxlen=buffer_size)  # (이벤트 ID, 직렬화된 이벤트)
+        self.last_id = 0
+        self.subscribers: set = set()
+
+
+class GameChannelHub:
+    """세션별 이벤트 채널 모음"""
+
+    def __init__(self, buffer_size: int = 256):
+        """
+        Args:
+            buffer_size: 재연결 이어받기용으로 세션마다 보관할 최근 이벤트 수
+        """
+        self.buffer_size = buffer_size
+        self._channels: Dict[str, SessionChannel] = {}
+        self.stats_counters = {"published": 0, "resumed": 0, "resynced": 0}
+
+    def publish(self, session_id: str, event_type: str, data: dict) -> Optional[int]:
+        """
+        이벤트 발행 (채널이 없으면 무시)
+
+        Returns:
+            Optional[int]: 발행된 이벤트 ID (채널이 없으면 None)
+        """
+        channel = self._channels.get(session_id)
+        if channel is None:
+            return None
+        channel.last_id += 1
+        text = json.dumps(
+            {"id": channel.last_id, "type": event_type, "data": data}, ensure_ascii=False, separators=(",", ":")
+        )
+        channel.events.append((channel.last_id, text))
+        for queue in channel.subscribers:
+            queue.put_nowait(text)
+        self.stats_counters["published"] += 1
+        return channel.last_id
+
+    def reset(self, session_id: str, event_type: str, data: dict) -> Optional[int]:
+        """
+        채널의 이벤트 버퍼를 비우고 새 상태 이벤트 발행 (같은 세션 ID로 새 게임 시작, 채널이 없으면 무시)
+
+        이벤트 ID는 이어서 증가하므로 이전 게임의 ID로 재연결하면 이어받지 않고 재동기화됩니다.
+
+        Returns:
+            Optional[int]: 발행된 이벤트 ID (채널이 없으면 None)
+        """
+        channel = self._channels.get(session_id)
+        if channel is None:
+            return None
+        channel.events.clear()
+        return self.publish(session_id, event_type, data)
+
+    def subscribe(
+        self, session_id: str, last_event_id: Optional[int] = None
+    ) -> Tuple[asyncio.Queue, Optional[List[str]], int]:
+        """
+        구독 시작
+
+        last_event_id 이후 이벤트가 모두 버퍼에 남아 있으면 그 이벤트 목록을, 아니면(첫 연결,
+        보관 범위 초과, 새로 만든 채널) None을 돌려주며 이때는 호출한 쪽이 전체 상태를 보내야 합니다.
+        await 없이 실행되므로 돌려받은 마지막 ID와 이후 큐로 들어오는 이벤트 사이에 빈틈이 없습니다.
+
+        Returns:
+            Tuple[asyncio.Queue, Optional[List[str]], int]: (이벤트 큐, 다시 보낼 이벤트, 현재 마지막 이벤트 ID)
+        """
+        replay = None
+        channel = self._channels.get(session_id)
+        if channel is None:
+            # 새 채널이면 이전 ID는 의미가 없으므로(서버 재시작 등) 항상 재동기화
+            channel = self._channels[session_id] = SessionChannel(self.buffer_size)
+        elif last_event_id is not None and last_event_id <= channel.last_id:
+            oldest = channel.events[0][0] if channel.events else channel.last_id + 1
+            if last_event_id >= oldest - 1:
+                replay = [text for event_id, text in channel.events if event_id > last_event_id]
+
+        self.stats_counters["resumed" if replay is not None else "resynced"] += 1
+        queue: asyncio.Queue = asyncio.Queue()
+        channel.subscribers.add(queue)
+        return queue, replay, channel.last_id
+
+    def unsubscribe(self, session_id: str, queue: asyncio.Queue):
+        """구독 종료 (채널과 이벤트 버퍼는 재연결을 위해 세션이 제거될 때까지 유지)"""
+        channel = self._channels.get(session_id)
+        if channel is not None:
+            channel.subscribers.discard(queue)
+
+    def discard(self, session_id: str):
+        """제거된 세션의 채널 정리 (연결된 구독자에게 종료 알림)"""
+        channel = self._channels.pop(session_id, None)
+        if channel is not None:
+            for queue in channel.subscribers:
+                queue.put_nowait(CHANNEL_CLOSED)
+
+    def stats(self) -> Dict[str, int]:
+        """채널 지표 (채널 수, 연결 수, 발행 이벤트 수, 이어받기/재동기화 횟수)"""
+        return {
+            "channels": len(self._channels),
+            "subscribers": sum(len(channel.subscribers) for channel in self._channels.values()),
+            **self.stats_counters,
+        }
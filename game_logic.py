@@ -1,66 +1,227 @@
 """
 게임 로직 및 AI 상호작용
 """
-import random
+import asyncio
 import json
-from pathlib import Path
-from typing import Dict, List, Tuple
-from openai import OpenAI
+import random
+import time
+import weakref
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from openai.types import CompletionUsage
+from completion_cache import CompletionCache, make_cache_key
 from config import get_settings
-from models import GameState, Message, PlayerRole
+from event_log import create_event_log
+from fast_json import HistoryJsonCache
+from game_channel import GameChannelHub
+from llm_backend import LLMUnavailableError, get_llm_client
+from llm_scheduler import LLMScheduler, estimate_request_tokens
+from metrics import llm_time_to_first_token, record_llm_call
+from game_state import AI_PLAYERS, GameState
+from models import PlayerRole
+from history_window import build_summary_prompt
+from prompts import (
+    BATCH_TURN_FUNCTION_NAME,
+    BATCH_VOTE_FUNCTION_NAME,
+    VOTE_FUNCTION_NAME,
+    VOTE_TARGETS,
+    PromptCache,
+    SessionPrompts,
+    build_batch_turn_instruction,
+    build_batch_turn_tools,
+    build_batch_vote_instruction,
+    build_batch_vote_tools,
+    build_turn_instruction,
+    build_vote_instruction,
+    build_vote_tools,
+)
+from session_store import create_session_store
+from word_bank import get_word_bank
 
 # 설정 로드
 settings = get_settings()
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=settings.openai_api_key)
+# 게임 상태 저장소 (최대 세션 수 + 유휴 TTL)
+# 여러 워커로 실행할 때는 SESSION_BACKEND=sqlite로 공유 저장소 사용
+session_store = create_session_store(
+    settings.session_backend,
+    max_sessions=settings.max_sessions,
+    ttl=settings.session_ttl,
+    db_path=settings.session_db_path,
+    busy_timeout=settings.session_db_busy_timeout,
+)
+
+# 상태 변경 이벤트 로그 (memory 백엔드 재시작 복구, 비활성이면 None)
+event_log = create_event_log(
+    settings.event_log_enabled,
+    settings.session_backend,
+    settings.event_log_dir,
+    flush_interval=settings.event_log_flush_interval,
+    snapshot_interval=settings.event_log_snapshot_interval,
+)
+if event_log is not None:
+    session_store.add_evict_listener(event_log.record_delete)
+
+# 세션별 WebSocket 이벤트 채널 (연결된 적 있는 세션에만 채널이 생김)
+game_channels = GameChannelHub(buffer_size=settings.ws_event_buffer)
+session_store.add_evict_listener(game_channels.discard)
+
+# 세션별 비동기 락 (같은 세션의 상태 변경을 직렬화, 사용 중인 락만 유지)
+_session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# 세션별 백그라운드 사회자 멘트 작업 (session_id -> (턴 번호, 작업))
+host_comment_tasks: Dict[str, Tuple[int, asyncio.Task]] = {}
+
+
+def _drop_host_comment_task(session_id: str):
+    """제거된 세션의 사회자 멘트 작업 정리"""
+    entry = host_comment_tasks.pop(session_id, None)
+    if entry is not None and not entry[1].done():
+        entry[1].cancel()
+
+
+session_store.add_evict_listener(_drop_host_comment_task)
+
+# 진행 중인 기타 백그라운드 작업 (가비지 컬렉션 방지용 참조)
+_background_tasks: set = set()
+
+# 세션별 프롬프트 캐시 (역할 프롬프트 + 변환된 대화 기록)
+prompt_cache = PromptCache(max_sessions=settings.max_sessions)
+session_store.add_evict_listener(prompt_cache.discard)
+
+# 세션별 직렬화된 대화 기록 (API 응답에서 바뀌지 않은 메시지를 다시 인코딩하지 않음)
+history_json_cache = HistoryJsonCache(max_sessions=settings.history_json_cache_size)
+session_store.add_evict_listener(history_json_cache.discard)
+
+# 세션별 다음 AI 차례 선행 생성 작업 (session_id -> (대화 기록 길이, 턴 번호, AI 이름, 작업))
+speculation_tasks: Dict[str, Tuple[int, int, str, asyncio.Task]] = {}
+speculation_stats = {"scheduled": 0, "used": 0, "discarded": 0}
 
-# 게임 상태 저장소 (In-Memory)
-# 실제 배포 시에는 Redis 등의 외부 스토리지 사용 권장
-game_sessions: Dict[str, GameState] = {}
 
-# word.json 로드
-def load_word_data() -> Dict[str, List[str]]:
-    """word.json 파일에서 카테고리별 단어 목록 로드"""
-    word_file = Path(__file__).parent / "word.json"
-    with open(word_file, "r", encoding="utf-8") as f:
-        return json.load(f)
+def _drop_speculation(session_id: str):
+    """세션의 선행 생성 작업 취소 및 정리"""
+    entry = speculation_tasks.pop(session_id, None)
+    if entry is not None and not entry[3].done():
+        entry[3].cancel()
 
-def get_random_keyword() -> Tuple[str, str]:
+
+session_store.add_evict_listener(_drop_speculation)
+
+
+def _observe_speculation(task: asyncio.Task):
+    """
+    선행 생성 작업의 예외 회수
+
+    세션이 제거/교체된 뒤 실패한 작업은 아무도 await하지 않으므로
+    "Task exception was never retrieved" 경고가 남지 않도록 여기서 결과를 확인합니다.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+def _drop_stale_speculation(game: GameState):
+    """턴이 끝났을 때 현재 상태(대화 기록 길이, 턴)와 맞지 않는 선행 생성 결과 정리"""
+    entry = speculation_tasks.get(game.session_id)
+    if entry is not None and entry[:2] != (len(game.history), game.current_turn):
+        _drop_speculation(game.session_id)
+        speculation_stats["discarded"] += 1
+
+# AI 투표 지표 (요청 수, 응답 해석 실패 수, 랜덤 투표 대체 수)
+vote_stats = {"requests": 0, "parse_failures": 0, "fallbacks": 0}
+
+# batched 모드 묶음 호출 지표 (호출 수, 호출 실패/해석 실패로 대체된 횟수)
+# 발언 묶음이 실패하면 AI마다 다시 호출하므로 independent 모드보다 호출이 늘어남
+batched_stats = {"turn_calls": 0, "turn_fallbacks": 0, "vote_calls": 0, "vote_fallbacks": 0}
+
+# LLM 응답 캐시 (호출부에서 cache=True로 명시한 호출만 사용)
+completion_cache = CompletionCache(
+    max_entries=settings.completion_cache_size,
+    ttl=settings.completion_cache_ttl,
+    variants=settings.completion_cache_variants,
+)
+
+# 전역 LLM 호출 스케줄러 (동시 호출 수/분당 토큰 예산, 게임 진행 호출 우선, 세션별 공정 배정)
+llm_scheduler = LLMScheduler(
+    max_in_flight=settings.llm_max_in_flight,
+    tokens_per_minute=settings.llm_tokens_per_minute,
+)
+
+# 템플릿 기반 차례 안내 문구 (turn_announce_mode == "template")
+TURN_ANNOUNCE_TEMPLATES = [
+    "{player} 차례입니다! 주제어에 대한 힌트를 들려주세요.",
+    "자, 이번엔 {player}의 발언입니다. 라이어에게 들키지 않게 조심하세요!",
+    "{player}, 당신의 차례예요. 어떤 힌트를 줄지 기대되네요!",
+    "다음은 {player}! 모두 귀를 기울여 주세요.",
+]
+
+def get_random_keyword(category: Optional[str] = None) -> Tuple[str, str]:
     """
     랜덤 카테고리와 키워드 반환
 
+    Args:
+        category: 카테고리 (None이면 랜덤 카테고리)
+
+    Returns:
+        Tuple[str, str]: (카테고리, 키워드)
+    """
+    return get_word_bank().random_keyword(category)
+
+
+def _resolve_keyword(keyword: Optional[str], category: Optional[str]) -> Tuple[str, str]:
+    """
+    요청된 키워드/카테고리 조합을 단어장 기준으로 검증하고 확정
+
+    - 둘 다 없으면 랜덤 선택
+    - 카테고리만 있으면 해당 카테고리에서 랜덤 선택
+    - 키워드만 있으면 단어장에서 카테고리를 찾음
+    - 단어장에 있는 키워드가 다른 카테고리로 지정되면 오류
+    - 단어장에 없는 카테고리는 어느 경우든 오류
+
     Returns:
         Tuple[str, str]: (카테고리, 키워드)
     """
-    word_data = load_word_data()
-    category = random.choice(list(word_data.keys()))
-    keyword = random.choice(word_data[category])
+    word_bank = get_word_bank()
+
+    if category is not None and not word_bank.has_category(category):
+        raise ValueError(f"Unknown category: {category}")
+
+    if keyword is None:
+        return word_bank.random_keyword(category)
+
+    known_category = word_bank.category_of(keyword)
+    if category is None:
+        if known_category is None:
+            raise ValueError(f"Unknown keyword '{keyword}': category is required")
+        return known_category, keyword
+
+    if known_category is not None and not word_bank.contains(category, keyword):
+        raise ValueError(f"Keyword '{keyword}' does not belong to category '{category}'")
+
     return category, keyword
 
 
-def create_game(session_id: str, keyword: str = None, category: str = None) -> GameState:
+def create_game(
+    session_id: str, keyword: str = None, category: str = None, agent_mode: Optional[str] = None
+) -> GameState:
     """
     새 게임 생성
 
     Args:
         session_id: 세션 고유 ID
         keyword: 게임 주제어 (None이면 랜덤)
-        category: 카테고리 (keyword가 None이면 자동 설정)
+        category: 카테고리 (None이면 keyword로 자동 설정, keyword가 None이면 해당 카테고리에서 랜덤)
+        agent_mode: AI 호출 방식 (independent/batched, None이면 settings.agent_mode)
 
     Returns:
         GameState: 생성된 게임 상태
+
+    Raises:
+        ValueError: 키워드와 카테고리가 단어장과 맞지 않는 경우
     """
-    # keyword가 없으면 랜덤 선택
-    if keyword is None:
-        category, keyword = get_random_keyword()
+    # 키워드/카테고리 검증 (keyword가 없으면 랜덤 선택)
+    category, keyword = _resolve_keyword(keyword, category)
 
     # 라이어 랜덤 선정
-    ai_players = ["ai_1", "ai_2", "ai_3"]
-    liar = random.choice(ai_players)
-
-    # 역할 배정
-    ai_roles = {ai: PlayerRole.LIAR if ai == liar else PlayerRole.CIVILIAN for ai in ai_players}
+    liar = random.choice(AI_PLAYERS)
 
     # 발언 순서 랜덤 설정 (user 포함)
     all_players = ["user", "ai_1", "ai_2", "ai_3"]
@@ -72,82 +233,212 @@ def create_game(session_id: str, keyword: str = None, category: str = None) -> G
         keyword=keyword,
         category=category,
         liar=liar,
-        ai_roles=ai_roles,
-        history=[],
         turn_order=turn_order,
         current_turn=0,
-        started=True,
+        agent_mode=agent_mode or settings.agent_mode,
     )
 
-    # 저장
-    game_sessions[session_id] = game
+    # 저장 (같은 세션 ID로 다시 시작하면 이전 게임의 선행 생성 결과는 버림)
+    _drop_speculation(session_id)
+    session_store.put(game)
+    if event_log is not None:
+        event_log.record_create(game)
+
+    # 역할 프롬프트 미리 구성 (이전 게임의 직렬화된 대화 기록은 버림)
+    prompt_cache.prime(game)
+    history_json_cache.discard(session_id)
+
+    # 연결된 WebSocket에는 새 게임 전체 상태 전달 (이전 게임 이벤트는 이어받기 버퍼에서 제거)
+    game_channels.reset(session_id, "sync", game_sync_data(game))
 
     return game
 
 
+def game_sync_data(game: GameState) -> dict:
+    """게임 이벤트 채널의 전체 상태(sync) 이벤트 데이터"""
+    return {
+        "session_id": game.session_id,
+        "category": game.category,
+        "turn_order": game.turn_order,
+        "current_turn": game.current_turn,
+        "next_turn": game.turn_order[game.current_turn % len(game.turn_order)],
+        "agent_mode": game.agent_mode,
+        "history": [
+            {"speaker": speaker, "content": content, "is_host": is_host}
+            for speaker, content, is_host in game.history.entries()
+        ],
+        "cursor": len(game.history),
+    }
+
+
 def get_game(session_id: str) -> GameState:
-    """게임 상태 조회"""
-    if session_id not in game_sessions:
+    """게임 상태 조회 (없거나 만료/제거된 세션이면 ValueError)"""
+    game = session_store.get(session_id)
+    if game is None:
         raise ValueError(f"Session {session_id} not found")
-    return game_sessions[session_id]
+    return game
+
+
+def session_lock(session_id: str) -> asyncio.Lock:
+    """
+    세션별 비동기 락 반환
+
+    같은 세션에 대한 요청(턴 읽기 → LLM 호출 → 기록 저장 → 턴 증가)이 겹치지 않도록
+    이 락 안에서 처리합니다. 다른 세션은 서로 다른 락을 쓰므로 병렬로 진행됩니다.
+    락은 프로세스 단위이므로 여러 워커에서는 같은 세션 요청을 한 워커로 보내야 합니다.
+    """
+    lock = _session_locks.get(session_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _session_locks[session_id] = lock
+    return lock
+
+
+def _history_context(prompts: SessionPrompts) -> List[dict]:
+    """AI 발언/투표/추측 요청에 공통으로 넣을 대화 기록 (토큰 예산 + 최대 메시지 수 제한)"""
+    return prompts.context(settings.history_token_budget, settings.max_history_length)
 
 
-def _build_system_prompt(role: PlayerRole, keyword: str, category: str = None) -> str:
+async def _create(call_site: str, messages: List[dict], *, session_id: Optional[str] = None, **params):
     """
-    역할에 따른 시스템 프롬프트 생성
+    스트리밍이 아닌 LLM 호출 (응답 객체 그대로 반환)
 
     Args:
-        role: 플레이어 역할 (CIVILIAN or LIAR)
-        keyword: 게임 주제어
-        category: 카테고리 (라이어에게만 제공)
+        call_site: 호출 위치 이름 (지표/로그 구분, 스케줄러 우선순위 결정)
+        messages: OpenAI 메시지 목록
+        session_id: 호출한 세션 ID (스케줄러 공정 배정 단위)
+        **params: temperature, max_tokens, tools 등 생성 파라미터
 
     Returns:
-        str: 시스템 프롬프트
+        ChatCompletion: LLM 응답
     """
-    if role == PlayerRole.CIVILIAN:
-        return f"""당신은 '라이어 게임'에 참여하는 시민(Civilian) AI입니다.
+    estimated = estimate_request_tokens(messages, params.get("max_tokens"))
+    async with llm_scheduler.slot(call_site, session_id, estimated) as slot:
+        started = time.perf_counter()
+        try:
+            # 헤지로 같은 요청을 한 번 더 보내면 그만큼 토큰 예산에서 추가 차감
+            response = await get_llm_client().chat.completions.create(
+                model=settings.openai_model, messages=messages, on_hedge=slot.charge_extra, **params
+            )
+        except Exception as e:
+            record_llm_call(call_site, started, error=e)
+            raise
+        if response.usage is not None:
+            slot.used = response.usage.total_tokens
+
+    _record_usage(call_site, started, response.usage)
+    return response
+
+
+def _record_usage(call_site: str, started: float, usage):
+    """LLM 호출 지연/토큰/비용 기록"""
+    record_llm_call(
+        call_site,
+        started,
+        usage=usage,
+        prompt_cost_per_1k=settings.llm_prompt_cost_per_1k,
+        completion_cost_per_1k=settings.llm_completion_cost_per_1k,
+    )
 
-**게임 규칙:**
-- 주제어는 '{keyword}'입니다.
-- 당신은 이 주제어를 알고 있지만, 다른 AI 중 한 명은 라이어로서 주제어를 모릅니다.
-- 목표: 라이어를 찾아내는 것입니다.
 
-**발언 전략:**
-1. 주제어를 너무 직접적으로 설명하지 마세요. 라이어가 쉽게 눈치챌 수 있습니다.
-2. 하지만 너무 엉뚱한 말을 하면 동료 시민들이 당신을 의심할 수 있습니다.
-3. 주제어와 관련된 간접적인 힌트나 연상되는 표현을 사용하세요.
-4. 짧고 자연스럽게 대답하세요 (1-2문장).
-5. 이전 대화를 보고 누가 라이어인지 추리하세요.
+async def _complete(
+    call_site: str, messages: List[dict], *, session_id: Optional[str] = None, cache: bool = False, **params
+) -> str:
+    """
+    스트리밍이 아닌 LLM 호출 공통 경로
 
-**중요:** 당신은 반드시 '{keyword}'에 대해 알고 있는 사람처럼 행동해야 합니다."""
+    Args:
+        call_site: 호출 위치 이름 (지표/로그 구분, 스케줄러 우선순위 결정)
+        messages: OpenAI 메시지 목록
+        session_id: 호출한 세션 ID (스케줄러 공정 배정 단위)
+        cache: True이면 응답 캐시 사용 (입력이 몇 가지 값으로 정해지는 호출에만 사용)
+        **params: temperature, max_tokens 등 생성 파라미터
 
-    else:  # LIAR
-        return f"""당신은 '라이어 게임'에 참여하는 라이어(Liar) AI입니다.
+    Returns:
+        str: 응답 텍스트 (앞뒤 공백 제거)
+
+    Raises:
+        LLMUnavailableError: 재시도 후에도 LLM 호출이 실패했거나 모델이 빈 응답(content=None 포함)을 반환한 경우
+    """
+    use_cache = cache and settings.completion_cache_enabled
+    if use_cache:
+        key = make_cache_key(settings.openai_model, messages, params)
+        cached = completion_cache.get(key)
+        if cached is not None:
+            return cached
+
+    response = await _create(call_site, messages, session_id=session_id, **params)
+    content = (response.choices[0].message.content or "").strip()
+    if not content:
+        # 빈 응답은 실패한 호출과 같게 처리 (기록/캐시에 빈 발언이 남지 않도록)
+        raise LLMUnavailableError("모델이 빈 응답을 반환했습니다")
+
+    if use_cache:
+        completion_cache.add(key, content)
+    return content
+
+
+def schedule_history_summary(session_id: str):
+    """누적 요약 갱신을 백그라운드 작업으로 실행 (작업 참조는 완료 시까지 유지)"""
+    task = asyncio.create_task(update_history_summary(session_id))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def update_history_summary(session_id: str):
+    """
+    토큰 예산 밖으로 밀려난 대화를 누적 요약에 반영 (라운드 종료 시 1회)
+
+    이전 요약과 새로 밀려난 메시지만 LLM에 보내므로 요약 비용은 게임 길이와 무관하게 일정합니다.
+    실패하면 이전 요약을 그대로 유지합니다.
+    """
+    game = get_game(session_id)
+    prompts = prompt_cache.get(game)
+
+    upto = prompts.window_start(settings.history_token_budget, settings.max_history_length)
+    if upto <= prompts.summary_upto:
+        return
 
-**게임 규칙:**
-- 다른 플레이어들은 공통 주제어를 알고 있지만, 당신은 주제어를 모릅니다.
-- 카테고리는 '{category}'입니다. (이것만 알고 있습니다)
-- 목표: 들키지 않고 시민인 척하는 것입니다.
+    summary_prompt = build_summary_prompt(prompts.summary, prompts.history_messages[prompts.summary_upto : upto])
 
-**발언 전략:**
-1. 카테고리 '{category}' 안에서만 발언하세요. 절대 다른 카테고리의 것을 언급하지 마세요.
-2. 이전 대화에서 다른 플레이어들이 어떤 힌트를 주는지 주의깊게 관찰하세요.
-3. 해당 카테고리 내에서 일반적이고 흔한 특징이나 표현을 사용하세요.
-4. 예시:
-   - 카테고리가 '과일'이면: "달콤해", "비타민이 많아", "색깔이 예뻐" 등
-   - 카테고리가 '영화'면: "감동적이었어", "배우 연기가 좋았어", "스토리가 인상적이야" 등
-   - 카테고리가 '나라'면: "여행 가고 싶어", "문화가 독특해", "음식이 맛있어" 등
-5. 절대 "모르겠다" "잘 모르겠어" 같은 티를 내지 마세요.
-6. 확신에 차서 자연스럽게, 마치 알고 있는 것처럼 대답하세요 (1-2문장).
-7. 너무 구체적으로 특정 대상을 지목하면 틀릴 수 있으니 애매하고 일반적으로 말하세요.
+    try:
+        prompts.summary = await _complete(
+            "update_history_summary",
+            [{"role": "system", "content": summary_prompt}],
+            session_id=session_id,
+            temperature=0.3,
+            max_tokens=200,
+        )
+        prompts.summary_upto = upto
+
+    except Exception as e:
+        pass
 
-**중요:**
-- 반드시 '{category}' 카테고리 안에서만 발언하세요.
-- 주제어를 모르지만, '{category}' 중 하나에 대해 아는 척해야 합니다.
-- 다른 플레이어들의 발언을 보고 그들이 말하는 방향을 따라가세요."""
 
+def _build_ai_messages(game: GameState, ai_name: str) -> List[dict]:
+    """
+    AI 발언 생성을 위한 OpenAI 메시지 목록 구성
+
+    Args:
+        game: 게임 상태
+        ai_name: AI 이름 (ai_1, ai_2, ai_3)
 
-def generate_ai_response(session_id: str, ai_name: str) -> str:
+    Returns:
+        List[dict]: OpenAI 메시지 목록
+    """
+    prompts = prompt_cache.get(game)
+
+    # 시스템 프롬프트 (역할에 따라 다름, 게임 생성 시 한 번만 구성)
+    system_prompt = prompts.system_prompts[game.role_of(ai_name)]
+
+    # 토큰 예산 안의 최근 대화 기록만 전송하여 토큰 비용 절감 (최대 N개)
+    recent_history = _history_context(prompts)
+
+    # 고정 prefix(시스템 프롬프트 + 대화 기록) 뒤에 이번 차례 안내
+    return [{"role": "system", "content": system_prompt}, *recent_history, build_turn_instruction(ai_name)]
+
+
+async def generate_ai_response(session_id: str, ai_name: str) -> str:
     """
     특정 AI의 응답 생성 (독립적인 스레드로 동작)
 
@@ -157,138 +448,474 @@ def generate_ai_response(session_id: str, ai_name: str) -> str:
 
     Returns:
         str: AI 응답
+
+    Raises:
+        LLMUnavailableError: 재시도 후에도 LLM 호출이 실패한 경우
+            (오류 문구를 발언으로 기록하지 않도록 호출하는 쪽에서 턴을 진행하지 않아야 함)
     """
     game = get_game(session_id)
+    messages = _build_ai_messages(game, ai_name)
 
-    # 해당 AI의 역할 및 주제어
-    role = game.ai_roles[ai_name]
-    keyword = game.keyword
-    category = game.category
+    # OpenAI API 호출
+    return await _complete("generate_ai_response", messages, session_id=session_id, temperature=0.8, max_tokens=150)
 
-    # 시스템 프롬프트 생성 (역할에 따라 다름)
-    system_prompt = _build_system_prompt(role, keyword, category)
 
-    # 대화 기록을 OpenAI 메시지 형식으로 변환
-    # 최근 N개만 전송하여 토큰 비용 절감 (옵션)
-    recent_history = game.history[-settings.max_history_length :]
+async def stream_ai_response(session_id: str, ai_name: str) -> AsyncIterator[str]:
+    """
+    특정 AI의 응답을 토큰 단위로 스트리밍 생성
 
-    messages = [{"role": "system", "content": system_prompt}]
+    generate_ai_response와 같은 프롬프트를 사용하며, 대화 기록 저장은 호출하는 쪽에서
+    스트림이 끝난 뒤 전체 응답으로 한 번만 합니다. 오류는 그대로 전파됩니다.
 
-    for msg in recent_history:
-        messages.append(
-            {
-                "role": "user" if msg.speaker == "user" else "assistant",
-                "content": f"[{msg.speaker}]: {msg.content}",
-            }
-        )
+    Args:
+        session_id: 세션 ID
+        ai_name: AI 이름 (ai_1, ai_2, ai_3)
 
-    # 현재 턴 안내
-    messages.append({"role": "user", "content": f"이제 당신({ai_name})의 차례입니다. 간단히 대답하세요."})
+    Yields:
+        str: 응답 텍스트 조각
+    """
+    game = get_game(session_id)
+    messages = _build_ai_messages(game, ai_name)
+
+    # 스케줄러 자리는 스트림이 끝날 때까지 유지
+    async with llm_scheduler.slot("stream_ai_response", session_id, estimate_request_tokens(messages, 150)) as slot:
+        started = time.perf_counter()
+        first_token = True
+        usage = None
+        try:
+            # include_usage: 마지막 청크(choices 없음)에 토큰 사용량을 받음
+            stream = await get_llm_client().chat.completions.create(
+                model=settings.openai_model,
+                messages=messages,
+                temperature=0.8,
+                max_tokens=150,
+                stream=True,
+                extra_body={"stream_options": {"include_usage": True}},
+            )
+            async for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = CompletionUsage.model_validate(chunk.usage)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if first_token:
+                        llm_time_to_first_token.observe(time.perf_counter() - started, "stream_ai_response")
+                        first_token = False
+                    yield delta
+        except Exception as e:
+            record_llm_call("stream_ai_response", started, error=e)
+            raise
+
+        if usage is not None:
+            slot.used = usage.total_tokens
+    _record_usage("stream_ai_response", started, usage)
+
+
+def schedule_speculation(session_id: str):
+    """
+    다음 차례가 AI이면 그 발언을 백그라운드에서 미리 생성
 
-    # OpenAI API 호출
+    다음 AI 발언이 의존하는 대화 기록은 턴이 끝난 시점에 확정되므로, 그때의 메시지로
+    바로 생성을 시작해 두고 클라이언트가 해당 턴을 요청하면 결과를 넘겨줍니다.
+    이미 이 턴에 유효한 결과(batched 모드에서 함께 생성된 발언 등)가 있으면 그대로 둡니다.
+    """
+    game = get_game(session_id)
+    next_player = game.turn_order[game.current_turn % len(game.turn_order)]
+
+    entry = speculation_tasks.get(session_id)
+    if entry is not None and entry[:3] == (len(game.history), game.current_turn, next_player):
+        return
+
+    _drop_speculation(session_id)
+    if next_player == "user":
+        return
+
+    # 메시지는 지금 구성해야 이후 변경과 무관하게 현재 기록을 기준으로 생성됨
+    messages = _build_ai_messages(game, next_player)
+    task = asyncio.create_task(
+        _complete("speculative_ai_response", messages, session_id=session_id, temperature=0.8, max_tokens=150)
+    )
+    task.add_done_callback(_observe_speculation)
+    speculation_tasks[session_id] = (len(game.history), game.current_turn, next_player, task)
+    speculation_stats["scheduled"] += 1
+
+
+def _civilian_run(game: GameState) -> List[str]:
+    """현재 턴부터 이어지는 시민 AI 차례 목록 (사용자/라이어 차례나 라운드 끝에서 멈춤)"""
+    turn_count = len(game.turn_order)
+    ai_names = []
+    turn = game.current_turn
+    while True:
+        player = game.turn_order[turn % turn_count]
+        if player == "user" or game.role_of(player) != PlayerRole.CIVILIAN:
+            break
+        ai_names.append(player)
+        turn += 1
+        if turn % turn_count == 0:
+            break
+    return ai_names
+
+
+async def batched_ai_turn(session_id: str, ai_name: str) -> Optional[str]:
+    """
+    batched 모드에서 이번 차례부터 이어지는 시민 AI 발언을 한 번의 호출로 생성
+
+    시민끼리는 같은 시스템 프롬프트(주제어 포함)를 쓰므로 하나의 요청에서 연속 발언을
+    함께 받고, 라이어는 주제어가 노출되지 않도록 항상 따로 호출합니다.
+    이번 차례 발언을 반환하고, 이어지는 발언은 다음 차례의 선행 생성 결과로 등록합니다.
+
+    Returns:
+        Optional[str]: 이번 차례 발언 (independent 모드, 라이어 차례, 연속 시민이 1명뿐이거나
+        호출/해석에 실패하면 None - 호출하는 쪽에서 개별 생성)
+    """
+    game = get_game(session_id)
+    if game.agent_mode != "batched" or game.role_of(ai_name) != PlayerRole.CIVILIAN:
+        return None
+
+    ai_names = _civilian_run(game)
+    if len(ai_names) < 2:
+        return None
+
+    prompts = prompt_cache.get(game)
+    messages = [
+        {"role": "system", "content": prompts.system_prompts[PlayerRole.CIVILIAN]},
+        *_history_context(prompts),
+        build_batch_turn_instruction(ai_names),
+    ]
+
+    batched_stats["turn_calls"] += 1
     try:
-        response = client.chat.completions.create(
-            model=settings.openai_model, messages=messages, temperature=0.8, max_tokens=150
+        response = await _create(
+            "batched_ai_turn",
+            messages,
+            session_id=session_id,
+            tools=build_batch_turn_tools(ai_names),
+            tool_choice={"type": "function", "function": {"name": BATCH_TURN_FUNCTION_NAME}},
+            temperature=0.8,
+            max_tokens=150 * len(ai_names),
         )
+    except Exception:
+        batched_stats["turn_fallbacks"] += 1
+        return None
+
+    arguments = _tool_arguments(response.choices[0].message, BATCH_TURN_FUNCTION_NAME) or {}
+    utterances = []
+    for name in ai_names:
+        text = arguments.get(name)
+        if not isinstance(text, str) or not text.strip():
+            break
+        utterances.append(text.strip())
+    if not utterances:
+        batched_stats["turn_fallbacks"] += 1
+        return None
+
+    # 다음 시민 차례 발언은 이번 발언이 기록된 뒤의 상태에 대한 선행 생성 결과로 등록
+    if len(utterances) > 1:
+        _drop_speculation(session_id)
+        ready = asyncio.get_running_loop().create_future()
+        ready.set_result(utterances[1])
+        speculation_tasks[session_id] = (len(game.history) + 1, game.current_turn + 1, ai_names[1], ready)
+        speculation_stats["scheduled"] += 1
+
+    return utterances[0]
+
+
+async def take_speculated_response(session_id: str, ai_name: str) -> Optional[str]:
+    """
+    미리 생성된 AI 발언 가져오기
 
-        ai_response = response.choices[0].message.content.strip()
-        return ai_response
+    생성 이후 대화 기록이나 턴이 바뀌었거나, 다른 AI를 위한 것이거나, 생성이 실패했으면
+    버리고 None을 반환합니다. 이때 호출하는 쪽에서 새로 생성해야 합니다.
+    """
+    entry = speculation_tasks.pop(session_id, None)
+    if entry is None:
+        return None
 
-    except Exception as e:
-        return f"[오류] AI 응답 생성 실패: {str(e)}"
+    history_length, turn, speculated_for, task = entry
+    game = get_game(session_id)
+    if (history_length, turn, speculated_for) != (len(game.history), game.current_turn, ai_name):
+        task.cancel()
+        speculation_stats["discarded"] += 1
+        return None
+
+    try:
+        result = await task
+    except Exception:
+        speculation_stats["discarded"] += 1
+        return None
+
+    speculation_stats["used"] += 1
+    return result
 
 
 def add_message_to_history(session_id: str, speaker: str, content: str):
     """대화 기록에 메시지 추가"""
     game = get_game(session_id)
-    game.history.append(Message(speaker=speaker, content=content))
+    game.history.append(speaker, content)
+    session_store.put(game)
+    if event_log is not None:
+        event_log.record_message(game)
+    index = len(game.history) - 1
+    game_channels.publish(session_id, "message", {"index": index, "speaker": speaker, "content": content})
+
+
+def advance_turn(session_id: str) -> GameState:
+    """
+    턴을 하나 증가시키고 저장
+
+    Returns:
+        GameState: 갱신된 게임 상태
+    """
+    game = get_game(session_id)
+    game.current_turn += 1
+    session_store.put(game)
+    if event_log is not None:
+        event_log.record_turn(game)
+    _drop_stale_speculation(game)
+    turn_count = len(game.turn_order)
+    game_channels.publish(
+        session_id,
+        "turn",
+        {
+            "current_turn": game.current_turn,
+            "next_turn": game.turn_order[game.current_turn % turn_count],
+            "round_end": game.current_turn % turn_count == 0,
+        },
+    )
+    return game
 
 
-def ai_vote(session_id: str, ai_name: str) -> str:
+async def ai_vote(session_id: str, ai_name: str) -> Tuple[str, Optional[str], bool]:
     """
     AI가 라이어를 투표
 
+    vote_structured_output이면 자기 자신을 제외한 대상만 허용하는 함수 호출로 투표를 받고,
+    아니면 자유 텍스트 응답에서 대상 이름을 찾습니다. 응답을 해석하지 못하거나 호출이
+    실패하면 랜덤 투표로 대체합니다.
+
     Args:
         session_id: 세션 ID
         ai_name: 투표하는 AI 이름
 
     Returns:
-        str: 투표 대상 (ai_1, ai_2, ai_3, user)
+        Tuple[str, Optional[str], bool]: (투표 대상 (ai_1, ai_2, ai_3, user), 투표 이유, 랜덤 투표로 대체 여부)
     """
     game = get_game(session_id)
-    role = game.ai_roles[ai_name]
-    keyword = game.keyword
+    prompts = prompt_cache.get(game)
+
+    # 투표 프롬프트 (역할별 고정) + 대화 기록 + 투표 안내
+    vote_prompt = prompts.vote_prompts[game.role_of(ai_name)]
+    messages = [{"role": "system", "content": vote_prompt}, *_history_context(prompts), build_vote_instruction(ai_name)]
 
-    # 투표 프롬프트
-    if role == PlayerRole.CIVILIAN:
-        vote_prompt = f"""당신은 시민이며 주제어는 '{keyword}'입니다.
+    vote_stats["requests"] += 1
+    try:
+        if settings.vote_structured_output:
+            response = await _create(
+                "ai_vote",
+                messages,
+                session_id=session_id,
+                tools=build_vote_tools(ai_name),
+                tool_choice={"type": "function", "function": {"name": VOTE_FUNCTION_NAME}},
+                temperature=0.7,
+                max_tokens=60,
+            )
+            vote = _parse_vote_call(response.choices[0].message, ai_name)
+        else:
+            content = await _complete("ai_vote", messages, session_id=session_id, temperature=0.7, max_tokens=10)
+            vote = _parse_vote_text(content, ai_name)
 
-지금까지의 대화를 보고, 누가 라이어(주제어를 모르는 사람)인 것 같은지 판단하세요.
+    except Exception as e:
+        vote = None
 
-**투표 대상:**
-- user (사용자)
-- ai_1
-- ai_2
-- ai_3
+    # 오류 또는 해석 실패 시: 자신이 아닌 랜덤 선택
+    if vote is None:
+        vote_stats["fallbacks"] += 1
+        return _random_vote_target(ai_name), None, True
+    return (*vote, False)
 
-**중요:** 자신({ai_name})은 투표할 수 없습니다. 반드시 다른 사람 중 한 명을 선택하세요.
 
-투표 대상의 이름만 정확히 출력하세요. (예: user, ai_1, ai_2, ai_3)"""
-    else:  # LIAR
-        vote_prompt = f"""당신은 라이어입니다. 주제어를 모르지만 들키지 않으려면 적당히 투표해야 합니다.
+def _tool_arguments(message, function_name: str) -> Optional[dict]:
+    """응답 메시지에서 지정한 함수 호출의 인자 추출 (호출이 없거나 JSON 객체가 아니면 None)"""
+    for tool_call in message.tool_calls or []:
+        if tool_call.function.name != function_name:
+            continue
+        try:
+            arguments = json.loads(tool_call.function.arguments)
+        except ValueError:
+            return None
+        return arguments if isinstance(arguments, dict) else None
+    return None
 
-지금까지의 대화를 보고, 전략적으로 투표하세요.
-- 너무 이상한 사람에게 투표하면 오히려 의심받을 수 있습니다.
-- 자연스럽게 행동하세요.
 
-**투표 대상:**
-- user (사용자)
-- ai_1
-- ai_2
-- ai_3
+def _vote_from_arguments(arguments, ai_name: str) -> Optional[Tuple[str, Optional[str]]]:
+    """투표 함수 인자({"target", "reason"})를 (투표 대상, 투표 이유)로 변환 (자신/잘못된 대상이면 None)"""
+    if not isinstance(arguments, dict):
+        return None
 
-**중요:** 자신({ai_name})은 투표할 수 없습니다. 반드시 다른 사람 중 한 명을 선택하세요.
+    target = arguments.get("target")
+    if target not in VOTE_TARGETS or target == ai_name:
+        return None
 
-투표 대상의 이름만 정확히 출력하세요. (예: user, ai_1, ai_2, ai_3)"""
+    reason = arguments.get("reason")
+    return target, reason.strip() if isinstance(reason, str) and reason.strip() else None
 
-    # 대화 기록 포함
-    messages = [{"role": "system", "content": vote_prompt}]
 
-    for msg in game.history:
-        messages.append(
-            {
-                "role": "user" if msg.speaker == "user" else "assistant",
-                "content": f"[{msg.speaker}]: {msg.content}",
-            }
-        )
+def _parse_vote_call(message, ai_name: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    투표 함수 호출 응답 해석
+
+    함수 호출이 없거나 인자가 올바르지 않으면 본문 텍스트에서 대상을 찾아봅니다.
+
+    Returns:
+        Optional[Tuple[str, Optional[str]]]: (투표 대상, 투표 이유), 해석 실패 시 None
+    """
+    vote = _vote_from_arguments(_tool_arguments(message, VOTE_FUNCTION_NAME), ai_name)
+    if vote is not None:
+        return vote
+    return _parse_vote_text(message.content or "", ai_name)
+
+
+def _parse_vote_text(text: str, ai_name: str) -> Optional[Tuple[str, Optional[str]]]:
+    """자유 텍스트 투표 응답에서 대상 이름 찾기 (자신 제외, 실패 시 None)"""
+    vote = text.strip().lower()
+    for target in VOTE_TARGETS:
+        if target in vote and target != ai_name:
+            return target, None
+
+    vote_stats["parse_failures"] += 1
+    return None
+
+
+def _random_vote_target(ai_name: str) -> str:
+    """자신을 제외한 랜덤 투표 대상 반환"""
+    return random.choice([target for target in VOTE_TARGETS if target != ai_name])
+
+
+async def _vote_group(session_id: str, ai_names: List[str]) -> Dict[str, Tuple[str, Optional[str], bool]]:
+    """AI 1명이면 개별 투표, 여러 명이면 한 번의 호출로 투표 (AI별 투표 대상, 투표 이유, 랜덤 대체 여부)"""
+    if len(ai_names) == 1:
+        return {ai_names[0]: await ai_vote(session_id, ai_names[0])}
+    return await ai_votes_batched(session_id, ai_names)
+
+
+async def ai_votes_batched(session_id: str, ai_names: List[str]) -> Dict[str, Tuple[str, Optional[str], bool]]:
+    """
+    시민 AI 여러 명의 투표를 한 번의 호출로 받기 (batched 모드)
+
+    시민끼리는 같은 투표 프롬프트(주제어 포함)와 대화 기록을 쓰므로 하나의 요청으로 묶고,
+    AI별 대상 enum에서 자기 자신을 제외합니다. 해석하지 못한 AI는 랜덤 투표로 대체합니다.
+
+    Args:
+        session_id: 세션 ID
+        ai_names: 투표하는 시민 AI 목록
 
-    messages.append({"role": "user", "content": "투표하세요. (user, ai_1, ai_2, ai_3 중 선택)"})
+    Returns:
+        Dict[str, Tuple[str, Optional[str], bool]]: AI별 (투표 대상, 투표 이유, 랜덤 투표로 대체 여부)
+    """
+    game = get_game(session_id)
+    prompts = prompt_cache.get(game)
 
+    messages = [
+        {"role": "system", "content": prompts.vote_prompts[PlayerRole.CIVILIAN]},
+        *_history_context(prompts),
+        build_batch_vote_instruction(ai_names),
+    ]
+
+    vote_stats["requests"] += len(ai_names)
+    batched_stats["vote_calls"] += 1
     try:
-        response = client.chat.completions.create(
-            model=settings.openai_model, messages=messages, temperature=0.7, max_tokens=10
+        response = await _create(
+            "ai_votes_batched",
+            messages,
+            session_id=session_id,
+            tools=build_batch_vote_tools(ai_names),
+            tool_choice={"type": "function", "function": {"name": BATCH_VOTE_FUNCTION_NAME}},
+            temperature=0.7,
+            max_tokens=60 * len(ai_names),
         )
+        arguments = _tool_arguments(response.choices[0].message, BATCH_VOTE_FUNCTION_NAME) or {}
 
-        vote = response.choices[0].message.content.strip().lower()
+    except Exception:
+        batched_stats["vote_fallbacks"] += 1
+        arguments = None
 
-        # 유효성 검사
-        valid_targets = ["user", "ai_1", "ai_2", "ai_3"]
-        for target in valid_targets:
-            if target in vote and target != ai_name:
-                return target
+    votes = {}
+    for ai_name in ai_names:
+        vote = None
+        if arguments is not None:
+            vote = _vote_from_arguments(arguments.get(ai_name), ai_name)
+            if vote is None:
+                vote_stats["parse_failures"] += 1
 
-        # 기본값: 자신이 아닌 랜덤 선택
-        candidates = [t for t in valid_targets if t != ai_name]
-        return random.choice(candidates)
+        # 오류 또는 해석 실패 시: 자신이 아닌 랜덤 선택
+        if vote is None:
+            vote_stats["fallbacks"] += 1
+            votes[ai_name] = (_random_vote_target(ai_name), None, True)
+        else:
+            votes[ai_name] = (*vote, False)
+
+    return votes
 
-    except Exception as e:
-        # 오류 시 랜덤 투표
-        candidates = ["user", "ai_1", "ai_2", "ai_3"]
-        candidates.remove(ai_name)
-        return random.choice(candidates)
 
+async def collect_ai_votes(session_id: str) -> Tuple[Dict[str, str], Dict[str, str], List[str]]:
+    """
+    AI 3명의 투표를 동시에 수집
+
+    batched 모드(구조화된 투표 사용 시)에서는 시민 AI 2명의 투표를 한 번의 호출로 받고
+    라이어만 따로 호출합니다. 각 호출은 settings.vote_timeout 안에 끝나야 하며,
+    시간을 넘기면 그 호출에 포함된 AI는 랜덤 투표로 대체합니다. 제한 시간 초과뿐 아니라 LLM 오류,
+    회로 차단, 응답 해석 실패로 랜덤 투표된 AI도 모두 대체 목록에 넣습니다.
 
-def ai_liar_guess_keyword(session_id: str) -> str:
+    Args:
+        session_id: 세션 ID
+
+    Returns:
+        Tuple[Dict[str, str], Dict[str, str], List[str]]:
+            (AI별 투표 대상, AI별 투표 이유 (있는 경우만), 랜덤 투표로 대체된 AI 목록)
+    """
+    game = get_game(session_id)
+    ai_players = ["ai_1", "ai_2", "ai_3"]
+
+    # 호출 단위로 묶은 투표 AI 목록
+    if game.agent_mode == "batched" and settings.vote_structured_output:
+        civilians = [ai_name for ai_name in ai_players if game.role_of(ai_name) == PlayerRole.CIVILIAN]
+        groups = [civilians, [game.liar]]
+    else:
+        groups = [[ai_name] for ai_name in ai_players]
+
+    results = await asyncio.gather(
+        *(asyncio.wait_for(_vote_group(session_id, group), timeout=settings.vote_timeout) for group in groups),
+        return_exceptions=True,
+    )
+
+    ai_votes = {}
+    vote_reasons = {}
+    fallback_votes = []
+    for group, result in zip(groups, results):
+        if isinstance(result, asyncio.TimeoutError):
+            for ai_name in group:
+                ai_votes[ai_name] = _random_vote_target(ai_name)
+                fallback_votes.append(ai_name)
+                vote_stats["fallbacks"] += 1
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            for ai_name, (target, reason, fallback) in result.items():
+                ai_votes[ai_name] = target
+                if reason:
+                    vote_reasons[ai_name] = reason
+                if fallback:
+                    fallback_votes.append(ai_name)
+
+    # 응답 순서를 AI 이름 순으로 유지
+    ai_votes = {ai_name: ai_votes[ai_name] for ai_name in ai_players}
+    fallback_votes.sort()
+
+    return ai_votes, vote_reasons, fallback_votes
+
+
+async def ai_liar_guess_keyword(session_id: str) -> str:
     """
     AI 라이어가 키워드를 추측
 
@@ -297,12 +924,15 @@ def ai_liar_guess_keyword(session_id: str) -> str:
 
     Returns:
         str: AI가 추측한 키워드
+
+    Raises:
+        LLMUnavailableError: 재시도 후에도 LLM 호출이 실패한 경우
     """
     game = get_game(session_id)
     category = game.category
 
-    # 대화 기록 컨텍스트
-    history_text = "\n".join([f"{msg.speaker}: {msg.content}" for msg in game.history])
+    # 대화 기록 컨텍스트 (발언/투표와 같은 토큰 예산)
+    history_text = "\n".join(msg["content"] for msg in _history_context(prompt_cache.get(game)))
 
     guess_prompt = f"""당신은 라이어 게임에서 걸린 라이어입니다. 마지막 역전 기회가 주어졌습니다!
 
@@ -323,22 +953,16 @@ def ai_liar_guess_keyword(session_id: str) -> str:
 - 카테고리가 '영화'이고 대화에서 "감동", "전쟁", "역사"라는 힌트가 있었다면 → 태극기휘날리며
 """
 
-    try:
-        response = client.chat.completions.create(
-            model=settings.openai_model,
-            messages=[
-                {"role": "system", "content": "당신은 라이어 게임의 AI 플레이어입니다. 주제어를 정확히 하나만 추측하세요."},
-                {"role": "user", "content": guess_prompt},
-            ],
-            temperature=0.8,
-        )
-
-        ai_guess = response.choices[0].message.content.strip()
-        return ai_guess
-
-    except Exception as e:
-        # 오류 시 카테고리 내 일반적인 단어 반환
-        return "오류"
+    # 실패하면 LLMUnavailableError 전파 (오류 문구를 추측으로 채점하지 않음)
+    return await _complete(
+        "ai_liar_guess_keyword",
+        [
+            {"role": "system", "content": "당신은 라이어 게임의 AI 플레이어입니다. 주제어를 정확히 하나만 추측하세요."},
+            {"role": "user", "content": guess_prompt},
+        ],
+        session_id=session_id,
+        temperature=0.8,
+    )
 
 
 def liar_guess_keyword(session_id: str, guess: str) -> dict:
@@ -370,7 +994,7 @@ def liar_guess_keyword(session_id: str, guess: str) -> dict:
     return result
 
 
-def generate_host_comment(session_id: str, context: str) -> str:
+async def generate_host_comment(session_id: str, context: str) -> str:
     """
     사회자 코멘트 생성
 
@@ -379,11 +1003,12 @@ def generate_host_comment(session_id: str, context: str) -> str:
         context: 현재 상황 (game_start, turn_announce, round_end 등)
 
     Returns:
-        str: 사회자 멘트
+        str: 사회자 멘트 (LLM 호출이 실패하면 상황별 기본 멘트)
     """
     game = get_game(session_id)
 
     if context == "game_start":
+        fallback = f"라이어 게임을 시작합니다! 카테고리는 '{game.category}'입니다. 발언 순서: {' → '.join(game.turn_order)}"
         prompt = f"""당신은 '라이어 게임'의 사회자입니다.
 
 게임이 시작되었습니다. 다음 정보를 바탕으로 게임 시작 멘트를 해주세요:
@@ -396,6 +1021,10 @@ def generate_host_comment(session_id: str, context: str) -> str:
 
     elif context == "turn_announce":
         current_player = game.turn_order[game.current_turn % len(game.turn_order)]
+        fallback = random.choice(TURN_ANNOUNCE_TEMPLATES).format(player=current_player)
+        if settings.turn_announce_mode == "template":
+            return fallback
+
         prompt = f"""당신은 '라이어 게임'의 사회자입니다.
 
 현재 차례인 플레이어({current_player})를 호명하고 발언을 독려해주세요.
@@ -404,6 +1033,7 @@ def generate_host_comment(session_id: str, context: str) -> str:
 
     elif context == "round_end":
         round_num = (game.current_turn // len(game.turn_order)) + 1
+        fallback = f"{round_num}라운드가 끝났습니다. 다음 라운드를 진행할지, 투표를 할지 정해주세요."
         prompt = f"""당신은 '라이어 게임'의 사회자입니다.
 
 {round_num}라운드가 끝났습니다.
@@ -415,13 +1045,103 @@ def generate_host_comment(session_id: str, context: str) -> str:
 
     messages = [{"role": "system", "content": prompt}]
 
+    # 게임 시작/차례 안내 멘트는 카테고리·발언 순서·플레이어로만 정해지므로 캐시
+    # (라운드 정리 멘트는 게임마다 달라야 하므로 캐시하지 않음)
+    cacheable = context in ("game_start", "turn_announce")
+
     try:
-        response = client.chat.completions.create(
-            model=settings.openai_model,
-            messages=messages,
+        return await _complete(
+            "generate_host_comment",
+            messages,
+            session_id=session_id,
+            cache=cacheable,
             temperature=0.9,
-            max_tokens=100
+            max_tokens=100,
         )
-        return response.choices[0].message.content.strip()
     except Exception as e:
-        return f"사회자: [오류] {str(e)}"
+        # 오류 문구 대신 기본 멘트 (게임 진행에는 영향 없음)
+        return fallback
+
+
+async def resolve_host_comment(session_id: str, context: str) -> Tuple[Optional[str], bool]:
+    """
+    /talk 응답에 실을 사회자 멘트 결정
+
+    host_comment_mode가 background이면 멘트를 백그라운드에서 생성하고 바로 반환합니다.
+    템플릿 차례 안내는 LLM 호출이 없으므로 항상 즉시 반환합니다.
+
+    Args:
+        session_id: 세션 ID
+        context: 현재 상황 (turn_announce, round_end 등)
+
+    Returns:
+        Tuple[Optional[str], bool]: (사회자 멘트, 백그라운드 생성 중 여부)
+    """
+    template_only = context == "turn_announce" and settings.turn_announce_mode == "template"
+
+    if settings.host_comment_mode == "background" and not template_only:
+        schedule_host_comment(session_id, context)
+        return None, True
+
+    comment = await generate_host_comment(session_id, context)
+    _publish_host_comment(session_id, context, get_game(session_id).current_turn, comment)
+    return comment, False
+
+
+def _publish_host_comment(session_id: str, context: str, turn: int, comment: str):
+    """사회자 멘트를 WebSocket 채널에 발행"""
+    game_channels.publish(session_id, "host_comment", {"context": context, "turn": turn, "content": comment})
+
+
+def schedule_host_comment(session_id: str, context: str):
+    """
+    사회자 멘트를 백그라운드 작업으로 생성
+
+    세션마다 가장 최근 턴의 작업만 유지하며, 이전 턴의 미완료 작업은 취소합니다.
+    """
+    game = get_game(session_id)
+
+    previous = host_comment_tasks.get(session_id)
+    if previous is not None and not previous[1].done():
+        previous[1].cancel()
+
+    turn = game.current_turn
+    task = asyncio.create_task(generate_host_comment(session_id, context))
+    host_comment_tasks[session_id] = (turn, task)
+
+    def _on_done(done: asyncio.Task):
+        if not done.cancelled() and done.exception() is None:
+            _publish_host_comment(session_id, context, turn, done.result())
+
+    task.add_done_callback(_on_done)
+
+
+async def get_pending_host_comment(session_id: str, wait: float = 0.0) -> Tuple[Optional[str], int, bool]:
+    """
+    백그라운드로 생성된 최신 사회자 멘트 조회
+
+    Args:
+        session_id: 세션 ID
+        wait: 멘트가 아직 생성 중일 때 기다릴 최대 시간 (초)
+
+    Returns:
+        Tuple[Optional[str], int, bool]: (사회자 멘트, 해당 턴 번호, 생성 완료 여부)
+    """
+    get_game(session_id)
+
+    entry = host_comment_tasks.get(session_id)
+    if entry is None:
+        return None, 0, False
+
+    turn, task = entry
+    if not task.done() and wait > 0:
+        # shield: 조회 쪽 타임아웃이 생성 작업 자체를 취소하지 않도록 보호
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=wait)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+
+    if not task.done() or task.cancelled():
+        return None, turn, False
+
+    return task.result(), turn, True
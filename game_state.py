@@ -0,0 +1,120 @@
+"""
+게임 상태 내부 표현
+
+세션마다 상주하는 상태이므로 Pydantic 모델 대신 __slots__ 객체로 보관합니다.
+- 대화 기록은 발언자 ID(bytearray)와 발언 내용(list) 두 병렬 배열로 저장
+- 발언자 이름은 작은 정수로 인터닝하고, AI 역할은 liar에서 계산
+Pydantic 모델(models.Message 등)로의 변환은 API 응답을 만들 때만 합니다.
+"""
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple
+
+from models import Message, PlayerRole
+
+# 인터닝된 발언자 (인덱스가 발언자 ID)
+SPEAKERS = ("user", "ai_1", "ai_2", "ai_3", "host")
+_SPEAKER_IDS = {speaker: index for index, speaker in enumerate(SPEAKERS)}
+
+# 발언자 ID의 최상위 비트: 사회자 메시지 여부
+_HOST_FLAG = 0x80
+
+AI_PLAYERS = ("ai_1", "ai_2", "ai_3")
+
+# 인터닝된 발언 순서 (순열이 24가지뿐이므로 세션끼리 같은 튜플을 공유)
+_TURN_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+class History:
+    """
+    대화 기록 (발언자 ID / 발언 내용 병렬 배열)
+
+    메시지마다 객체를 만들지 않으므로 메시지 1개의 부담은 발언 내용 문자열과
+    리스트 슬롯, 발언자 1바이트뿐입니다.
+    """
+
+    __slots__ = ("_speakers", "_contents")
+
+    def __init__(self):
+        self._speakers = bytearray()
+        self._contents: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    @classmethod
+    def from_columns(cls, speakers: str, contents: List[str]) -> "History":
+        """to_columns() 결과로 복원 (메시지별 검증 없이 배열을 그대로 사용)"""
+        history = cls.__new__(cls)
+        history._speakers = bytearray.fromhex(speakers)
+        history._contents = contents
+        return history
+
+    def to_columns(self) -> Tuple[str, List[str]]:
+        """(발언자 ID 16진 문자열, 발언 내용 목록) - 스냅샷용"""
+        return self._speakers.hex(), self._contents
+
+    def append(self, speaker: str, content: str, is_host: bool = False):
+        """
+        메시지 추가
+
+        Raises:
+            ValueError: SPEAKERS에 없는 발언자
+        """
+        speaker_id = _SPEAKER_IDS.get(speaker)
+        if speaker_id is None:
+            raise ValueError(f"Unknown speaker '{speaker}'")
+        self._speakers.append(speaker_id | _HOST_FLAG if is_host else speaker_id)
+        self._contents.append(content)
+
+    def speaker_at(self, index: int) -> str:
+        """index번째 메시지의 발언자"""
+        return SPEAKERS[self._speakers[index] & ~_HOST_FLAG]
+
+    def content_at(self, index: int) -> str:
+        """index번째 메시지의 발언 내용"""
+        return self._contents[index]
+
+    def entries(self, start: int = 0) -> Iterator[Tuple[str, str, bool]]:
+        """start번째 메시지부터 (발언자, 발언 내용, 사회자 메시지 여부)"""
+        for speaker_id, content in zip(self._speakers[start:], self._contents[start:]):
+            yield SPEAKERS[speaker_id & ~_HOST_FLAG], content, bool(speaker_id & _HOST_FLAG)
+
+    def to_messages(self, start: int = 0) -> List[Message]:
+        """API 응답용 Message 목록 (start번째 메시지부터)"""
+        return [
+            Message(speaker=speaker, content=content, is_host=is_host)
+            for speaker, content, is_host in self.entries(start)
+        ]
+
+
+@dataclass(slots=True, eq=False)
+class GameState:
+    """게임 상태 (내부 사용)"""
+
+    session_id: str
+    keyword: str
+    category: str
+    liar: str
+    turn_order: Tuple[str, ...]  # 발언 순서
+    current_turn: int = 0  # 현재 턴 인덱스
+    agent_mode: str = "independent"  # AI 호출 방식 (independent/batched)
+    history: History = field(default_factory=History)  # 대화 기록
+
+    def __post_init__(self):
+        # 세션마다 반복되는 짧은 문자열은 하나의 객체를 공유
+        self.keyword = sys.intern(self.keyword)
+        self.category = sys.intern(self.category)
+        self.liar = sys.intern(self.liar)
+        self.agent_mode = sys.intern(self.agent_mode)
+        turn_order = tuple(self.turn_order)
+        self.turn_order = _TURN_ORDERS.setdefault(turn_order, turn_order)
+
+    def role_of(self, ai_name: str) -> PlayerRole:
+        """AI의 역할"""
+        return PlayerRole.LIAR if ai_name == self.liar else PlayerRole.CIVILIAN
+
+    @property
+    def ai_roles(self) -> Dict[str, PlayerRole]:
+        """AI별 역할 {'ai_1': 'civilian', 'ai_2': 'liar', ...}"""
+        return {ai_name: self.role_of(ai_name) for ai_name in AI_PLAYERS}
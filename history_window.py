@@ -0,0 +1,77 @@
+"""
+대화 기록 윈도우 (토큰 예산 기반)
+
+AI 발언, 투표, 라이어 추측 요청이 모두 같은 크기 제한을 받도록
+최근 대화 기록을 추정 토큰 수 예산 안에서 잘라냅니다.
+잘려 나간 앞부분은 선택적으로 라운드마다 갱신되는 요약문으로 대체합니다.
+"""
+from typing import List, Optional, Sequence
+
+# 메시지 1개당 역할/구분자 등 고정 오버헤드 (토큰)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수 추정 (토크나이저 없이 빠르게)
+
+    영문/숫자는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 약 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    return (len(text) - ascii_chars) + (ascii_chars + 3) // 4 + MESSAGE_OVERHEAD_TOKENS
+
+
+def window_start(token_counts: Sequence[int], budget: int, max_messages: Optional[int] = None) -> int:
+    """
+    토큰 예산 안에 들어가는 최근 메시지 구간의 시작 인덱스
+
+    가장 최근 메시지부터 거꾸로 더해 가며 예산을 넘기 직전에서 멈춥니다.
+    최근 메시지 1개는 예산을 넘더라도 항상 포함합니다.
+
+    Args:
+        token_counts: 메시지별 추정 토큰 수
+        budget: 토큰 예산
+        max_messages: 최대 메시지 수 (None이면 제한 없음)
+
+    Returns:
+        int: 윈도우 시작 인덱스
+    """
+    start = len(token_counts)
+    lower = 0 if max_messages is None else max(0, len(token_counts) - max_messages)
+    used = 0
+    while start > lower:
+        cost = token_counts[start - 1]
+        if used + cost > budget and start < len(token_counts):
+            break
+        used += cost
+        start -= 1
+    return start
+
+
+def summary_message(summary: str) -> dict:
+    """요약문을 요청 메시지 형식으로 변환"""
+    return {"role": "system", "content": f"[이전 대화 요약]: {summary}"}
+
+
+def build_summary_prompt(previous_summary: str, messages: List[dict]) -> str:
+    """
+    누적 요약 갱신용 프롬프트
+
+    Args:
+        previous_summary: 지금까지의 요약 (없으면 빈 문자열)
+        messages: 새로 요약에 포함할 메시지 (OpenAI 메시지 형식)
+
+    Returns:
+        str: 요약 프롬프트
+    """
+    new_lines = "\n".join(msg["content"] for msg in messages)
+    return f"""라이어 게임 대화 기록을 요약합니다.
+
+**기존 요약:**
+{previous_summary or "(없음)"}
+
+**새 대화:**
+{new_lines}
+
+기존 요약에 새 대화 내용을 합쳐 3문장 이내로 요약하세요.
+각 플레이어(user, ai_1, ai_2, ai_3)가 어떤 힌트를 말했는지가 드러나야 합니다."""
@@ -0,0 +1,515 @@
+"""
+LLM 완성(completion) 백엔드
+
+설정(LLM_BACKEND)에 따라 실제 OpenAI 클라이언트 또는 오프라인 목(mock) 클라이언트를 제공합니다.
+두 클라이언트 모두 `client.chat.completions.create(...)` 형태로 호출하며 같은 응답 타입을 돌려주므로,
+게임 로직은 어떤 백엔드인지 알 필요가 없습니다.
+
+공유 클라이언트는 ResilientChatClient로 감싸져 있어 429/5xx 재시도(지터 백오프), 호출별 제한 시간,
+회로 차단기, 선택적 헤지(hedged) 요청이 모든 호출에 똑같이 적용됩니다.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from config import Settings, get_settings
+from history_window import estimate_tokens
+from metrics import Counter
+
+# 목 백엔드 응답 문구
+MOCK_UTTERANCES = [
+    "저는 이걸 떠올리면 기분이 좋아져요.",
+    "생각보다 주변에서 자주 볼 수 있는 거죠.",
+    "사람마다 호불호가 좀 갈릴 것 같아요.",
+    "어릴 때부터 익숙했던 느낌이에요.",
+    "계절에 따라 느낌이 조금 달라지는 것 같아요.",
+    "다들 한 번쯤은 경험해 봤을 거예요.",
+]
+MOCK_HOST_LINES = [
+    "자, 긴장감이 점점 올라가네요! 다음 분 발언 부탁드립니다.",
+    "흥미로운 힌트들이 나오고 있습니다. 라이어는 과연 누구일까요?",
+    "좋습니다! 모두의 발언을 잘 기억해 두세요.",
+]
+MOCK_VOTE_TARGETS = ["user", "ai_1", "ai_2", "ai_3"]
+MOCK_REASONS = ["발언이 너무 모호했어요", "힌트가 주제어와 안 맞아요", "다른 사람 말을 따라 했어요"]
+
+
+class _MockCompletions:
+    """chat.completions 자리에 들어가는 목 구현"""
+
+    def __init__(self, backend: "MockChatClient"):
+        self._backend = backend
+
+    async def create(self, *, messages: List[dict], model: str, stream: bool = False, **params):
+        return await self._backend.create(messages=messages, model=model, stream=stream, **params)
+
+
+class _MockChat:
+    def __init__(self, backend: "MockChatClient"):
+        self.completions = _MockCompletions(backend)
+
+
+class MockChatClient:
+    """
+    결정적(deterministic) 오프라인 목 클라이언트
+
+    같은 시드와 같은 메시지 목록에는 항상 같은 응답을 돌려줍니다.
+    지연 시간은 평균 ± 지터(정규분포)로, 오류는 설정한 비율로 발생시킵니다.
+    지연 시간과 오류 여부는 메시지와 무관한 별도 난수열로 정하므로 같은 요청을 재시도하거나
+    헤지 요청으로 다시 보내면 다른 지연/결과가 나올 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.3,
+        latency_jitter: float = 0.1,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        token_interval: float = 0.02,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            latency: 평균 응답 지연 (초, 스트리밍이면 첫 토큰까지)
+            latency_jitter: 지연 시간 표준편차 (초)
+            error_rate: 요청이 실패할 확률 (0~1)
+            error_status: 실패 시 HTTP 상태 코드 (429, 500 등)
+            token_interval: 스트리밍 시 토큰 간 간격 (초)
+            seed: 응답/지연/오류를 결정하는 시드
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.token_interval = token_interval
+        self.seed = seed
+        self._call_rng = random.Random(seed)
+        self.chat = _MockChat(self)
+
+    def _rng(self, messages: List[dict]) -> random.Random:
+        """메시지 내용과 시드로 결정되는 난수 생성기"""
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(str(self.seed).encode())
+        for message in messages:
+            digest.update(str(message.get("content", "")).encode("utf-8"))
+        return random.Random(int.from_bytes(digest.digest(), "big"))
+
+    def _reply(self, messages: List[dict], rng: random.Random) -> str:
+        """호출 종류(투표/추측/사회자/발언)에 맞는 목 응답 생성"""
+        first = str(messages[0].get("content", ""))
+        last = str(messages[-1].get("content", ""))
+
+        if "투표하세요" in last:
+            voter = next((name for name in MOCK_VOTE_TARGETS if f"({name})" in last), None)
+            return rng.choice([target for target in MOCK_VOTE_TARGETS if target != voter])
+        if "주제어를 정확히 하나만 추측" in first:
+            return "사과"
+        if "사회자" in first:
+            return rng.choice(MOCK_HOST_LINES)
+        if "요약" in first:
+            return "각 플레이어가 주제어에 대한 간접적인 힌트를 말했습니다."
+        return rng.choice(MOCK_UTTERANCES)
+
+    def _tool_call(self, tools: List[dict], tool_choice, rng: random.Random) -> dict:
+        """
+        함수 호출(tools) 요청에 대한 목 tool_call 생성
+
+        지정된(tool_choice) 또는 첫 번째 함수의 스키마를 보고 enum 속성은 허용 값 중에서,
+        문자열 속성은 짧은 문구로 인자를 채웁니다.
+        """
+        function = tools[0]["function"]
+        if isinstance(tool_choice, dict):
+            name = tool_choice["function"]["name"]
+            function = next(tool["function"] for tool in tools if tool["function"]["name"] == name)
+
+        arguments = self._fill_schema(function.get("parameters", {}), rng)
+        return {
+            "id": f"call_mock_{uuid.uuid4().hex[:12]}",
+            "type": "function",
+            "function": {"name": function["name"], "arguments": json.dumps(arguments, ensure_ascii=False)},
+        }
+
+    def _fill_schema(self, schema: dict, rng: random.Random) -> dict:
+        """객체 스키마의 속성을 채움 (enum은 허용 값 중 하나, 중첩 객체는 재귀, 문자열은 목 문구)"""
+        arguments = {}
+        for prop, prop_schema in schema.get("properties", {}).items():
+            if "enum" in prop_schema:
+                arguments[prop] = rng.choice(prop_schema["enum"])
+            elif prop_schema.get("type") == "object":
+                arguments[prop] = self._fill_schema(prop_schema, rng)
+            elif prop_schema.get("type") == "string":
+                arguments[prop] = rng.choice(MOCK_REASONS if prop == "reason" else MOCK_UTTERANCES)
+        return arguments
+
+    def _raise_error(self):
+        request = httpx.Request("POST", "http://mock-llm/v1/chat/completions")
+        response = httpx.Response(self.error_status, request=request)
+        if self.error_status == 429:
+            raise openai.RateLimitError("mock rate limit", response=response, body=None)
+        raise openai.InternalServerError("mock server error", response=response, body=None)
+
+    async def create(self, *, messages: List[dict], model: str, stream: bool = False, **params):
+        rng = self._rng(messages)
+        await asyncio.sleep(max(0.0, self._call_rng.gauss(self.latency, self.latency_jitter)))
+
+        if self._call_rng.random() < self.error_rate:
+            self._raise_error()
+
+        tools = params.get("tools")
+        if tools and not stream:
+            tool_call = self._tool_call(tools, params.get("tool_choice"), rng)
+            reply = {"role": "assistant", "content": None, "tool_calls": [tool_call]}
+            content = tool_call["function"]["arguments"]
+            finish_reason = "tool_calls"
+        else:
+            content = self._reply(messages, rng)
+            reply = {"role": "assistant", "content": content}
+            finish_reason = "stop"
+
+        if stream:
+            stream_options = params.get("extra_body", {}).get("stream_options", {})
+            return self._stream(content, model, messages if stream_options.get("include_usage") else None)
+
+        return ChatCompletion.model_validate(
+            {
+                "id": f"chatcmpl-mock-{uuid.uuid4().hex[:12]}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {"index": 0, "message": reply, "finish_reason": finish_reason}
+                ],
+                "usage": self._usage(messages, content),
+            }
+        )
+
+    async def _stream(
+        self, content: str, model: str, usage_messages: List[dict] = None
+    ) -> AsyncIterator[ChatCompletionChunk]:
+        """어절 단위로 나눈 응답을 chat.completion.chunk로 스트리밍 (usage_messages가 있으면 마지막에 사용량 청크)"""
+        completion_id = f"chatcmpl-mock-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        words = content.split(" ")
+        for index, word in enumerate(words):
+            token = word if index == len(words) - 1 else word + " "
+            yield ChatCompletionChunk.model_validate(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                }
+            )
+            await asyncio.sleep(self.token_interval)
+
+        if usage_messages is not None:
+            yield ChatCompletionChunk.model_validate(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [],
+                    "usage": self._usage(usage_messages, content),
+                }
+            )
+
+    @staticmethod
+    def _usage(messages: List[dict], content: str) -> dict:
+        """추정 토큰 수로 계산한 usage"""
+        prompt_tokens = sum(estimate_tokens(str(message.get("content", ""))) for message in messages)
+        completion_tokens = estimate_tokens(content)
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    async def close(self):
+        """AsyncOpenAI와 같은 인터페이스 (정리할 자원 없음)"""
+
+
+class LLMUnavailableError(Exception):
+    """재시도 후에도 LLM 호출이 실패했거나, 회로 차단기가 열려 있어 호출하지 않음"""
+
+
+# 복원력 계층 지표 (GET /metrics)
+llm_retries = Counter("llm_retries_total", "LLM 호출 재시도 횟수", ("error",))
+llm_hedges = Counter("llm_hedged_requests_total", "지연으로 추가 발송한 헤지 요청 수", ("winner",))
+llm_circuit_rejections = Counter("llm_circuit_rejections_total", "회로 차단기가 열려 있어 거부한 호출 수")
+
+
+def is_retryable(error: BaseException) -> bool:
+    """재시도할 만한 오류인지 (429, 5xx, 연결 오류, 제한 시간 초과)"""
+    if isinstance(error, (asyncio.TimeoutError, openai.APIConnectionError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 회로 차단기
+
+    - closed: 정상 호출, 재시도할 만한 오류가 failure_threshold번 연속되면 open
+    - open: reset_timeout 동안 호출 없이 즉시 실패
+    - half_open: reset_timeout이 지나면 시험 호출 1건만 허용, 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지 (half_open에서는 시험 호출 1건만 허용)"""
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = "half_open"
+            self._trial_in_flight = False
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self):
+        self.state = "closed"
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def release_trial(self):
+        """결과 없이 끝난 시험 호출 반납 (호출한 쪽이 취소한 경우, 다음 호출이 다시 시험)"""
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, float]:
+        """회로 상태 지표 (open 여부, 연속 실패 수)"""
+        return {"open": int(self.state != "closed"), "consecutive_failures": self.failures}
+
+
+class _ResilientCompletions:
+    def __init__(self, client: "ResilientChatClient"):
+        self._client = client
+
+    async def create(self, **params):
+        return await self._client.create(**params)
+
+
+class _ResilientChat:
+    def __init__(self, client: "ResilientChatClient"):
+        self.completions = _ResilientCompletions(client)
+
+
+class ResilientChatClient:
+    """
+    LLM 클라이언트 복원력 래퍼 (AsyncOpenAI/MockChatClient와 같은 호출 형태)
+
+    - 429/5xx/연결 오류/제한 시간 초과는 지터를 준 지수 백오프로 max_retries번까지 재시도
+      (Retry-After 헤더가 있으면 그 시간 이상 대기)
+    - 호출마다 timeout초 제한 (create(..., timeout=초)로 호출별 지정 가능, 스트리밍은 스트림 시작까지)
+    - 회로 차단기가 열려 있으면 호출 없이 바로 LLMUnavailableError
+    - hedge_delay > 0이면 스트리밍이 아닌 호출이 그 시간 안에 끝나지 않을 때 같은 요청을 하나 더 보내
+      먼저 성공한 응답을 사용 (꼬리 지연 감소, 그만큼 토큰 비용 증가,
+      create(..., on_hedge=함수)로 추가 발송 시점을 알림받아 토큰 예산에 반영 가능)
+
+    재시도할 수 없는 오류(400, 401 등)는 그대로 전파하고, 재시도 후에도 실패하면 LLMUnavailableError로 감쌉니다.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_retries: int = 2,
+        backoff_base: float = 0.25,
+        backoff_max: float = 4.0,
+        timeout: float = 20.0,
+        hedge_delay: float = 0.0,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self._client = client
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.hedge_delay = hedge_delay
+        self.breaker = breaker or CircuitBreaker()
+        self.chat = _ResilientChat(self)
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        """full jitter 지수 백오프 (Retry-After가 더 길면 그 값)"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.backoff_max))
+            except ValueError:
+                pass
+        return delay
+
+    async def create(
+        self, *, timeout: Optional[float] = None, on_hedge: Optional[Callable[[], None]] = None, **params
+    ):
+        if not self.breaker.allow():
+            llm_circuit_rejections.inc()
+            raise LLMUnavailableError("LLM 호출 차단 중 (회로 차단기 열림)")
+
+        # half_open에서 허용된 호출은 시험 호출 1건
+        trial = self.breaker.state == "half_open"
+        return await self._create_with_retries(timeout or self.timeout, params, on_hedge, trial)
+
+    async def _create_with_retries(
+        self, timeout: float, params: dict, on_hedge: Optional[Callable[[], None]], trial: bool
+    ):
+        """
+        재시도 루프 (trial: 이 호출이 half_open 시험 자리를 잡고 있는지)
+
+        성공/재시도할 만한 실패는 회로에 기록하고, 결과를 기록하지 못하고 끝나면(재시도할 수 없는 오류,
+        투표 제한 시간/선행 생성 폐기/SSE 연결 끊김 등의 취소) 잡고 있던 시험 자리만 반납합니다.
+        """
+        attempt = 0
+        try:
+            while True:
+                try:
+                    if self.hedge_delay > 0 and not params.get("stream"):
+                        response = await asyncio.wait_for(self._hedged(params, on_hedge), timeout)
+                    else:
+                        response = await asyncio.wait_for(self._client.chat.completions.create(**params), timeout)
+                except Exception as e:
+                    if not is_retryable(e):
+                        # 요청 자체의 문제(400, 422 등)는 제공자 회복 여부를 알려주지 않으므로 회로 상태는 그대로 둠
+                        raise
+
+                    self.breaker.record_failure()
+                    trial = False
+                    if attempt >= self.max_retries or not self.breaker.allow():
+                        raise LLMUnavailableError(f"LLM 호출 실패: {type(e).__name__}: {e}") from e
+                    trial = self.breaker.state == "half_open"
+
+                    llm_retries.inc(type(e).__name__)
+                    await asyncio.sleep(self._backoff(attempt, e))
+                    attempt += 1
+                    continue
+
+                self.breaker.record_success()
+                return response
+        except BaseException:
+            if trial:
+                self.breaker.release_trial()
+            raise
+
+    async def _hedged(self, params: dict, on_hedge: Optional[Callable[[], None]] = None):
+        """hedge_delay 안에 응답이 없으면 같은 요청을 하나 더 보내고 먼저 성공한 응답 반환"""
+        primary = asyncio.ensure_future(self._client.chat.completions.create(**params))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay)
+            hedged = not done
+            if hedged:
+                tasks.add(asyncio.ensure_future(self._client.chat.completions.create(**params)))
+                if on_hedge is not None:
+                    on_hedge()
+
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if hedged:
+                            llm_hedges.inc("primary" if task is primary else "hedge")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def close(self):
+        await self._client.close()
+
+
+def create_llm_client(settings: Settings):
+    """
+    설정에 맞는 LLM 클라이언트 생성
+
+    Args:
+        settings: 애플리케이션 설정
+
+    Returns:
+        ResilientChatClient: AsyncOpenAI 또는 MockChatClient를 감싼 클라이언트
+    """
+    if settings.llm_backend == "mock":
+        client = MockChatClient(
+            latency=settings.mock_latency,
+            latency_jitter=settings.mock_latency_jitter,
+            error_rate=settings.mock_error_rate,
+            error_status=settings.mock_error_status,
+            seed=settings.mock_seed,
+        )
+    else:
+        # 모든 요청이 하나의 커넥션 풀을 공유하여 이벤트 루프를 막지 않고 keep-alive 연결을 재사용
+        # (재시도는 ResilientChatClient가 담당하므로 SDK 자체 재시도는 끔)
+        client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url,
+            max_retries=0,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.llm_max_connections,
+                    max_keepalive_connections=settings.llm_max_keepalive_connections,
+                ),
+                timeout=settings.llm_timeout,
+            ),
+        )
+
+    return ResilientChatClient(
+        client,
+        max_retries=settings.llm_max_retries,
+        backoff_base=settings.llm_backoff_base,
+        backoff_max=settings.llm_backoff_max,
+        timeout=settings.llm_call_timeout,
+        hedge_delay=settings.llm_hedge_delay,
+        breaker=CircuitBreaker(settings.llm_circuit_failure_threshold, settings.llm_circuit_reset_timeout),
+    )
+
+
+# 공유 LLM 클라이언트 (최초 사용 시 생성)
+_client = None
+
+
+def get_llm_client():
+    """공유 LLM 클라이언트 반환 (import 시점이 아니라 최초 호출 시 생성)"""
+    global _client
+    if _client is None:
+        _client = create_llm_client(get_settings())
+    return _client
+
+
+async def close_llm_client():
+    """공유 LLM 클라이언트의 커넥션 풀 정리 (서버 종료 시 호출)"""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
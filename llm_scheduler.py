@@ -0,0 +1,218 @@
+"""
+프로세스 전역 LLM 호출 스케줄러
+
+- 동시 호출 수 제한 (max_in_flight)
+- 분당 토큰 예산 (토큰 버킷, 호출 전 추정치로 차감하고 완료 후 response.usage로 정산,
+  실패/취소된 호출은 추정치를 돌려주고 헤지로 한 번 더 보낸 요청은 추정치만큼 추가 차감)
+- 우선순위: 게임 진행 호출(AI 발언/투표/추측)이 선행 생성, 사회자 멘트/요약보다 먼저 실행
+- 같은 우선순위 안에서는 세션별 라운드 로빈으로 배정하여 호출이 많은 게임이 다른 게임을 굶기지 않음
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, List, Optional
+
+from history_window import estimate_tokens
+from metrics import Histogram
+
+# 우선순위 (숫자가 작을수록 먼저)
+PRIORITY_GAMEPLAY = 0
+PRIORITY_SPECULATIVE = 1
+PRIORITY_COSMETIC = 2
+PRIORITY_NAMES = {PRIORITY_GAMEPLAY: "gameplay", PRIORITY_SPECULATIVE: "speculative", PRIORITY_COSMETIC: "cosmetic"}
+
+# 호출 위치별 우선순위 (목록에 없으면 gameplay)
+CALL_SITE_PRIORITY = {
+    "speculative_ai_response": PRIORITY_SPECULATIVE,
+    "generate_host_comment": PRIORITY_COSMETIC,
+    "update_history_summary": PRIORITY_COSMETIC,
+}
+
+llm_scheduler_wait = Histogram("llm_scheduler_wait_seconds", "LLM 호출이 스케줄러 대기열에서 기다린 시간", ("priority",))
+
+
+class _Waiter:
+    __slots__ = ("future", "tokens", "priority", "enqueued")
+
+    def __init__(self, future: asyncio.Future, tokens: int, priority: int):
+        self.future = future
+        self.tokens = tokens
+        self.priority = priority
+        self.enqueued = time.perf_counter()
+
+
+class Slot:
+    """배정된 호출 자리 (완료 후 usage를 넣어 두면 토큰 예산을 실제 사용량으로 정산)"""
+
+    __slots__ = ("reserved", "used", "extra", "_scheduler")
+
+    def __init__(self, scheduler: "LLMScheduler", reserved: int):
+        self._scheduler = scheduler
+        self.reserved = reserved
+        self.used: Optional[int] = None
+        self.extra = 0
+
+    def charge_extra(self):
+        """
+        같은 요청을 한 번 더 보낸 만큼(헤지) 추정치를 예산에서 바로 차감
+
+        응답 usage에는 먼저 끝난 요청의 사용량만 있으므로 이 차감분은 정산하지 않습니다.
+        """
+        self.extra += self.reserved
+        self._scheduler._charge(self.reserved)
+
+
+class LLMScheduler:
+    """
+    우선순위 + 세션 공정성 LLM 호출 스케줄러
+
+    대기열은 우선순위별로 세션 ID -> 대기 호출 목록(OrderedDict)이며, 배정할 때마다 가장 높은 우선순위에서
+    맨 앞 세션의 호출 하나를 꺼내고 그 세션에 남은 호출이 있으면 맨 뒤로 보냅니다.
+    """
+
+    def __init__(self, max_in_flight: int = 64, tokens_per_minute: int = 0):
+        """
+        Args:
+            max_in_flight: 동시에 실행할 최대 LLM 호출 수
+            tokens_per_minute: 분당 토큰 예산 (0 이하이면 제한 없음)
+        """
+        self.max_in_flight = max_in_flight
+        self.tokens_per_minute = tokens_per_minute
+        self.in_flight = 0
+        self._queues: Dict[int, "OrderedDict[str, Deque[_Waiter]]"] = {
+            priority: OrderedDict() for priority in PRIORITY_NAMES
+        }
+        self._tokens = float(tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        rate = self.tokens_per_minute / 60.0
+        self._tokens = min(float(self.tokens_per_minute), self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+
+    def _charge(self, tokens: int):
+        """배정 이후 추가 사용분 차감 (토큰 예산이 없으면 무시)"""
+        if self.tokens_per_minute > 0:
+            self._refill()
+            self._tokens -= tokens
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """가장 높은 우선순위에서 다음 차례 세션의 대기 호출 (꺼내지는 않음)"""
+        for priority in sorted(self._queues):
+            queue = self._queues[priority]
+            if queue:
+                return next(iter(queue.values()))[0]
+        return None
+
+    def _pop_waiter(self, waiter: _Waiter):
+        """배정한 호출을 대기열에서 빼고 그 세션을 라운드 로빈 맨 뒤로 이동"""
+        queue = self._queues[waiter.priority]
+        session_id, waiters = next(iter(queue.items()))
+        waiters.popleft()
+        del queue[session_id]
+        if waiters:
+            queue[session_id] = waiters
+
+    def _dispatch(self):
+        """자리와 토큰 예산이 허락하는 만큼 대기 호출 배정"""
+        self._timer = None
+        while self.in_flight < self.max_in_flight:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+
+            if self.tokens_per_minute > 0:
+                self._refill()
+                # 예산보다 큰 요청은 버킷이 가득 찼을 때 보냄 (영원히 막히지 않도록)
+                needed = min(waiter.tokens, self.tokens_per_minute)
+                if self._tokens < needed:
+                    delay = (needed - self._tokens) / (self.tokens_per_minute / 60.0)
+                    self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                    return
+                self._tokens -= waiter.tokens
+
+            self._pop_waiter(waiter)
+            self.in_flight += 1
+            waiter.future.set_result(None)
+            llm_scheduler_wait.observe(time.perf_counter() - waiter.enqueued, PRIORITY_NAMES[waiter.priority])
+
+    def _remove(self, session_id: str, waiter: _Waiter):
+        """취소된 대기 호출 제거"""
+        queue = self._queues[waiter.priority]
+        waiters = queue.get(session_id)
+        if waiters is not None and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del queue[session_id]
+
+    @asynccontextmanager
+    async def slot(self, call_site: str, session_id: Optional[str], estimated_tokens: int):
+        """
+        LLM 호출 자리 배정 (async with 블록 안에서 호출)
+
+        Args:
+            call_site: 호출 위치 이름 (우선순위 결정)
+            session_id: 세션 ID (공정성 단위, 없으면 공용 대기열)
+            estimated_tokens: 프롬프트 + 최대 완성 토큰 추정치 (예산 선차감)
+
+        Yields:
+            Slot: 호출 후 slot.used에 실제 사용 토큰 수를 넣으면 예산을 정산
+                (넣지 않고 정상 종료하면 추정치를 그대로 사용, 예외/취소로 끝나면 추정치를 돌려줌)
+        """
+        priority = CALL_SITE_PRIORITY.get(call_site, PRIORITY_GAMEPLAY)
+        session_key = session_id or ""
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), estimated_tokens, priority)
+        self._queues[priority].setdefault(session_key, deque()).append(waiter)
+        if self._timer is None:
+            self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 배정 직후 취소됨: 자리와 배정 때 차감한 토큰을 돌려줌
+                self.in_flight -= 1
+                if self.tokens_per_minute > 0:
+                    self._tokens += waiter.tokens
+                self._dispatch()
+            else:
+                self._remove(session_key, waiter)
+            raise
+
+        slot = Slot(self, estimated_tokens)
+        failed = False
+        try:
+            yield slot
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.in_flight -= 1
+            if self.tokens_per_minute > 0:
+                if slot.used is not None:
+                    # 추정치와 실제 사용량의 차이를 정산 (초과 사용분은 이후 호출을 늦춤)
+                    self._tokens += slot.reserved - slot.used
+                elif failed:
+                    # 응답을 받지 못한 호출(실패, 취소)은 사용량을 알 수 없으므로 추정치 반환
+                    self._tokens += slot.reserved
+            if self._timer is None:
+                self._dispatch()
+
+    def stats(self) -> Dict[str, float]:
+        """스케줄러 지표 (실행 중 호출 수, 우선순위별 대기 수, 남은 토큰 예산)"""
+        stats = {"in_flight": self.in_flight, "max_in_flight": self.max_in_flight}
+        for priority, queue in self._queues.items():
+            stats[f"queued_{PRIORITY_NAMES[priority]}"] = sum(len(waiters) for waiters in queue.values())
+        if self.tokens_per_minute > 0:
+            self._refill()
+            stats["tokens_available"] = self._tokens
+        return stats
+
+
+def estimate_request_tokens(messages: List[dict], max_tokens: Optional[int], default_completion: int = 150) -> int:
+    """요청 1건의 추정 토큰 수 (프롬프트 추정치 + 최대 완성 토큰)"""
+    prompt = sum(estimate_tokens(str(message.get("content", ""))) for message in messages)
+    return prompt + (max_tokens or default_completion)
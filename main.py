@@ -1,42 +1,103 @@
 """
 AI Liar Game - FastAPI Backend
 """
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from collections import Counter
+from pydantic import ValidationError
 
 from models import (
     GameStartRequest,
     GameStartResponse,
     TalkRequest,
     TalkResponse,
+    AdvanceRequest,
+    HostCommentResponse,
+    WordReloadResponse,
     VoteRequest,
     VoteResponse,
     LiarGuessRequest,
     LiarGuessResponse,
+    StatusResponse,
 )
 from game_logic import (
     create_game,
     get_game,
     generate_ai_response,
+    stream_ai_response,
     add_message_to_history,
-    ai_vote,
+    advance_turn,
+    schedule_history_summary,
+    schedule_speculation,
+    take_speculated_response,
+    batched_ai_turn,
+    speculation_stats,
+    vote_stats,
+    batched_stats,
+    collect_ai_votes,
     ai_liar_guess_keyword,
     liar_guess_keyword,
     generate_host_comment,
+    resolve_host_comment,
+    get_pending_host_comment,
+    session_store,
+    event_log,
+    game_channels,
+    game_sync_data,
+    completion_cache,
+    history_json_cache,
+    llm_scheduler,
+    session_lock,
 )
+from fast_json import json_response, model_json
+from game_channel import CHANNEL_CLOSED
+from game_state import GameState
+from llm_backend import LLMUnavailableError, close_llm_client, get_llm_client
+from metrics import MetricsMiddleware, render_gauges, render_metrics
+from word_bank import get_word_bank, reload_word_bank
 from config import get_settings
 
 # 설정 로드
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작/종료 시 리소스 관리"""
+    # 시작 시 단어장을 한 번 로드
+    get_word_bank()
+    # 이벤트 로그가 있으면 스냅샷 + 로그 재생으로 이전 세션 복구 후 기록 시작
+    event_log_writer = None
+    if event_log is not None:
+        event_log.recover(session_store)
+        event_log_writer = asyncio.create_task(event_log.run(session_store))
+    # 만료 세션 정리 백그라운드 작업
+    sweeper = asyncio.create_task(session_store.run_sweeper(settings.session_sweep_interval))
+    yield
+    sweeper.cancel()
+    if event_log_writer is not None:
+        event_log_writer.cancel()
+        event_log.close()
+    # 종료 시 공유 HTTP 커넥션 풀 정리
+    await close_llm_client()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="AI Liar Game API",
     description="FastAPI와 OpenAI를 활용한 라이어 게임 백엔드",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# 엔드포인트별 처리 시간 계측 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
 # CORS 설정 (프론트엔드 연동 시 필요)
 app.add_middleware(
     CORSMiddleware,
@@ -56,8 +117,12 @@ async def root():
         "endpoints": {
             "start": "/start - 게임 시작",
             "talk": "/talk - 대화 진행",
+            "talk_stream": "/talk/stream - 대화 진행 (SSE 스트리밍)",
+            "talk_advance": "/talk/advance - 다음 사용자 차례까지 AI 차례 일괄 진행",
             "vote": "/vote - 투표 및 결과",
             "status": "/status/{session_id} - 게임 상태 조회",
+            "host_comment": "/host-comment/{session_id} - 사회자 멘트 조회 (백그라운드 모드)",
+            "ws": "/ws/{session_id} - 게임 이벤트 채널 (WebSocket, 이벤트 푸시 + 사용자 입력)",
         },
     }
 
@@ -73,16 +138,22 @@ async def start_game(request: GameStartRequest):
     - 발언 순서 랜덤 설정
     """
     try:
-        game = create_game(
-            session_id=request.session_id,
-            keyword=request.keyword,
-            category=request.category
-        )
-
-        # 사회자 오프닝 멘트
-        host_comment = generate_host_comment(request.session_id, "game_start")
-
-        return GameStartResponse(
+        async with session_lock(request.session_id):
+            game = create_game(
+                session_id=request.session_id,
+                keyword=request.keyword,
+                category=request.category,
+                agent_mode=request.agent_mode,
+            )
+
+            # 첫 차례가 AI이면 오프닝 멘트와 겹쳐서 발언을 미리 생성
+            if settings.speculative_turns:
+                schedule_speculation(request.session_id)
+
+            # 사회자 오프닝 멘트
+            host_comment = await generate_host_comment(request.session_id, "game_start")
+
+        response = GameStartResponse(
             session_id=game.session_id,
             keyword=game.keyword,
             category=game.category,
@@ -90,12 +161,65 @@ async def start_game(request: GameStartRequest):
             turn_order=game.turn_order,
             message=f"게임이 시작되었습니다! 카테고리: {game.category}, 주제어: '{game.keyword}' (라이어: {game.liar})",
             host_comment=host_comment,
+            agent_mode=game.agent_mode,
         )
+        return json_response(model_json(response))
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"게임 생성 실패: {str(e)}")
 
 
+def _talk_json(game: GameState, response: TalkResponse, cursor: Optional[int]) -> bytes:
+    """TalkResponse JSON (대화 기록은 세션별 직렬화 캐시에서 cursor 이후만 이어 붙임)"""
+    return model_json(response, history_json_cache.encode(game, cursor or 0))
+
+
+async def _complete_turn(
+    session_id: str, cursor: Optional[int] = None, ai_responses: Optional[Dict[str, str]] = None
+) -> bytes:
+    """
+    발언 저장 이후 공통 처리
+
+    1. 턴 증가
+    2. 다음 차례 및 사회자 멘트 결정
+    3. 응답 JSON 구성 (cursor가 있으면 이후 메시지만)
+    """
+    # 턴 증가 (저장소에 반영된 최신 상태로 갱신)
+    game = advance_turn(session_id)
+
+    # 다음 차례 플레이어
+    next_player = game.turn_order[game.current_turn % len(game.turn_order)]
+
+    # 다음 차례가 AI이면 사회자 멘트/클라이언트 왕복과 겹쳐서 발언을 미리 생성
+    if settings.speculative_turns:
+        schedule_speculation(session_id)
+
+    # 라운드가 끝났는지 확인 (모든 플레이어가 한 번씩 발언)
+    if game.current_turn % len(game.turn_order) == 0:
+        context = "round_end"
+    else:
+        context = "turn_announce"
+    host_comment, host_comment_pending = await resolve_host_comment(session_id, context)
+
+    # 라운드가 끝나면 오래된 대화 요약을 백그라운드에서 갱신
+    if context == "round_end" and settings.history_summary_enabled:
+        schedule_history_summary(session_id)
+
+    response = TalkResponse(
+        session_id=session_id,
+        history=[],
+        cursor=len(game.history),
+        delta=cursor is not None,
+        ai_responses=ai_responses or {},
+        next_turn=next_player,
+        host_comment=host_comment,
+        host_comment_pending=host_comment_pending,
+    )
+    return _talk_json(game, response, cursor)
+
+
 @app.post("/talk", response_model=TalkResponse)
 async def talk(request: TalkRequest):
     """
@@ -106,65 +230,321 @@ async def talk(request: TalkRequest):
     3. 다음 차례 알림
     """
     try:
-        game = get_game(request.session_id)
+        # 같은 세션의 요청은 순서대로 처리 (턴 중복/누락 방지)
+        async with session_lock(request.session_id):
+            game = get_game(request.session_id)
 
-        # 현재 차례 확인
-        current_player = game.turn_order[game.current_turn % len(game.turn_order)]
+            # 현재 차례 확인
+            current_player = game.turn_order[game.current_turn % len(game.turn_order)]
 
-        # 사용자 차례인 경우
-        if current_player == "user":
-            add_message_to_history(request.session_id, "user", request.user_message)
-        else:
-            # AI 차례인 경우
-            ai_response = generate_ai_response(request.session_id, current_player)
-            add_message_to_history(request.session_id, current_player, ai_response)
+            # 사용자 차례인 경우
+            if current_player == "user":
+                add_message_to_history(request.session_id, "user", request.user_message)
+            else:
+                # AI 차례인 경우
+                await _take_ai_turn(request.session_id, current_player)
 
-        # 턴 증가
-        game.current_turn += 1
+            return json_response(await _complete_turn(request.session_id, request.cursor))
 
-        # 다음 차례 플레이어
-        next_player = game.turn_order[game.current_turn % len(game.turn_order)]
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except LLMUnavailableError as e:
+        # LLM 장애 시 턴을 진행하지 않으므로 클라이언트가 같은 요청을 다시 보내면 됨
+        raise HTTPException(status_code=503, detail=f"AI 응답 생성 실패: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"대화 처리 실패: {str(e)}")
 
-        # 라운드가 끝났는지 확인 (모든 플레이어가 한 번씩 발언)
-        host_comment = None
-        if game.current_turn % len(game.turn_order) == 0:
-            host_comment = generate_host_comment(request.session_id, "round_end")
-        else:
-            host_comment = generate_host_comment(request.session_id, "turn_announce")
 
-        return TalkResponse(
-            session_id=request.session_id,
-            history=game.history,
-            ai_responses={},  # 더 이상 한꺼번에 응답하지 않음
-            next_turn=next_player,
-            host_comment=host_comment,
-        )
+async def _take_ai_turn(session_id: str, ai_name: str) -> str:
+    """
+    AI 발언 생성 및 저장
+
+    미리 생성된 발언이 유효하면 그대로 쓰고, batched 모드이면 이어지는 시민 발언과 함께
+    한 번에 생성하며, 둘 다 아니면 이 AI만 따로 생성합니다.
+    """
+    ai_response = await take_speculated_response(session_id, ai_name)
+    if ai_response is None:
+        ai_response = await batched_ai_turn(session_id, ai_name)
+    if ai_response is None:
+        ai_response = await generate_ai_response(session_id, ai_name)
+    add_message_to_history(session_id, ai_name, ai_response)
+    return ai_response
+
+
+@app.post("/talk/advance", response_model=TalkResponse)
+async def talk_advance(request: AdvanceRequest):
+    """
+    연속된 AI 차례 일괄 진행
+
+    다음 사용자 차례(또는 stop_at_round_end이면 라운드 끝)까지 AI 차례를 한 번에 진행하고
+    새 메시지를 모두 담은 응답 하나를 반환합니다. /talk를 AI마다 호출하는 것과 결과는 같지만
+    중간 차례의 사회자 안내 멘트는 생략하고 마지막 상태에 대한 멘트만 생성합니다.
+    이미 사용자 차례이면 아무것도 진행하지 않고 현재 상태를 반환합니다.
+    """
+    try:
+        async with session_lock(request.session_id):
+            ai_responses = {}
+
+            while True:
+                game = get_game(request.session_id)
+                turn_count = len(game.turn_order)
+                current_player = game.turn_order[game.current_turn % turn_count]
+
+                if current_player == "user":
+                    response = TalkResponse(
+                        session_id=request.session_id,
+                        history=[],
+                        cursor=len(game.history),
+                        delta=request.cursor is not None,
+                        ai_responses=ai_responses,
+                        next_turn=current_player,
+                    )
+                    return json_response(_talk_json(game, response, request.cursor))
+
+                ai_responses[current_player] = await _take_ai_turn(request.session_id, current_player)
+
+                # 다음이 사용자 차례이거나 라운드가 끝나면 마지막 턴으로 처리 (사회자 멘트 포함)
+                following_turn = game.current_turn + 1
+                round_end = following_turn % turn_count == 0
+                if game.turn_order[following_turn % turn_count] == "user" or (round_end and request.stop_at_round_end):
+                    return json_response(await _complete_turn(request.session_id, request.cursor, ai_responses))
+
+                # 중간 차례는 사회자 멘트 없이 턴만 증가
+                advance_turn(request.session_id)
+                if round_end and settings.history_summary_enabled:
+                    schedule_history_summary(request.session_id)
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except LLMUnavailableError as e:
+        # LLM 장애 시 턴을 진행하지 않으므로 클라이언트가 같은 요청을 다시 보내면 됨
+        raise HTTPException(status_code=503, detail=f"AI 응답 생성 실패: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"대화 처리 실패: {str(e)}")
 
 
+def _sse(event: str, data: dict) -> str:
+    """Server-Sent Events 형식의 이벤트 문자열 생성"""
+    return _sse_json(event, json.dumps(data, ensure_ascii=False))
+
+
+def _sse_json(event: str, data: str) -> str:
+    """이미 직렬화된 JSON으로 Server-Sent Events 이벤트 문자열 생성"""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@app.post("/talk/stream")
+async def talk_stream(request: TalkRequest):
+    """
+    대화 진행 (스트리밍, Server-Sent Events)
+
+    AI 차례이면 생성되는 토큰을 바로 전달하고, 스트림이 끝난 뒤에만 대화 기록에 저장합니다.
+
+    이벤트:
+    - token: {"speaker": "ai_1", "delta": "..."} (AI 응답 조각)
+    - done: TalkResponse와 같은 형식 (턴 처리 완료)
+    - error: {"detail": "..."} (처리 실패)
+
+    발언 생성이 실패하거나 빈 응답이면 발언을 저장하지 않고 턴도 진행하지 않으므로 같은 요청을 다시 보내면 됩니다.
+    발언 저장 이후(턴 진행/사회자 멘트 단계)에 실패하면 발언은 이미 기록되어 있을 수 있으므로 /status로 확인합니다.
+    """
+    try:
+        get_game(request.session_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    async def event_stream():
+        try:
+            # 같은 세션의 요청은 순서대로 처리 (스트림이 끝나거나 끊기면 해제)
+            async with session_lock(request.session_id):
+                game = get_game(request.session_id)
+
+                # 현재 차례 확인
+                current_player = game.turn_order[game.current_turn % len(game.turn_order)]
+
+                if current_player == "user":
+                    add_message_to_history(request.session_id, "user", request.user_message)
+                else:
+                    # 미리 생성된 발언(또는 batched 모드의 묶음 생성 결과)이 있으면 한 번에 전달
+                    speculated = await take_speculated_response(request.session_id, current_player)
+                    if speculated is None:
+                        speculated = await batched_ai_turn(request.session_id, current_player)
+                    if speculated is not None:
+                        yield _sse("token", {"speaker": current_player, "delta": speculated})
+                        add_message_to_history(request.session_id, current_player, speculated)
+                    else:
+                        chunks = []
+                        async for delta in stream_ai_response(request.session_id, current_player):
+                            chunks.append(delta)
+                            yield _sse("token", {"speaker": current_player, "delta": delta})
+
+                        # 스트림이 끝까지 완료되고 내용이 있는 경우에만 저장
+                        content = "".join(chunks).strip()
+                        if not content:
+                            raise LLMUnavailableError("모델이 빈 응답을 반환했습니다")
+                        add_message_to_history(request.session_id, current_player, content)
+
+                body = await _complete_turn(request.session_id, request.cursor)
+            yield _sse_json("done", body.decode("utf-8"))
+
+        except Exception as e:
+            yield _sse("error", {"detail": f"대화 처리 실패: {str(e)}"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sync_event(game: GameState, last_event_id: int) -> str:
+    """전체 상태 이벤트 (첫 연결이거나 놓친 이벤트를 다시 보낼 수 없을 때, id는 현재 마지막 이벤트 ID)"""
+    return json.dumps({"id": last_event_id, "type": "sync", "data": game_sync_data(game)}, ensure_ascii=False)
+
+
+def _error_event(detail: str, status: int, move: Optional[str] = None) -> str:
+    """입력 처리 실패 이벤트 (해당 연결에만 보내며 이벤트 ID 없음)"""
+    data = {"detail": detail, "status": status, "move": move}
+    return json.dumps({"id": None, "type": "error", "data": data}, ensure_ascii=False)
+
+
+async def _handle_move(session_id: str, move: dict):
+    """
+    WebSocket으로 받은 사용자 입력 처리
+
+    HTTP 엔드포인트와 같은 함수를 호출하며, 결과는 상태 변경 때 발행된 이벤트로 전달됩니다.
+
+    Raises:
+        HTTPException: 엔드포인트 처리 실패
+        ValidationError: 입력 형식 오류
+        ValueError: 알 수 없는 입력 종류
+    """
+    move_type = move.get("type")
+
+    if move_type == "talk":
+        # 사용자 발언 후 라운드가 끝나지 않았으면 이어지는 AI 차례를 바로 진행
+        await talk(TalkRequest(session_id=session_id, user_message=move.get("user_message", "")))
+        game = get_game(session_id)
+        if game.current_turn % len(game.turn_order) != 0:
+            await talk_advance(AdvanceRequest(session_id=session_id))
+    elif move_type == "advance":
+        # 다음 사용자 차례 또는 라운드 끝까지 AI 차례 진행 (AI 발언은 생성되는 대로 전달)
+        await talk_advance(AdvanceRequest(session_id=session_id))
+    elif move_type == "vote":
+        await vote(VoteRequest(session_id=session_id, user_vote=move.get("user_vote", "")))
+    elif move_type == "liar_guess":
+        await liar_guess(LiarGuessRequest(session_id=session_id, guess=move.get("guess", "")))
+    else:
+        raise ValueError(f"알 수 없는 입력 종류: {move_type}")
+
+
+async def _send_events(websocket: WebSocket, queue: asyncio.Queue):
+    """구독 큐의 이벤트를 순서대로 전송 (채널이 닫히면 연결 종료)"""
+    try:
+        while True:
+            text = await queue.get()
+            if text is CHANNEL_CLOSED:
+                await websocket.close(code=4404, reason="session closed")
+                return
+            await websocket.send_text(text)
+    except Exception:
+        # 전송 실패(연결 끊김)는 수신 쪽에서 처리
+        pass
+
+
+@app.websocket("/ws/{session_id}")
+async def game_socket(websocket: WebSocket, session_id: str, last_event_id: Optional[int] = None):
+    """
+    게임 이벤트 채널 (WebSocket)
+
+    연결하면 전체 상태(sync)를 받고, 이후 상태 변경을 이벤트로 받습니다. 재연결 시
+    last_event_id에 마지막으로 받은 이벤트 ID를 주면 놓친 이벤트만 다시 받습니다
+    (버퍼 범위를 벗어났으면 sync부터 다시 받음).
+    HTTP로 진행한 변경도 같은 채널로 전달됩니다.
+
+    이벤트 ({"id": ..., "type": ..., "data": ...}):
+    - sync: 전체 상태 (대화 기록, 발언 순서, 현재 턴, 다음 차례)
+    - message: {"index", "speaker", "content"} (발언 저장)
+    - turn: {"current_turn", "next_turn", "round_end"} (턴 진행)
+    - host_comment: {"context", "turn", "content"} (사회자 멘트)
+    - vote_result: VoteResponse, liar_guess_result: LiarGuessResponse
+    - error: {"detail", "status", "move"} (입력 처리 실패, 이 연결에만 전송)
+
+    입력 (JSON):
+    - {"type": "talk", "user_message": "..."}: 사용자 발언 후 이어지는 AI 차례 자동 진행
+    - {"type": "advance"}: 다음 사용자 차례 또는 라운드 끝까지 AI 차례 진행
+    - {"type": "vote", "user_vote": "ai_2"}
+    - {"type": "liar_guess", "guess": "..."}
+
+    연결이 끊겨도 처리 중인 입력은 끝까지 진행되며 결과는 재연결 시 이어받습니다.
+    """
+    await websocket.accept()
+    try:
+        game = get_game(session_id)
+    except ValueError as e:
+        await websocket.close(code=4404, reason=str(e))
+        return
+
+    # 구독과 sync 구성 사이에 await가 없으므로 sync 이후 이벤트는 빠짐없이 큐로 들어옴
+    queue, replay, last_id = game_channels.subscribe(session_id, last_event_id)
+    for text in replay if replay is not None else [_sync_event(game, last_id)]:
+        queue.put_nowait(text)
+    sender = asyncio.create_task(_send_events(websocket, queue))
+
+    try:
+        while True:
+            text = await websocket.receive_text()
+            move_type = None
+            try:
+                move = json.loads(text)
+                if not isinstance(move, dict):
+                    raise ValueError("입력은 JSON 객체여야 합니다")
+                move_type = move.get("type")
+                await _handle_move(session_id, move)
+            except HTTPException as e:
+                queue.put_nowait(_error_event(e.detail, e.status_code, move_type))
+            except (ValueError, ValidationError) as e:
+                # JSON 해석 실패, 알 수 없는 입력 종류, 필드 형식 오류
+                queue.put_nowait(_error_event(f"잘못된 입력: {e}", 400, move_type))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        game_channels.unsubscribe(session_id, queue)
+        sender.cancel()
+
+
+@app.get("/host-comment/{session_id}", response_model=HostCommentResponse)
+async def host_comment(session_id: str, wait: float = Query(0.0, ge=0.0, le=30.0)):
+    """
+    백그라운드 사회자 멘트 조회
+
+    host_comment_mode가 background일 때 /talk 이후 생성된 멘트를 가져옵니다.
+    wait초 동안 생성 완료를 기다립니다.
+    """
+    try:
+        comment, turn, ready = await get_pending_host_comment(session_id, wait)
+
+        response = HostCommentResponse(session_id=session_id, host_comment=comment, turn=turn, ready=ready)
+        return json_response(model_json(response))
+
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @app.post("/vote", response_model=VoteResponse)
 async def vote(request: VoteRequest):
     """
     투표 및 게임 결과
 
     1. 사용자 투표 수신
-    2. AI 3명이 각각 투표
+    2. AI 3명이 동시에 투표
     3. 결과 집계 및 승패 판정
     """
     try:
         game = get_game(request.session_id)
 
-        # 1. AI 투표 수집
-        ai_votes = {}
-        ai_players = ["ai_1", "ai_2", "ai_3"]
-
-        for ai_name in ai_players:
-            vote_target = ai_vote(request.session_id, ai_name)
-            ai_votes[ai_name] = vote_target
+        # 1. AI 투표 수집 (3명 동시 진행, 제한 시간 초과 시 랜덤 투표)
+        ai_votes, vote_reasons, fallback_votes = await collect_ai_votes(request.session_id)
 
         # 2. 득표 집계
         all_votes = [request.user_vote] + list(ai_votes.values())
@@ -183,7 +563,7 @@ async def vote(request: VoteRequest):
         else:
             result = "라이어 승리! 라이어가 끝까지 살아남았습니다."
 
-        return VoteResponse(
+        response = VoteResponse(
             session_id=request.session_id,
             user_vote=request.user_vote,
             ai_votes=ai_votes,
@@ -191,7 +571,11 @@ async def vote(request: VoteRequest):
             result=result,
             vote_counts=vote_counts,
             liar_caught=liar_caught,
+            ai_vote_reasons=vote_reasons,
+            fallback_votes=fallback_votes,
         )
+        game_channels.publish(request.session_id, "vote_result", response.model_dump(mode="json"))
+        return json_response(model_json(response))
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -210,52 +594,135 @@ async def liar_guess(request: LiarGuessRequest):
         # guess가 비어있으면 AI 라이어가 자동으로 추측
         guess = request.guess
         if not guess or guess.strip() == "":
-            guess = ai_liar_guess_keyword(request.session_id)
+            guess = await ai_liar_guess_keyword(request.session_id)
 
         result = liar_guess_keyword(request.session_id, guess)
 
-        return LiarGuessResponse(
+        response = LiarGuessResponse(
             session_id=request.session_id,
             guess=result["guess"],
             correct=result["correct"],
             keyword=result["keyword"],
             result=result["result"],
         )
+        game_channels.publish(request.session_id, "liar_guess_result", response.model_dump(mode="json"))
+        return json_response(model_json(response))
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except LLMUnavailableError as e:
+        # LLM 장애 시 턴을 진행하지 않으므로 클라이언트가 같은 요청을 다시 보내면 됨
+        raise HTTPException(status_code=503, detail=f"AI 응답 생성 실패: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"역전 승부 처리 실패: {str(e)}")
 
 
-@app.get("/status/{session_id}")
-async def get_status(session_id: str):
+@app.get("/status/{session_id}", response_model=StatusResponse)
+async def get_status(session_id: str, cursor: Optional[int] = Query(None, ge=0)):
     """
     게임 상태 조회
 
-    - 현재 대화 기록
+    - 현재 대화 기록 (cursor를 주면 cursor 이후 메시지만)
     - AI 역할 (디버깅용)
     - 발언 순서 및 현재 차례
     """
     try:
         game = get_game(session_id)
 
-        return {
-            "session_id": game.session_id,
-            "keyword": game.keyword,
-            "category": game.category,
-            "liar": game.liar,
-            "ai_roles": game.ai_roles,
-            "history": game.history,
-            "total_messages": len(game.history),
-            "turn_order": game.turn_order,
-            "current_turn": game.current_turn,
-        }
+        response = StatusResponse(
+            session_id=game.session_id,
+            keyword=game.keyword,
+            category=game.category,
+            liar=game.liar,
+            ai_roles=game.ai_roles,
+            history=[],
+            cursor=len(game.history),
+            delta=cursor is not None,
+            total_messages=len(game.history),
+            turn_order=game.turn_order,
+            current_turn=game.current_turn,
+        )
+        return json_response(model_json(response, history_json_cache.encode(game, cursor or 0)))
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@app.get("/sessions/stats")
+async def session_stats():
+    """세션 저장소 지표 (현재 세션 수, LRU/TTL 제거 횟수)"""
+    return session_store.stats()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Prometheus 텍스트 포맷 지표
+
+    엔드포인트별 처리 시간, LLM 호출 위치별 지연/토큰/비용/오류와
+    세션 저장소·응답 캐시·투표·선행 생성·LLM 스케줄러 지표를 함께 출력합니다.
+    """
+    return render_metrics(
+        [
+            render_gauges("liargame_sessions", "세션 저장소 지표", session_store.stats()),
+            render_gauges("liargame_completion_cache", "LLM 응답 캐시 지표", completion_cache.stats()),
+            render_gauges("liargame_votes", "AI 투표 지표", vote_stats),
+            render_gauges("liargame_batched", "batched 모드 묶음 호출/대체 지표", batched_stats),
+            render_gauges("liargame_speculation", "다음 AI 차례 선행 생성 지표", speculation_stats),
+            render_gauges("liargame_llm_circuit", "LLM 회로 차단기 상태", get_llm_client().breaker.stats()),
+            render_gauges("liargame_llm_scheduler", "LLM 스케줄러 실행/대기 호출 수", llm_scheduler.stats()),
+            render_gauges("liargame_event_log", "이벤트 로그 지표", event_log.stats() if event_log else {}),
+            render_gauges("liargame_ws", "WebSocket 게임 채널 지표", game_channels.stats()),
+            render_gauges("liargame_history_json", "대화 기록 직렬화 캐시 지표", history_json_cache.stats()),
+        ]
+    )
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """LLM 응답 캐시 지표 (캐시 키 수, 적중/미스 횟수, 적중률)"""
+    return completion_cache.stats()
+
+
+@app.get("/vote/stats")
+async def vote_stats_endpoint():
+    """AI 투표 지표 (요청 수, 응답 해석 실패 수, 랜덤 투표 대체 수)"""
+    return vote_stats
+
+
+@app.get("/speculation/stats")
+async def speculation_stats_endpoint():
+    """다음 AI 차례 선행 생성 지표 (시작/사용/폐기 횟수)"""
+    return speculation_stats
+
+
+@app.get("/scheduler/stats")
+async def scheduler_stats():
+    """LLM 스케줄러 지표 (실행 중 호출 수, 우선순위별 대기 호출 수, 남은 분당 토큰 예산)"""
+    return llm_scheduler.stats()
+
+
+@app.post("/words/reload", response_model=WordReloadResponse)
+async def reload_words(force: bool = False):
+    """
+    단어장 다시 읽기
+
+    word.json이 디스크에서 바뀌었을 때만 다시 로드합니다 (force=true면 항상).
+    """
+    try:
+        reloaded = reload_word_bank(force=force)
+        word_bank = get_word_bank()
+
+        return WordReloadResponse(
+            reloaded=reloaded,
+            categories=len(word_bank.categories),
+            keywords=len(word_bank),
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"단어장 로드 실패: {str(e)}")
+
+
 if __name__ == "__main__":
     import uvicorn
 
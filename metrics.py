@@ -0,0 +1,210 @@
+"""
+요청/LLM 호출 계측 및 Prometheus 텍스트 포맷 출력
+
+- 엔드포인트별 처리 시간 (http_request_duration_seconds)
+- LLM 호출 위치(call_site)별 지연 시간, 토큰 사용량, 추정 비용, 오류 수
+
+외부 의존성 없이 라벨별 카운터/히스토그램만 구현하며, 기록은 dict 조회와 이진 탐색뿐이므로
+요청 처리 경로에 주는 부담이 거의 없습니다. GET /metrics에서 render_metrics()로 출력합니다.
+"""
+import bisect
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 생성된 모든 지표 (render_metrics 출력 순서)
+_REGISTRY: List["Counter | Histogram"] = []
+
+# 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """라벨 이름/값을 {a="x",b="y"} 형식으로 변환"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """라벨별 누적 카운터"""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        _REGISTRY.append(self)
+
+    def inc(self, *labels: str, amount: float = 1):
+        """라벨 값 순서는 labelnames와 같아야 합니다"""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """라벨별 누적 히스토그램 (구간별 개수, 합계, 개수)"""
+
+    def __init__(
+        self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # 라벨 값 -> [구간별 개수..., +Inf 개수, 합계]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+        _REGISTRY.append(self)
+
+    def observe(self, value: float, *labels: str):
+        """라벨 값 순서는 labelnames와 같아야 합니다"""
+        entry = self._values.get(labels)
+        if entry is None:
+            entry = [0] * (len(self.buckets) + 1) + [0.0]
+            self._values[labels] = entry
+        entry[bisect.bisect_left(self.buckets, value)] += 1
+        entry[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, entry in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), entry):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(entry[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+def render_gauges(name: str, help_text: str, values: Dict[str, float], labelname: str = "kind") -> List[str]:
+    """이미 집계된 지표 dict를 라벨 하나짜리 gauge로 변환 (캐시/투표 등 모듈별 stats용)"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+    for key, value in sorted(values.items()):
+        lines.append(f'{name}{{{labelname}="{_escape(key)}"}} {_format_value(value)}')
+    return lines
+
+
+# 엔드포인트 계측
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "엔드포인트 처리 시간 (응답 본문 전송 완료까지)", ("method", "path", "status")
+)
+
+# LLM 호출 계측
+llm_request_duration = Histogram(
+    "llm_request_duration_seconds", "LLM 호출 지연 시간 (스트리밍은 마지막 토큰까지)", ("call_site", "outcome")
+)
+llm_time_to_first_token = Histogram("llm_time_to_first_token_seconds", "스트리밍 LLM 호출의 첫 토큰까지 시간", ("call_site",))
+llm_tokens = Counter("llm_tokens_total", "LLM 토큰 사용량 (response.usage 기준)", ("call_site", "kind"))
+llm_cost = Counter("llm_cost_usd_total", "LLM 추정 비용 (USD, 설정한 1K 토큰당 단가 기준)", ("call_site",))
+llm_errors = Counter("llm_errors_total", "LLM 호출 오류 수", ("call_site", "error"))
+
+
+def record_llm_call(
+    call_site: str,
+    started: float,
+    usage=None,
+    error: Optional[BaseException] = None,
+    prompt_cost_per_1k: float = 0.0,
+    completion_cost_per_1k: float = 0.0,
+):
+    """
+    LLM 호출 1건 기록
+
+    Args:
+        call_site: 호출 위치 이름
+        started: time.perf_counter()로 잰 호출 시작 시각
+        usage: response.usage (없으면 토큰/비용 기록 생략)
+        error: 호출 중 발생한 예외 (성공이면 None)
+        prompt_cost_per_1k: 프롬프트 1K 토큰당 비용 (USD)
+        completion_cost_per_1k: 완성 1K 토큰당 비용 (USD)
+    """
+    llm_request_duration.observe(time.perf_counter() - started, call_site, "error" if error else "ok")
+    if error is not None:
+        llm_errors.inc(call_site, type(error).__name__)
+        return
+
+    if usage is not None:
+        prompt_tokens = usage.prompt_tokens or 0
+        completion_tokens = usage.completion_tokens or 0
+        llm_tokens.inc(call_site, "prompt", amount=prompt_tokens)
+        llm_tokens.inc(call_site, "completion", amount=completion_tokens)
+        cost = (prompt_tokens * prompt_cost_per_1k + completion_tokens * completion_cost_per_1k) / 1000
+        if cost:
+            llm_cost.inc(call_site, amount=cost)
+
+
+def render_metrics(extra: Iterable[List[str]] = ()) -> str:
+    """모든 지표를 Prometheus 텍스트 포맷으로 출력"""
+    lines = []
+    for metric in _REGISTRY:
+        lines.extend(metric.render())
+    for block in extra:
+        lines.extend(block)
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    엔드포인트별 처리 시간을 기록하는 ASGI 미들웨어
+
+    경로 라벨은 실제 URL이 아니라 라우트 템플릿(/status/{session_id})을 사용하여
+    세션마다 새 시계열이 생기지 않도록 합니다. 매칭되는 라우트가 없으면 기록하지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._route_paths: Dict[object, str] = {}
+
+    def _route_path(self, scope) -> Optional[str]:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return None
+
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            app = scope.get("app")
+            for route in getattr(app, "routes", ()):
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+            self._route_paths[endpoint] = path
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            path = self._route_path(scope)
+            if path is not None:
+                http_request_duration.observe(time.perf_counter() - started, scope["method"], path, str(status))
@@ -2,7 +2,7 @@
 Pydantic 모델 정의
 """
 from pydantic import BaseModel, Field
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional
 from enum import Enum
 
 
@@ -26,7 +26,10 @@ class GameStartRequest(BaseModel):
 
     session_id: str = Field(..., description="세션 ID (고유 식별자)")
     keyword: Optional[str] = Field(None, description="게임 주제어 (None이면 랜덤)")
-    category: Optional[str] = Field(None, description="카테고리 (keyword가 None이면 자동)")
+    category: Optional[str] = Field(None, description="카테고리 (None이면 keyword로 자동, keyword가 None이면 해당 카테고리에서 랜덤)")
+    agent_mode: Optional[Literal["independent", "batched"]] = Field(
+        None, description="AI 호출 방식 (independent: AI마다 따로, batched: 시민 AI를 한 번에, None이면 서버 설정)"
+    )
 
 
 class GameStartResponse(BaseModel):
@@ -39,6 +42,7 @@ class GameStartResponse(BaseModel):
     turn_order: List[str] = Field(..., description="발언 순서")
     message: str
     host_comment: str = Field(..., description="사회자 멘트")
+    agent_mode: str = Field("independent", description="이 세션의 AI 호출 방식")
 
 
 class TalkRequest(BaseModel):
@@ -46,16 +50,51 @@ class TalkRequest(BaseModel):
 
     session_id: str
     user_message: str = Field(..., description="사용자 발언")
+    cursor: Optional[int] = Field(
+        None, ge=0, description="클라이언트가 이미 가진 메시지 수 (지정하면 이후 메시지만 반환, None이면 전체 기록)"
+    )
+
+
+class AdvanceRequest(BaseModel):
+    """연속 AI 차례 일괄 진행 요청"""
+
+    session_id: str
+    cursor: Optional[int] = Field(
+        None, ge=0, description="클라이언트가 이미 가진 메시지 수 (지정하면 이후 메시지만 반환, None이면 전체 기록)"
+    )
+    stop_at_round_end: bool = Field(True, description="사용자 차례 전이라도 라운드가 끝나면 멈출지 여부")
 
 
 class TalkResponse(BaseModel):
     """대화 응답"""
 
     session_id: str
-    history: List[Message] = Field(..., description="전체 대화 기록")
+    history: List[Message] = Field(..., description="대화 기록 (delta이면 cursor 이후 새 메시지만)")
+    cursor: int = Field(..., description="지금까지의 전체 메시지 수 (다음 요청의 cursor로 사용)")
+    delta: bool = Field(default=False, description="history가 새 메시지만 담고 있는지 여부")
     ai_responses: dict = Field(..., description="AI 응답 {'ai_1': '...', 'ai_2': '...', 'ai_3': '...'}")
     next_turn: str = Field(..., description="다음 차례 플레이어")
     host_comment: Optional[str] = Field(None, description="사회자 멘트")
+    host_comment_pending: bool = Field(
+        default=False, description="사회자 멘트를 백그라운드에서 생성 중인지 여부 (/host-comment/{session_id}로 조회)"
+    )
+
+
+class HostCommentResponse(BaseModel):
+    """백그라운드 사회자 멘트 조회 응답"""
+
+    session_id: str
+    host_comment: Optional[str] = Field(None, description="사회자 멘트 (생성 중이면 None)")
+    turn: int = Field(..., description="멘트가 생성된 시점의 턴 번호")
+    ready: bool = Field(..., description="생성 완료 여부")
+
+
+class WordReloadResponse(BaseModel):
+    """단어장 다시 읽기 응답"""
+
+    reloaded: bool = Field(..., description="파일이 바뀌어 다시 읽었는지 여부")
+    categories: int = Field(..., description="카테고리 수")
+    keywords: int = Field(..., description="전체 키워드 수")
 
 
 class VoteRequest(BaseModel):
@@ -75,6 +114,10 @@ class VoteResponse(BaseModel):
     result: str = Field(..., description="게임 결과 (시민 승리 / 라이어 승리)")
     vote_counts: dict = Field(..., description="득표 결과")
     liar_caught: bool = Field(..., description="라이어가 걸렸는지 여부")
+    ai_vote_reasons: Dict[str, str] = Field(default_factory=dict, description="AI별 투표 이유 (모델이 제시한 경우만)")
+    fallback_votes: List[str] = Field(
+        default_factory=list, description="랜덤 투표로 대체된 AI 목록 (제한 시간 초과, LLM 오류/회로 차단, 응답 해석 실패)"
+    )
 
 
 class LiarGuessRequest(BaseModel):
@@ -94,15 +137,17 @@ class LiarGuessResponse(BaseModel):
     result: str = Field(..., description="역전 승부 결과")
 
 
-class GameState(BaseModel):
-    """게임 상태 (내부 사용)"""
+class StatusResponse(BaseModel):
+    """게임 상태 조회 응답"""
 
     session_id: str
     keyword: str
     category: str
     liar: str
-    ai_roles: dict = Field(..., description="AI별 역할 {'ai_1': 'civilian', 'ai_2': 'liar', ...}")
-    history: List[Message] = Field(default_factory=list, description="대화 기록")
+    ai_roles: Dict[str, PlayerRole] = Field(..., description="AI별 역할 (디버깅용)")
+    history: List[Message] = Field(..., description="대화 기록 (delta이면 cursor 이후 새 메시지만)")
+    cursor: int = Field(..., description="지금까지의 전체 메시지 수")
+    delta: bool = Field(default=False, description="history가 새 메시지만 담고 있는지 여부")
+    total_messages: int
     turn_order: List[str] = Field(..., description="발언 순서")
-    current_turn: int = Field(default=0, description="현재 턴 인덱스")
-    started: bool = True
+    current_turn: int = Field(..., description="현재 턴 인덱스")
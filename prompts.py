@@ -0,0 +1,359 @@
+"""
+AI 프롬프트 구성 및 세션별 프롬프트 캐시
+
+역할 프롬프트는 게임 생성 시 한 번만 만들고, 대화 기록은 OpenAI 메시지 형식으로
+새 메시지만 이어서 변환합니다 (추정 토큰 수도 함께 기록). 요청 메시지는 항상
+[역할 프롬프트(고정)] + [대화 기록(앞부분 고정)] + [이번 차례 안내(가변)] 순서로 구성하여
+제공자 측 프롬프트 prefix 캐시가 최대한 적중하도록 합니다.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from history_window import estimate_tokens, summary_message, window_start
+from game_state import GameState
+from models import PlayerRole
+
+# 투표 대상 전체 (투표 함수 스키마의 enum은 여기서 자기 자신을 뺀 목록)
+VOTE_TARGETS = ("user", "ai_1", "ai_2", "ai_3")
+
+# 구조화된 투표 출력에 쓰는 함수 이름
+VOTE_FUNCTION_NAME = "cast_vote"
+
+# 시민 AI 여러 명을 한 번에 호출할 때(batched 모드) 쓰는 함수 이름
+BATCH_TURN_FUNCTION_NAME = "speak_turns"
+BATCH_VOTE_FUNCTION_NAME = "cast_votes"
+
+
+def build_system_prompt(role: PlayerRole, keyword: str, category: str = None) -> str:
+    """
+    역할에 따른 시스템 프롬프트 생성
+
+    Args:
+        role: 플레이어 역할 (CIVILIAN or LIAR)
+        keyword: 게임 주제어
+        category: 카테고리 (라이어에게만 제공)
+
+    Returns:
+        str: 시스템 프롬프트
+    """
+    if role == PlayerRole.CIVILIAN:
+        return f"""당신은 '라이어 게임'에 참여하는 시민(Civilian) AI입니다.
+
+**게임 규칙:**
+- 주제어는 '{keyword}'입니다.
+- 당신은 이 주제어를 알고 있지만, 다른 AI 중 한 명은 라이어로서 주제어를 모릅니다.
+- 목표: 라이어를 찾아내는 것입니다.
+
+**발언 전략:**
+1. 주제어를 너무 직접적으로 설명하지 마세요. 라이어가 쉽게 눈치챌 수 있습니다.
+2. 하지만 너무 엉뚱한 말을 하면 동료 시민들이 당신을 의심할 수 있습니다.
+3. 주제어와 관련된 간접적인 힌트나 연상되는 표현을 사용하세요.
+4. 짧고 자연스럽게 대답하세요 (1-2문장).
+5. 이전 대화를 보고 누가 라이어인지 추리하세요.
+
+**중요:** 당신은 반드시 '{keyword}'에 대해 알고 있는 사람처럼 행동해야 합니다."""
+
+    else:  # LIAR
+        return f"""당신은 '라이어 게임'에 참여하는 라이어(Liar) AI입니다.
+
+**게임 규칙:**
+- 다른 플레이어들은 공통 주제어를 알고 있지만, 당신은 주제어를 모릅니다.
+- 카테고리는 '{category}'입니다. (이것만 알고 있습니다)
+- 목표: 들키지 않고 시민인 척하는 것입니다.
+
+**발언 전략:**
+1. 카테고리 '{category}' 안에서만 발언하세요. 절대 다른 카테고리의 것을 언급하지 마세요.
+2. 이전 대화에서 다른 플레이어들이 어떤 힌트를 주는지 주의깊게 관찰하세요.
+3. 해당 카테고리 내에서 일반적이고 흔한 특징이나 표현을 사용하세요.
+4. 예시:
+   - 카테고리가 '과일'이면: "달콤해", "비타민이 많아", "색깔이 예뻐" 등
+   - 카테고리가 '영화'면: "감동적이었어", "배우 연기가 좋았어", "스토리가 인상적이야" 등
+   - 카테고리가 '나라'면: "여행 가고 싶어", "문화가 독특해", "음식이 맛있어" 등
+5. 절대 "모르겠다" "잘 모르겠어" 같은 티를 내지 마세요.
+6. 확신에 차서 자연스럽게, 마치 알고 있는 것처럼 대답하세요 (1-2문장).
+7. 너무 구체적으로 특정 대상을 지목하면 틀릴 수 있으니 애매하고 일반적으로 말하세요.
+
+**중요:**
+- 반드시 '{category}' 카테고리 안에서만 발언하세요.
+- 주제어를 모르지만, '{category}' 중 하나에 대해 아는 척해야 합니다.
+- 다른 플레이어들의 발언을 보고 그들이 말하는 방향을 따라가세요."""
+
+
+def build_vote_prompt(role: PlayerRole, keyword: str) -> str:
+    """
+    역할에 따른 투표 시스템 프롬프트 생성
+
+    투표하는 AI 이름은 prefix 캐시를 위해 마지막 안내 메시지(build_vote_instruction)에 넣습니다.
+
+    Args:
+        role: 플레이어 역할 (CIVILIAN or LIAR)
+        keyword: 게임 주제어 (시민에게만 제공)
+
+    Returns:
+        str: 투표 시스템 프롬프트
+    """
+    if role == PlayerRole.CIVILIAN:
+        return f"""당신은 시민이며 주제어는 '{keyword}'입니다.
+
+지금까지의 대화를 보고, 누가 라이어(주제어를 모르는 사람)인 것 같은지 판단하세요.
+
+**투표 대상:**
+- user (사용자)
+- ai_1
+- ai_2
+- ai_3
+
+**중요:** 자기 자신에게는 투표할 수 없습니다. 반드시 다른 사람 중 한 명을 선택하세요.
+
+투표 대상의 이름만 정확히 출력하세요. (예: user, ai_1, ai_2, ai_3)"""
+    else:  # LIAR
+        return """당신은 라이어입니다. 주제어를 모르지만 들키지 않으려면 적당히 투표해야 합니다.
+
+지금까지의 대화를 보고, 전략적으로 투표하세요.
+- 너무 이상한 사람에게 투표하면 오히려 의심받을 수 있습니다.
+- 자연스럽게 행동하세요.
+
+**투표 대상:**
+- user (사용자)
+- ai_1
+- ai_2
+- ai_3
+
+**중요:** 자기 자신에게는 투표할 수 없습니다. 반드시 다른 사람 중 한 명을 선택하세요.
+
+투표 대상의 이름만 정확히 출력하세요. (예: user, ai_1, ai_2, ai_3)"""
+
+
+def build_turn_instruction(ai_name: str) -> dict:
+    """AI 발언 차례 안내 메시지 (요청 메시지 목록의 마지막)"""
+    return {"role": "user", "content": f"이제 당신({ai_name})의 차례입니다. 간단히 대답하세요."}
+
+
+def build_vote_instruction(ai_name: str) -> dict:
+    """AI 투표 안내 메시지 (요청 메시지 목록의 마지막)"""
+    return {
+        "role": "user",
+        "content": f"당신은 {ai_name}입니다. 투표하세요. (user, ai_1, ai_2, ai_3 중 자신({ai_name})을 제외하고 선택)",
+    }
+
+
+# 투표하는 AI별 투표 함수 정의 (게임과 무관하므로 한 번만 구성)
+_vote_tools: Dict[str, List[dict]] = {}
+
+
+def build_vote_tools(ai_name: str) -> List[dict]:
+    """
+    구조화된 투표 출력용 함수(tool) 정의
+
+    target은 자기 자신을 제외한 투표 대상만 허용하는 enum이므로 모델이 자유 텍스트로
+    답하거나 자신에게 투표하지 않습니다. reason은 짧은 선택 근거입니다 (선택 사항).
+
+    Args:
+        ai_name: 투표하는 AI 이름
+
+    Returns:
+        List[dict]: chat.completions.create의 tools 인자
+    """
+    tools = _vote_tools.get(ai_name)
+    if tools is None:
+        tools = [
+            {
+                "type": "function",
+                "function": {
+                    "name": VOTE_FUNCTION_NAME,
+                    "description": "라이어로 의심되는 플레이어에게 투표합니다.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "target": {
+                                "type": "string",
+                                "enum": [target for target in VOTE_TARGETS if target != ai_name],
+                                "description": "투표 대상",
+                            },
+                            "reason": {"type": "string", "description": "투표 이유 (20자 이내)"},
+                        },
+                        "required": ["target"],
+                    },
+                },
+            }
+        ]
+        _vote_tools[ai_name] = tools
+    return tools
+
+
+def build_batch_turn_instruction(ai_names: List[str]) -> dict:
+    """여러 시민 AI의 연속 발언 안내 메시지 (batched 모드, 요청 메시지 목록의 마지막)"""
+    order = " → ".join(ai_names)
+    return {
+        "role": "user",
+        "content": (
+            f"이제 {order} 순서로 차례입니다. 모두 주제어를 아는 시민입니다. "
+            "각자 앞사람의 발언까지 들었다고 생각하고, 서로 겹치지 않게 한 명씩 간단히 대답하세요."
+        ),
+    }
+
+
+def build_batch_turn_tools(ai_names: List[str]) -> List[dict]:
+    """여러 시민 AI의 발언을 한 번에 받는 함수(tool) 정의 (AI 이름별 문자열 속성)"""
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": BATCH_TURN_FUNCTION_NAME,
+                "description": "각 플레이어의 이번 차례 발언을 제출합니다.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        ai_name: {"type": "string", "description": f"{ai_name}의 발언 (1-2문장)"} for ai_name in ai_names
+                    },
+                    "required": list(ai_names),
+                },
+            },
+        }
+    ]
+
+
+def build_batch_vote_instruction(ai_names: List[str]) -> dict:
+    """여러 시민 AI의 투표 안내 메시지 (batched 모드, 요청 메시지 목록의 마지막)"""
+    return {
+        "role": "user",
+        "content": (
+            f"당신들은 {', '.join(ai_names)}입니다. 각자 투표하세요. "
+            "(user, ai_1, ai_2, ai_3 중 각자 자신을 제외하고 선택)"
+        ),
+    }
+
+
+def build_batch_vote_tools(ai_names: List[str]) -> List[dict]:
+    """여러 시민 AI의 투표를 한 번에 받는 함수(tool) 정의 (AI별 대상 enum은 자신 제외)"""
+    voters = {}
+    for ai_name in ai_names:
+        voters[ai_name] = {
+            "type": "object",
+            "properties": {
+                "target": {
+                    "type": "string",
+                    "enum": [target for target in VOTE_TARGETS if target != ai_name],
+                    "description": f"{ai_name}의 투표 대상",
+                },
+                "reason": {"type": "string", "description": "투표 이유 (20자 이내)"},
+            },
+            "required": ["target"],
+        }
+
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": BATCH_VOTE_FUNCTION_NAME,
+                "description": "각 플레이어가 라이어로 의심되는 사람에게 투표합니다.",
+                "parameters": {"type": "object", "properties": voters, "required": list(ai_names)},
+            },
+        }
+    ]
+
+
+def to_chat_message(speaker: str, content: str) -> dict:
+    """대화 기록 메시지를 OpenAI 메시지 형식으로 변환"""
+    return {
+        "role": "user" if speaker == "user" else "assistant",
+        "content": f"[{speaker}]: {content}",
+    }
+
+
+class SessionPrompts:
+    """
+    한 세션의 프롬프트 캐시
+
+    역할별 발언/투표 프롬프트와 변환된 대화 기록을 보관합니다.
+    변환된 대화 기록은 모든 AI가 공유하며, sync()는 아직 변환하지 않은 메시지만 처리합니다.
+    """
+
+    def __init__(self, game: GameState):
+        self.signature = (game.keyword, game.category, game.liar)
+        roles = (PlayerRole.CIVILIAN, PlayerRole.LIAR)
+        self.system_prompts: Dict[PlayerRole, str] = {
+            role: build_system_prompt(role, game.keyword, game.category) for role in roles
+        }
+        self.vote_prompts: Dict[PlayerRole, str] = {role: build_vote_prompt(role, game.keyword) for role in roles}
+        self.history_messages: List[dict] = []
+        self.token_counts: List[int] = []
+
+        # 윈도우 밖으로 밀려난 앞부분 대화의 누적 요약 (history_messages[:summary_upto] 요약)
+        self.summary = ""
+        self.summary_upto = 0
+
+    def matches(self, game: GameState) -> bool:
+        """캐시가 이 게임 상태에 그대로 쓸 수 있는지 여부 (같은 게임이고 기록이 줄지 않음)"""
+        return (
+            self.signature == (game.keyword, game.category, game.liar)
+            and len(self.history_messages) <= len(game.history)
+        )
+
+    def sync(self, game: GameState) -> List[dict]:
+        """새로 추가된 대화 기록만 변환하여 이어 붙이고 전체 변환 목록 반환"""
+        for speaker, content, _ in game.history.entries(len(self.history_messages)):
+            chat_message = to_chat_message(speaker, content)
+            self.history_messages.append(chat_message)
+            self.token_counts.append(estimate_tokens(chat_message["content"]))
+        return self.history_messages
+
+    def window_start(self, budget: int, max_messages: Optional[int] = None) -> int:
+        """토큰 예산 안에 들어가는 최근 대화 기록의 시작 인덱스"""
+        return window_start(self.token_counts, budget, max_messages)
+
+    def context(self, budget: int, max_messages: Optional[int] = None) -> List[dict]:
+        """
+        토큰 예산으로 자른 대화 기록 (잘린 앞부분의 요약이 있으면 맨 앞에 포함)
+
+        Args:
+            budget: 대화 기록에 쓸 토큰 예산
+            max_messages: 최대 메시지 수 (None이면 제한 없음)
+
+        Returns:
+            List[dict]: OpenAI 메시지 목록
+        """
+        start = self.window_start(budget, max_messages)
+        window = self.history_messages[start:]
+        if start > 0 and self.summary:
+            return [summary_message(self.summary), *window]
+        return window
+
+
+class PromptCache:
+    """세션별 SessionPrompts LRU 캐시"""
+
+    def __init__(self, max_sessions: int = 10000):
+        self.max_sessions = max_sessions
+        self._entries: "OrderedDict[str, SessionPrompts]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def prime(self, game: GameState) -> SessionPrompts:
+        """게임 생성 시 프롬프트를 미리 구성 (같은 세션 ID의 이전 캐시는 교체)"""
+        prompts = SessionPrompts(game)
+        self._entries[game.session_id] = prompts
+        self._entries.move_to_end(game.session_id)
+        while len(self._entries) > self.max_sessions:
+            self._entries.popitem(last=False)
+        return prompts
+
+    def get(self, game: GameState) -> SessionPrompts:
+        """
+        세션의 프롬프트 캐시 반환 (대화 기록 동기화 포함)
+
+        다른 워커에서 만들어진 세션 등 캐시가 없거나 맞지 않으면 새로 구성합니다.
+        """
+        prompts: Optional[SessionPrompts] = self._entries.get(game.session_id)
+        if prompts is None or not prompts.matches(game):
+            prompts = self.prime(game)
+        else:
+            self._entries.move_to_end(game.session_id)
+
+        prompts.sync(game)
+        return prompts
+
+    def discard(self, session_id: str):
+        """세션 캐시 제거"""
+        self._entries.pop(session_id, None)
@@ -0,0 +1,395 @@
+"""
+게임 세션 저장소
+
+- InMemorySessionStore: 프로세스 내부 저장소 (워커 1개용)
+- SqliteSessionStore: 여러 워커/프로세스가 공유하는 SQLite(WAL) 저장소
+
+두 저장소 모두 최대 세션 수(LRU 제거)와 유휴 TTL을 지원합니다.
+"""
+import asyncio
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from game_state import GameState
+
+# 직렬화 포맷 버전 (필드 구성이 바뀌면 증가)
+_FORMAT_VERSION = 1
+
+
+def encode_game(game: GameState) -> bytes:
+    """
+    GameState를 compact JSON 배열로 직렬화
+
+    필드 이름 없이 위치 기반 배열로 저장합니다. (AI 역할은 liar에서 계산하므로 저장하지 않음)
+    """
+    history = [
+        [speaker, content, 1] if is_host else [speaker, content]
+        for speaker, content, is_host in game.history.entries()
+    ]
+    payload = [
+        _FORMAT_VERSION,
+        game.session_id,
+        game.keyword,
+        game.category,
+        game.liar,
+        game.turn_order,
+        game.current_turn,
+        history,
+        game.agent_mode,
+    ]
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_game(data: bytes) -> GameState:
+    """encode_game으로 직렬화된 데이터를 GameState로 복원"""
+    # agent_mode는 나중에 추가된 필드이므로 없는 데이터도 읽을 수 있도록 선택 항목으로 처리
+    version, session_id, keyword, category, liar, turn_order, current_turn, history, *extra = json.loads(data)
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported session format version: {version}")
+
+    game = GameState(
+        session_id=session_id,
+        keyword=keyword,
+        category=category,
+        liar=liar,
+        turn_order=turn_order,
+        current_turn=current_turn,
+        agent_mode=extra[0] if extra else "independent",
+    )
+    for entry in history:
+        game.history.append(entry[0], entry[1], is_host=len(entry) > 2)
+    return game
+
+
+class EncodedGame:
+    """
+    복구 후 아직 한 번도 조회되지 않은 세션 (인코딩된 상태 그대로 보관)
+
+    처음 조회할 때 decode(data)로 GameState를 만들어 교체하므로, 재시작 직후 모든 세션을
+    미리 복원하지 않아도 됩니다.
+    """
+
+    __slots__ = ("data", "decode")
+
+    def __init__(self, data, decode: Callable[[object], GameState]):
+        self.data = data
+        self.decode = decode
+
+
+class SessionStore(ABC):
+    """
+    세션 저장소 인터페이스
+
+    get()이 돌려준 GameState를 변경했다면 반드시 put()으로 다시 저장해야 합니다.
+    (프로세스 외부 저장소에서는 get()마다 새 객체가 만들어집니다)
+    """
+
+    def __init__(self, max_sessions: int, ttl: float):
+        """
+        Args:
+            max_sessions: 최대 보관 세션 수 (초과 시 가장 오래 쓰이지 않은 세션 제거)
+            ttl: 유휴 만료 시간 (초, 0 이하이면 만료 없음)
+        """
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._evict_listeners: List[Callable[[str], None]] = []
+        self.evictions = {"lru": 0, "ttl": 0}
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id, touch=False) is not None
+
+    def add_evict_listener(self, listener: Callable[[str], None]):
+        """세션이 제거될 때 호출할 콜백 등록 (세션별 부가 자원 정리용)"""
+        self._evict_listeners.append(listener)
+
+    def _notify_evicted(self, session_id: str):
+        for listener in self._evict_listeners:
+            listener(session_id)
+
+    def _is_expired(self, last_access: float, now: float) -> bool:
+        return self.ttl > 0 and now - last_access > self.ttl
+
+    @abstractmethod
+    def get(self, session_id: str, touch: bool = True) -> Optional[GameState]:
+        """
+        세션 조회
+
+        Args:
+            session_id: 세션 ID
+            touch: True이면 마지막 접근 시각을 갱신
+
+        Returns:
+            Optional[GameState]: 게임 상태 (없거나 만료되었으면 None)
+        """
+
+    @abstractmethod
+    def put(self, game: GameState):
+        """세션 저장 (신규 생성 및 변경 사항 반영)"""
+
+    @abstractmethod
+    def delete(self, session_id: str):
+        """세션 삭제"""
+
+    @abstractmethod
+    def sweep(self) -> int:
+        """
+        만료된 세션 일괄 제거
+
+        Returns:
+            int: 제거된 세션 수
+        """
+
+    @abstractmethod
+    def size(self) -> int:
+        """현재 보관 중인 세션 수"""
+
+    async def run_sweeper(self, interval: float):
+        """interval초마다 만료 세션을 제거하는 백그라운드 루프"""
+        while True:
+            await asyncio.sleep(interval)
+            self.sweep()
+
+    def stats(self) -> Dict[str, int]:
+        """저장소 지표 (현재 세션 수, 제거 횟수)"""
+        return {
+            "size": self.size(),
+            "max_sessions": self.max_sessions,
+            "evictions_lru": self.evictions["lru"],
+            "evictions_ttl": self.evictions["ttl"],
+        }
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    LRU + 유휴 TTL 세션 저장소
+
+    세션은 마지막 접근 순서로 정렬되어 있어, 가장 오래 쓰이지 않은 세션부터
+    제거하고 만료 검사도 앞쪽에서 만료되지 않은 세션을 만나면 멈춥니다.
+    """
+
+    def __init__(self, max_sessions: int = 10000, ttl: float = 3600.0):
+        super().__init__(max_sessions, ttl)
+        self._sessions: "OrderedDict[str, Tuple[GameState, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _evict(self, session_id: str, reason: str):
+        del self._sessions[session_id]
+        self.evictions[reason] += 1
+        self._notify_evicted(session_id)
+
+    def get(self, session_id: str, touch: bool = True) -> Optional[GameState]:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+
+        game, last_access = entry
+        now = time.monotonic()
+        if self._is_expired(last_access, now):
+            self._evict(session_id, "ttl")
+            return None
+
+        if type(game) is EncodedGame:
+            game = game.decode(game.data)
+            self._sessions[session_id] = (game, last_access)
+
+        if touch:
+            self._sessions[session_id] = (game, now)
+            self._sessions.move_to_end(session_id)
+        return game
+
+    def put(self, game: GameState):
+        self._put(game.session_id, game)
+
+    def put_encoded(self, session_id: str, encoded: EncodedGame, last_access: Optional[float] = None):
+        """
+        인코딩된 세션 보관 (복구용, 처음 조회할 때 복원)
+
+        Args:
+            last_access: 저장 당시 마지막 접근 시각 (Unix 시간, None이면 지금, 오래된 순으로 넣어야 함)
+        """
+        if last_access is not None:
+            last_access = time.monotonic() - (time.time() - last_access)
+        self._put(session_id, encoded, last_access)
+
+    def _put(self, session_id: str, game, last_access: Optional[float] = None):
+        self._sessions[session_id] = (game, time.monotonic() if last_access is None else last_access)
+        self._sessions.move_to_end(session_id)
+
+        # 최대 세션 수를 넘으면 가장 오래 쓰이지 않은 세션 제거
+        while len(self._sessions) > self.max_sessions:
+            oldest = next(iter(self._sessions))
+            self._evict(oldest, "lru")
+
+    def delete(self, session_id: str):
+        if self._sessions.pop(session_id, None) is not None:
+            self._notify_evicted(session_id)
+
+    def sweep(self) -> int:
+        if self.ttl <= 0:
+            return 0
+
+        now = time.monotonic()
+        expired = []
+        for session_id, (_, last_access) in self._sessions.items():
+            if not self._is_expired(last_access, now):
+                break
+            expired.append(session_id)
+
+        for session_id in expired:
+            self._evict(session_id, "ttl")
+        return len(expired)
+
+    def size(self) -> int:
+        return len(self._sessions)
+
+    def games(self) -> List[Union[GameState, EncodedGame]]:
+        """보관 중인 모든 게임 상태 (오래 쓰이지 않은 순, 아직 복원되지 않은 세션은 EncodedGame 그대로, 스냅샷용)"""
+        return [game for game, _ in self._sessions.values()]
+
+    def games_with_access(self) -> List[Tuple[Union[GameState, EncodedGame], float]]:
+        """games()와 같은 순서의 (게임 상태, 마지막 접근 시각) 목록 (Unix 시간, 재시작 후에도 유휴 시간 유지용)"""
+        offset = time.time() - time.monotonic()
+        return [(game, last_access + offset) for game, last_access in self._sessions.values()]
+
+
+class SqliteSessionStore(SessionStore):
+    """
+    SQLite(WAL 모드) 공유 세션 저장소
+
+    여러 uvicorn 워커나 프로세스가 같은 DB 파일을 열어 세션을 공유합니다.
+    WAL 모드에서는 읽기가 쓰기를 막지 않으므로 워커 간 경합이 적습니다.
+    최대 세션 수 초과분은 put()마다 검사하지 않고 sweep()에서 LRU 순으로 정리합니다.
+    """
+
+    # 마지막 접근 시각 갱신 최소 간격 (초) - 조회마다 쓰기가 발생하지 않도록
+    TOUCH_INTERVAL = 1.0
+
+    def __init__(self, db_path: str, max_sessions: int = 10000, ttl: float = 3600.0, busy_timeout: float = 0.1):
+        """
+        Args:
+            busy_timeout: 다른 워커의 쓰기 잠금을 기다릴 최대 시간 (초)
+                저장소 호출은 이벤트 루프에서 동기로 실행되므로 이 시간 동안 워커의 모든 요청이 멈춥니다.
+                WAL 모드의 쓰기는 한 행 단위로 짧으므로 짧게 두고, 초과하면 sqlite3.OperationalError로 실패시킵니다.
+        """
+        super().__init__(max_sessions, ttl)
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False, timeout=busy_timeout)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout * 1000)}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            " session_id TEXT PRIMARY KEY,"
+            " data BLOB NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_last_access ON sessions (last_access)")
+
+    def get(self, session_id: str, touch: bool = True) -> Optional[GameState]:
+        row = self._conn.execute(
+            "SELECT data, last_access FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        data, last_access = row
+        now = time.time()
+        if self._is_expired(last_access, now):
+            try:
+                self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            except sqlite3.OperationalError:
+                # 잠금 경합 시 삭제는 sweep()에 맡기고 만료된 세션으로만 처리
+                return None
+            self.evictions["ttl"] += 1
+            self._notify_evicted(session_id)
+            return None
+
+        if touch and now - last_access > self.TOUCH_INTERVAL:
+            try:
+                self._conn.execute("UPDATE sessions SET last_access = ? WHERE session_id = ?", (now, session_id))
+            except sqlite3.OperationalError:
+                # 접근 시각 갱신은 TTL용일 뿐이므로 잠금 경합 시 건너뛰고 조회는 성공시킴
+                pass
+        return decode_game(data)
+
+    def put(self, game: GameState):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sessions (session_id, data, last_access) VALUES (?, ?, ?)",
+            (game.session_id, encode_game(game), time.time()),
+        )
+
+    def delete(self, session_id: str):
+        cursor = self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        if cursor.rowcount:
+            self._notify_evicted(session_id)
+
+    def _delete_many(self, session_ids: List[str], reason: str):
+        self._conn.executemany("DELETE FROM sessions WHERE session_id = ?", [(sid,) for sid in session_ids])
+        self.evictions[reason] += len(session_ids)
+        for session_id in session_ids:
+            self._notify_evicted(session_id)
+
+    def sweep(self) -> int:
+        try:
+            return self._sweep()
+        except sqlite3.OperationalError:
+            # 잠금 경합 시 이번 정리는 건너뛰고 다음 주기에 다시 시도 (정리 작업이 종료되지 않도록)
+            return 0
+
+    def _sweep(self) -> int:
+        removed = 0
+
+        if self.ttl > 0:
+            cutoff = time.time() - self.ttl
+            expired = [
+                row[0]
+                for row in self._conn.execute("SELECT session_id FROM sessions WHERE last_access < ?", (cutoff,))
+            ]
+            self._delete_many(expired, "ttl")
+            removed += len(expired)
+
+        overflow = self.size() - self.max_sessions
+        if overflow > 0:
+            oldest = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT session_id FROM sessions ORDER BY last_access LIMIT ?", (overflow,)
+                )
+            ]
+            self._delete_many(oldest, "lru")
+            removed += len(oldest)
+
+        return removed
+
+    def size(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def close(self):
+        """DB 연결 종료"""
+        self._conn.close()
+
+
+def create_session_store(
+    backend: str, max_sessions: int, ttl: float, db_path: str = "sessions.db", busy_timeout: float = 0.1
+) -> SessionStore:
+    """
+    설정에 맞는 세션 저장소 생성
+
+    Args:
+        backend: memory 또는 sqlite
+        max_sessions: 최대 보관 세션 수
+        ttl: 유휴 만료 시간 (초)
+        db_path: SQLite DB 파일 경로 (sqlite 백엔드 전용)
+        busy_timeout: SQLite 잠금 대기 최대 시간 (초, sqlite 백엔드 전용)
+
+    Returns:
+        SessionStore: 세션 저장소
+    """
+    if backend == "sqlite":
+        return SqliteSessionStore(db_path, max_sessions=max_sessions, ttl=ttl, busy_timeout=busy_timeout)
+    return InMemorySessionStore(max_sessions=max_sessions, ttl=ttl)
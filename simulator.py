@@ -0,0 +1,367 @@
+"""
+AI 대 AI 게임 대량 시뮬레이터 (HTTP 없이 게임 로직 직접 구동)
+
+프롬프트 조정과 라이어 승률 측정용으로 create_game → 발언 라운드 → 투표 → 라이어 추측 전체 게임을
+수천 판 동시에 진행하고, 게임마다 결과 한 행을 JSONL 또는 Parquet(열 단위) 파일로 기록합니다.
+
+- 사용자 자리는 정책으로 채움: ai(시민 AI가 대신 발언/투표) 또는 scripted(고정 힌트 + 랜덤 투표)
+- 동시 게임 수(--concurrency)와 동시 LLM 호출 수(--llm-concurrency, 전역 LLM 스케줄러)를 따로 제한
+- 결과를 --batch-size 게임마다 기록하고 체크포인트를 갱신하며, --resume으로 중단한 곳부터 이어서 진행
+- 끝나면 word.json 카테고리별 라이어 승률 등 집계를 출력하고 <출력>.stats.json에 저장
+
+실행 예시:
+    python simulator.py --games 1000 --output runs/sim.jsonl --mock
+    python simulator.py --games 5000 --output runs/sim.parquet --format parquet --llm-concurrency 32
+    python simulator.py --games 5000 --output runs/sim.jsonl --resume
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from typing import Dict, List, Set
+
+# 사용자 자리 scripted 정책의 힌트 (주제어를 드러내지 않는 카테고리 수준 힌트)
+SCRIPTED_HINTS = [
+    "{category} 중에서도 꽤 유명한 편이에요.",
+    "저는 이걸 자주 접하는 편이에요.",
+    "{category}라고 하면 바로 떠오를 만한 거예요.",
+    "호불호가 크게 갈리지는 않는 것 같아요.",
+]
+
+USER_POLICIES = ("ai", "scripted")
+
+
+class JsonlResultWriter:
+    """게임 결과 JSONL 기록 (한 줄에 게임 하나, 위치는 파일 바이트 오프셋)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        # 결과 파일과 체크포인트(<출력>.checkpoint.json)가 들어갈 디렉터리를 게임 시작 전에 생성
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def position(self) -> int:
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+    def truncate(self, position: int):
+        """체크포인트 이후에 기록된 결과 제거 (이어서 진행할 때 중복 방지)"""
+        if os.path.exists(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(position)
+
+    def write_batch(self, records: List[dict]):
+        with open(self.path, "ab") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read_records(self) -> List[dict]:
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class ParquetResultWriter:
+    """
+    게임 결과 Parquet 기록 (배치마다 part-NNNNN.parquet 파일 하나, 위치는 파일 수)
+
+    pyarrow가 필요합니다 (pip install pyarrow).
+    """
+
+    def __init__(self, directory: str):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise SystemExit("--format parquet requires pyarrow (pip install pyarrow)")
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _parts(self) -> List[str]:
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(".parquet"))
+
+    def position(self) -> int:
+        return len(self._parts())
+
+    def truncate(self, position: int):
+        for name in self._parts()[position:]:
+            os.remove(os.path.join(self.directory, name))
+
+    def write_batch(self, records: List[dict]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = os.path.join(self.directory, f"part-{self.position():05d}.parquet")
+        pq.write_table(pa.Table.from_pylist(records), path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+    def read_records(self) -> List[dict]:
+        import pyarrow.parquet as pq
+
+        records = []
+        for name in self._parts():
+            records.extend(pq.read_table(os.path.join(self.directory, name)).to_pylist())
+        return records
+
+
+class Checkpoint:
+    """
+    진행 상황 체크포인트 (<출력>.checkpoint.json)
+
+    완료한 게임 번호와 그 시점의 결과 파일 위치를 함께 저장하므로, 이어서 진행할 때 결과 파일을
+    그 위치로 되돌리면 체크포인트와 결과가 항상 일치합니다.
+    """
+
+    def __init__(self, path: str, config: dict):
+        self.path = path
+        self.config = config
+        self.completed: Set[int] = set()
+        self.position = 0
+
+    def load(self):
+        """
+        저장된 체크포인트 읽기
+
+        Raises:
+            SystemExit: 체크포인트의 실행 설정이 현재 설정과 다른 경우
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["config"] != self.config:
+            raise SystemExit(f"Checkpoint {self.path} was created with different settings: {data['config']}")
+        self.completed = set(data["completed"])
+        self.position = data["position"]
+
+    def save(self):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"config": self.config, "completed": sorted(self.completed), "position": self.position}, f)
+        os.replace(temp_path, self.path)
+
+
+async def play_game(index: int, category: str, policy: str, rounds: int, transcripts: bool) -> dict:
+    """
+    게임 한 판 진행 (사회자 멘트 없이 발언/투표/라이어 추측만)
+
+    Args:
+        index: 게임 번호 (사용자 자리 정책의 시드)
+        category: 카테고리 (키워드는 그 안에서 랜덤)
+        policy: 사용자 자리 정책 (ai, scripted)
+        rounds: 발언 라운드 수
+        transcripts: True이면 대화 기록을 결과에 포함
+
+    Returns:
+        dict: 게임 결과 한 행
+    """
+    from game_logic import (
+        add_message_to_history,
+        advance_turn,
+        ai_liar_guess_keyword,
+        ai_vote,
+        collect_ai_votes,
+        create_game,
+        generate_ai_response,
+        liar_guess_keyword,
+        session_store,
+    )
+
+    rng = random.Random(index)
+    session_id = f"sim_{index}_{uuid.uuid4().hex[:8]}"
+    started = time.perf_counter()
+    game = create_game(session_id, category=category)
+
+    try:
+        for _ in range(rounds * len(game.turn_order)):
+            player = game.turn_order[game.current_turn % len(game.turn_order)]
+            if player == "user" and policy == "scripted":
+                content = rng.choice(SCRIPTED_HINTS).format(category=category)
+            else:
+                # ai 정책: 사용자 자리도 시민 역할 프롬프트로 생성 (라이어가 아니면 시민)
+                content = await generate_ai_response(session_id, player)
+            add_message_to_history(session_id, player, content)
+            game = advance_turn(session_id)
+
+        ai_votes, _, fallback_votes = await collect_ai_votes(session_id)
+        if policy == "scripted":
+            user_vote = rng.choice(["ai_1", "ai_2", "ai_3"])
+        else:
+            user_vote = (await ai_vote(session_id, "user"))[0]
+
+        vote_counts = Counter([user_vote, *ai_votes.values()])
+        max_votes = max(vote_counts.values())
+        liar_caught = vote_counts.get(game.liar, 0) == max_votes
+
+        guess = None
+        guess_correct = False
+        if liar_caught:
+            guess = await ai_liar_guess_keyword(session_id)
+            guess_correct = liar_guess_keyword(session_id, guess)["correct"]
+
+        record = {
+            "game_index": index,
+            "category": game.category,
+            "keyword": game.keyword,
+            "liar": game.liar,
+            "turn_order": ",".join(game.turn_order),
+            "rounds": rounds,
+            "user_policy": policy,
+            "agent_mode": game.agent_mode,
+            "messages": len(game.history),
+            "vote_user": user_vote,
+            **{f"vote_{ai_name}": target for ai_name, target in ai_votes.items()},
+            "fallback_votes": len(fallback_votes),
+            "liar_votes": vote_counts.get(game.liar, 0),
+            "liar_caught": liar_caught,
+            "liar_guess": guess,
+            "guess_correct": guess_correct,
+            "winner": "civilians" if liar_caught and not guess_correct else "liar",
+            "elapsed": time.perf_counter() - started,
+        }
+        if transcripts:
+            record["transcript"] = json.dumps(
+                [[speaker, content] for speaker, content, _ in game.history.entries()], ensure_ascii=False
+            )
+        return record
+    finally:
+        session_store.delete(session_id)
+
+
+def aggregate(records: List[dict]) -> Dict[str, dict]:
+    """카테고리별 집계 (게임 수, 라이어 승률, 라이어 적발률, 적발 후 추측 성공률, 평균 라이어 득표)"""
+    groups: Dict[str, List[dict]] = defaultdict(list)
+    for record in records:
+        groups[record["category"]].append(record)
+        groups["(all)"].append(record)
+
+    stats = {}
+    for category, rows in sorted(groups.items()):
+        caught = [row for row in rows if row["liar_caught"]]
+        stats[category] = {
+            "games": len(rows),
+            "liar_win_rate": sum(row["winner"] == "liar" for row in rows) / len(rows),
+            "liar_caught_rate": len(caught) / len(rows),
+            "guess_success_rate": sum(row["guess_correct"] for row in caught) / len(caught) if caught else 0.0,
+            "avg_liar_votes": sum(row["liar_votes"] for row in rows) / len(rows),
+        }
+    return stats
+
+
+def _print_stats(stats: Dict[str, dict]):
+    print(f"{'category':<12} {'games':>6} {'liar_win':>9} {'caught':>7} {'guess_ok':>9} {'liar_votes':>10}")
+    for category, row in stats.items():
+        print(
+            f"{category:<12} {row['games']:>6} {row['liar_win_rate']:>9.1%} {row['liar_caught_rate']:>7.1%} "
+            f"{row['guess_success_rate']:>9.1%} {row['avg_liar_votes']:>10.2f}"
+        )
+
+
+async def run(args) -> int:
+    from game_logic import llm_scheduler
+    from word_bank import get_word_bank
+
+    word_bank = get_word_bank()
+    categories = args.categories or list(word_bank.categories)
+    unknown = [category for category in categories if not word_bank.has_category(category)]
+    if unknown:
+        raise SystemExit(f"Unknown categories: {', '.join(unknown)}")
+
+    # 동시 LLM 호출 수는 전역 스케줄러로 제한 (게임 진행 호출끼리 세션별로 공정하게 배정)
+    llm_scheduler.max_in_flight = args.llm_concurrency
+
+    if args.format == "parquet":
+        writer = ParquetResultWriter(args.output)
+    else:
+        writer = JsonlResultWriter(args.output)
+
+    config = {
+        "games": args.games,
+        "rounds": args.rounds,
+        "user_policy": args.user_policy,
+        "categories": categories,
+        "format": args.format,
+        "transcripts": args.transcripts,
+    }
+    checkpoint = Checkpoint(args.output.rstrip("/") + ".checkpoint.json", config)
+    if args.resume:
+        checkpoint.load()
+    elif os.path.exists(checkpoint.path):
+        raise SystemExit(f"{checkpoint.path} exists: use --resume to continue or remove it to start over")
+    writer.truncate(checkpoint.position)
+
+    pending = [index for index in range(args.games) if index not in checkpoint.completed]
+    print(f"games={args.games} done={len(checkpoint.completed)} pending={len(pending)}", flush=True)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    batch: List[dict] = []
+    failed = 0
+    started = time.perf_counter()
+
+    def flush():
+        if not batch:
+            return
+        writer.write_batch(batch)
+        checkpoint.completed.update(record["game_index"] for record in batch)
+        checkpoint.position = writer.position()
+        checkpoint.save()
+        batch.clear()
+        elapsed = time.perf_counter() - started
+        print(f"done={len(checkpoint.completed)}/{args.games} failed={failed} elapsed={elapsed:.1f}s", flush=True)
+
+    async def run_one(index: int):
+        nonlocal failed
+        async with semaphore:
+            try:
+                record = await play_game(
+                    index, categories[index % len(categories)], args.user_policy, args.rounds, args.transcripts
+                )
+            except Exception as e:
+                # 실패한 게임은 체크포인트에 넣지 않으므로 --resume 시 다시 진행
+                failed += 1
+                print(f"game {index} failed: {type(e).__name__}: {e}", file=sys.stderr)
+                return
+        batch.append(record)
+        if len(batch) >= args.batch_size:
+            flush()
+
+    await asyncio.gather(*(run_one(index) for index in pending))
+    flush()
+
+    stats = aggregate(writer.read_records())
+    _print_stats(stats)
+    with open(args.output.rstrip("/") + ".stats.json", "w", encoding="utf-8") as f:
+        json.dump(stats, f, ensure_ascii=False, indent=2)
+
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="AI 대 AI 라이어 게임 대량 시뮬레이터")
+    parser.add_argument("--games", type=int, default=1000, help="진행할 게임 수")
+    parser.add_argument("--output", required=True, help="결과 경로 (jsonl은 파일, parquet은 디렉터리)")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl", help="결과 형식")
+    parser.add_argument("--rounds", type=int, default=2, help="게임당 발언 라운드 수")
+    parser.add_argument("--user-policy", choices=USER_POLICIES, default="ai", help="사용자 자리 정책")
+    parser.add_argument("--categories", nargs="+", default=None, help="진행할 카테고리 (기본: word.json 전체, 순환 배정)")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시에 진행할 게임 수")
+    parser.add_argument("--llm-concurrency", type=int, default=32, help="동시 LLM 호출 수 상한")
+    parser.add_argument("--batch-size", type=int, default=100, help="결과 기록/체크포인트 갱신 단위 (게임 수)")
+    parser.add_argument("--transcripts", action="store_true", help="결과에 대화 기록 포함")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에서 이어서 진행")
+    parser.add_argument("--mock", action="store_true", help="목 LLM 백엔드 사용 (API 키 불필요)")
+    args = parser.parse_args()
+
+    if args.mock:
+        os.environ["LLM_BACKEND"] = "mock"
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
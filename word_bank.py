@@ -0,0 +1,119 @@
+"""
+주제어 단어장 (word.json) 관리
+
+word.json은 서버 시작 시 한 번만 읽어 불변 인덱스로 보관하고,
+파일이 바뀌었을 때만 명시적으로 다시 읽습니다.
+"""
+import json
+import random
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+# 기본 단어장 파일 경로
+WORD_FILE = Path(__file__).parent / "word.json"
+
+
+def load_word_data(word_file: Path = WORD_FILE) -> Dict[str, List[str]]:
+    """word.json 파일에서 카테고리별 단어 목록 로드"""
+    with open(word_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class WordBank:
+    """
+    카테고리별 단어 목록과 키워드 → 카테고리 인덱스를 담은 불변 단어장
+
+    모든 컬렉션은 튜플/frozenset/MappingProxyType이므로 생성 후 변경할 수 없고,
+    다시 읽을 때는 새 인스턴스로 통째로 교체합니다.
+    """
+
+    def __init__(self, word_data: Dict[str, List[str]], mtime: float = 0.0):
+        self.mtime = mtime
+        self.categories: Tuple[str, ...] = tuple(word_data.keys())
+        self.words: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {category: tuple(keywords) for category, keywords in word_data.items()}
+        )
+        self._keyword_sets: Mapping[str, FrozenSet[str]] = MappingProxyType(
+            {category: frozenset(keywords) for category, keywords in word_data.items()}
+        )
+
+        # 키워드 → 카테고리 (중복 키워드는 먼저 나온 카테고리 기준)
+        index = {}
+        for category, keywords in word_data.items():
+            for keyword in keywords:
+                index.setdefault(keyword, category)
+        self._keyword_index: Mapping[str, str] = MappingProxyType(index)
+
+    @classmethod
+    def from_file(cls, word_file: Path = WORD_FILE) -> "WordBank":
+        """파일에서 단어장 생성"""
+        mtime = word_file.stat().st_mtime
+        return cls(load_word_data(word_file), mtime=mtime)
+
+    def __len__(self) -> int:
+        return len(self._keyword_index)
+
+    def has_category(self, category: str) -> bool:
+        """카테고리 존재 여부"""
+        return category in self.words
+
+    def category_of(self, keyword: str) -> Optional[str]:
+        """키워드가 속한 카테고리 (없으면 None)"""
+        return self._keyword_index.get(keyword)
+
+    def contains(self, category: str, keyword: str) -> bool:
+        """키워드가 해당 카테고리에 속하는지 여부"""
+        keywords = self._keyword_sets.get(category)
+        return keywords is not None and keyword in keywords
+
+    def random_keyword(self, category: Optional[str] = None) -> Tuple[str, str]:
+        """
+        랜덤 카테고리와 키워드 반환
+
+        Args:
+            category: 카테고리 (None이면 랜덤 카테고리)
+
+        Returns:
+            Tuple[str, str]: (카테고리, 키워드)
+        """
+        if category is None:
+            category = random.choice(self.categories)
+        elif category not in self.words:
+            raise ValueError(f"Unknown category: {category}")
+
+        return category, random.choice(self.words[category])
+
+
+# 현재 사용 중인 단어장 (최초 사용 시 로드)
+_word_bank: Optional[WordBank] = None
+
+
+def get_word_bank() -> WordBank:
+    """단어장 인스턴스 반환 (최초 호출 시 한 번만 로드)"""
+    global _word_bank
+    if _word_bank is None:
+        _word_bank = WordBank.from_file()
+    return _word_bank
+
+
+def reload_word_bank(force: bool = False) -> bool:
+    """
+    word.json이 디스크에서 바뀌었으면 단어장을 다시 로드
+
+    새 단어장을 먼저 완성한 뒤 참조만 교체하므로, 진행 중인 요청은
+    항상 완전한 이전 단어장이나 새 단어장 중 하나만 보게 됩니다.
+
+    Args:
+        force: True이면 수정 시각과 관계없이 다시 로드
+
+    Returns:
+        bool: 다시 로드했는지 여부
+    """
+    global _word_bank
+    current = _word_bank
+    if not force and current is not None and WORD_FILE.stat().st_mtime == current.mtime:
+        return False
+
+    _word_bank = WordBank.from_file()
+    return True